@@ -13,12 +13,14 @@ from app.models.user import User, UserRevokedToken, UserLogLogin, UserRole
 from app.models.role import Role, RoleModule
 from app.models.module import Module, ModuleGroup
 from app.modules.tasks.models import Task
-from app.models.audit import AuditLog
+from app.models.audit import AuditLog, AuditSnapshot
+from app.models.cache_version import CacheVersion
 
 # Fixed Assets & Core Staff
-from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.org_units.models import OrgUnit, OrgUnitClosure
 from app.modules.core.positions.models import StaffPosition
 from app.modules.core.staff.models import Staff
+from app.modules.core.sync.models import SyncRowHash, SyncRun, SyncWatermark
 # Assets Domain
 from app.modules.assets.institutions.models import Institution
 from app.modules.assets.areas.models import Area
@@ -26,6 +28,9 @@ from app.modules.assets.groups.models import AssetGroup
 from app.modules.assets.statuses.models import AssetStatus
 from app.modules.assets.acts.models import Act, AssetActLink
 from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.imports.models import AssetImport, AssetImportRow
+from app.modules.assets.summary.models import AssetSummary
+from app.modules.assets.verification.models import VerificationCampaign, VerificationScan
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
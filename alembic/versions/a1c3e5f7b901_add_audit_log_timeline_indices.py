@@ -0,0 +1,40 @@
+"""add audit log timeline indices
+
+Revision ID: a1c3e5f7b901
+Revises: 5ab725ad6f8a
+Create Date: 2026-10-19 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b901'
+down_revision: Union[str, Sequence[str], None] = '5ab725ad6f8a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_audit_logs_entity_timeline', 'audit_logs', ['entity_type', 'entity_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_logs_user_timeline', 'audit_logs', ['user_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_logs_action_timeline', 'audit_logs', ['action', 'timestamp', 'id'], unique=False)
+    # Superseded by the composite indexes above (same leading column)
+    op.drop_index(op.f('ix_audit_logs_user_id'), table_name='audit_logs')
+    op.drop_index(op.f('ix_audit_logs_entity_type'), table_name='audit_logs')
+    op.drop_index(op.f('ix_audit_logs_action'), table_name='audit_logs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_audit_logs_action'), 'audit_logs', ['action'], unique=False)
+    op.create_index(op.f('ix_audit_logs_entity_type'), 'audit_logs', ['entity_type'], unique=False)
+    op.create_index(op.f('ix_audit_logs_user_id'), 'audit_logs', ['user_id'], unique=False)
+    op.drop_index('ix_audit_logs_action_timeline', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_user_timeline', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_entity_timeline', table_name='audit_logs')
@@ -0,0 +1,58 @@
+"""add soft delete
+
+Revision ID: a3c5e7f9b124
+Revises: f2b4d6e8a013
+Create Date: 2026-10-19 21:48:17.902315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b124'
+down_revision: Union[str, Sequence[str], None] = 'f2b4d6e8a013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SOFT_DELETE_TABLES = ('assets_act', 'assets_fixed_asset', 'core_staff')
+
+# Partial indexes over live rows: must match app.models.mixins.live_rows_index
+LIVE_INDEXES = {
+    'ix_assets_act_live_registered_at': ('assets_act', ['registered_at']),
+    'ix_assets_fixed_asset_live_org_unit_id': ('assets_fixed_asset', ['org_unit_id']),
+    'ix_assets_fixed_asset_live_area_id': ('assets_fixed_asset', ['area_id']),
+    'ix_core_staff_live_org_unit_id_full_name': ('core_staff', ['org_unit_id', 'full_name']),
+}
+LIVE_ROWS = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in SOFT_DELETE_TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+        op.add_column(table, sa.Column('deleted_by_id', sa.Uuid(), nullable=True))
+        op.create_foreign_key(
+            f'fk_{table}_deleted_by_id_users', table, 'users', ['deleted_by_id'], ['id']
+        )
+    for name, (table, columns) in LIVE_INDEXES.items():
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            postgresql_where=LIVE_ROWS,
+            sqlite_where=LIVE_ROWS,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, _) in reversed(LIVE_INDEXES.items()):
+        op.drop_index(name, table_name=table)
+    for table in reversed(SOFT_DELETE_TABLES):
+        op.drop_constraint(f'fk_{table}_deleted_by_id_users', table, type_='foreignkey')
+        op.drop_column(table, 'deleted_by_id')
+        op.drop_column(table, 'deleted_at')
@@ -0,0 +1,46 @@
+"""add sync runs
+
+Revision ID: a7c9e1d3f568
+Revises: f6b8d0c2e457
+Create Date: 2026-10-19 14:05:51.330912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c9e1d3f568'
+down_revision: Union[str, Sequence[str], None] = 'f6b8d0c2e457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('core_sync_run',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+    sa.Column('full', sa.Boolean(), nullable=False),
+    sa.Column('steps', sa.JSON(), nullable=True),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('triggered_by', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_core_sync_run_id'), 'core_sync_run', ['id'], unique=False)
+    op.create_index(op.f('ix_core_sync_run_status'), 'core_sync_run', ['status'], unique=False)
+    op.create_index(op.f('ix_core_sync_run_started_at'), 'core_sync_run', ['started_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_core_sync_run_started_at'), table_name='core_sync_run')
+    op.drop_index(op.f('ix_core_sync_run_status'), table_name='core_sync_run')
+    op.drop_index(op.f('ix_core_sync_run_id'), table_name='core_sync_run')
+    op.drop_table('core_sync_run')
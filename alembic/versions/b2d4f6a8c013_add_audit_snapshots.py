@@ -0,0 +1,42 @@
+"""add audit snapshots
+
+Revision ID: b2d4f6a8c013
+Revises: a1c3e5f7b901
+Create Date: 2026-10-19 10:02:17.904455
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d4f6a8c013'
+down_revision: Union[str, Sequence[str], None] = 'a1c3e5f7b901'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('audit_snapshots',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('entity_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('entity_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('state', sa.JSON(), nullable=True),
+    sa.Column('snapshot_at', sa.DateTime(), nullable=False),
+    sa.Column('audit_log_id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_audit_snapshots_id'), 'audit_snapshots', ['id'], unique=False)
+    op.create_index('ix_audit_snapshots_entity_timeline', 'audit_snapshots', ['entity_type', 'entity_id', 'snapshot_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_snapshots_entity_timeline', table_name='audit_snapshots')
+    op.drop_index(op.f('ix_audit_snapshots_id'), table_name='audit_snapshots')
+    op.drop_table('audit_snapshots')
@@ -0,0 +1,30 @@
+"""add row versions
+
+Revision ID: b4d6f8a0c235
+Revises: a3c5e7f9b124
+Create Date: 2026-10-19 22:20:33.671094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d6f8a0c235'
+down_revision: Union[str, Sequence[str], None] = 'a3c5e7f9b124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assets_act', sa.Column('version_id', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('assets_fixed_asset', sa.Column('version_id', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('assets_fixed_asset', 'version_id')
+    op.drop_column('assets_act', 'version_id')
@@ -0,0 +1,80 @@
+"""add asset imports
+
+Revision ID: b8d0f2e4a679
+Revises: a7c9e1d3f568
+Create Date: 2026-10-19 16:22:08.517340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d0f2e4a679'
+down_revision: Union[str, Sequence[str], None] = 'a7c9e1d3f568'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('assets_import',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('filename', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+    sa.Column('total_rows', sa.Integer(), nullable=False),
+    sa.Column('valid_rows', sa.Integer(), nullable=False),
+    sa.Column('error_rows', sa.Integer(), nullable=False),
+    sa.Column('to_insert', sa.Integer(), nullable=False),
+    sa.Column('to_update', sa.Integer(), nullable=False),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('triggered_by', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assets_import_id'), 'assets_import', ['id'], unique=False)
+    op.create_index(op.f('ix_assets_import_created_at'), 'assets_import', ['created_at'], unique=False)
+    op.create_table('assets_import_row',
+    sa.Column('import_id', sa.Uuid(), nullable=False),
+    sa.Column('row_number', sa.Integer(), nullable=False),
+    sa.Column('old_code', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('new_code', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('serial_number', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('location_detail', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('observations', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('is_saf', sa.Boolean(), nullable=True),
+    sa.Column('is_physically_verified', sa.Boolean(), nullable=True),
+    sa.Column('is_decommissioned', sa.Boolean(), nullable=True),
+    sa.Column('registered_at', sa.DateTime(), nullable=True),
+    sa.Column('source_files', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('group', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('area', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('org_unit', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('assigned_staff', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('custodian_staff', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('group_id', sa.Uuid(), nullable=True),
+    sa.Column('status_id', sa.Uuid(), nullable=True),
+    sa.Column('area_id', sa.Uuid(), nullable=True),
+    sa.Column('org_unit_id', sa.Uuid(), nullable=True),
+    sa.Column('assigned_staff_id', sa.Uuid(), nullable=True),
+    sa.Column('custodian_staff_id', sa.Uuid(), nullable=True),
+    sa.Column('asset_id', sa.Uuid(), nullable=False),
+    sa.Column('is_new', sa.Boolean(), nullable=False),
+    sa.Column('errors', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.ForeignKeyConstraint(['import_id'], ['assets_import.id'], ),
+    sa.PrimaryKeyConstraint('import_id', 'row_number')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('assets_import_row')
+    op.drop_index(op.f('ix_assets_import_created_at'), table_name='assets_import')
+    op.drop_index(op.f('ix_assets_import_id'), table_name='assets_import')
+    op.drop_table('assets_import')
@@ -0,0 +1,33 @@
+"""add cache versions
+
+Revision ID: c3e5a7b9d124
+Revises: b2d4f6a8c013
+Create Date: 2026-10-19 11:26:53.571092
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d124'
+down_revision: Union[str, Sequence[str], None] = 'b2d4f6a8c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_versions',
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
@@ -0,0 +1,64 @@
+"""add assets summary
+
+Revision ID: c9e1a3f5b780
+Revises: b8d0f2e4a679
+Create Date: 2026-10-19 17:48:31.904216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e1a3f5b780'
+down_revision: Union[str, Sequence[str], None] = 'b8d0f2e4a679'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('assets_summary',
+    sa.Column('dimension', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'key')
+    )
+
+    # Backfill the counters from the current inventory
+    op.execute(
+        """
+        INSERT INTO assets_summary (dimension, key, count)
+        SELECT 'total', 'all', COUNT(*) FROM assets_fixed_asset
+        UNION ALL
+        SELECT 'status_id', CAST(status_id AS VARCHAR), COUNT(*)
+        FROM assets_fixed_asset GROUP BY status_id
+        UNION ALL
+        SELECT 'group_id', CAST(group_id AS VARCHAR), COUNT(*)
+        FROM assets_fixed_asset GROUP BY group_id
+        UNION ALL
+        SELECT 'area_id', CAST(area_id AS VARCHAR), COUNT(*)
+        FROM assets_fixed_asset GROUP BY area_id
+        UNION ALL
+        SELECT 'org_unit_id', CAST(org_unit_id AS VARCHAR), COUNT(*)
+        FROM assets_fixed_asset GROUP BY org_unit_id
+        UNION ALL
+        SELECT 'is_physically_verified',
+               CASE WHEN is_physically_verified THEN 'true' ELSE 'false' END,
+               COUNT(*)
+        FROM assets_fixed_asset GROUP BY is_physically_verified
+        UNION ALL
+        SELECT 'is_decommissioned',
+               CASE WHEN is_decommissioned THEN 'true' ELSE 'false' END,
+               COUNT(*)
+        FROM assets_fixed_asset GROUP BY is_decommissioned
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('assets_summary')
@@ -0,0 +1,63 @@
+"""add verification campaigns
+
+Revision ID: d0f2b4a6c891
+Revises: c9e1a3f5b780
+Create Date: 2026-10-19 19:12:44.618053
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0f2b4a6c891'
+down_revision: Union[str, Sequence[str], None] = 'c9e1a3f5b780'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('assets_verification_campaign',
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('created_by_id', sa.Uuid(), nullable=True),
+    sa.Column('updated_by_id', sa.Uuid(), nullable=True),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=200), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+    sa.Column('area_id', sa.Uuid(), nullable=True),
+    sa.Column('org_unit_id', sa.Uuid(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('closed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['area_id'], ['assets_area.id'], ),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['org_unit_id'], ['core_org_unit.id'], ),
+    sa.ForeignKeyConstraint(['updated_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assets_verification_campaign_id'), 'assets_verification_campaign', ['id'], unique=False)
+    op.create_table('assets_verification_scan',
+    sa.Column('campaign_id', sa.Uuid(), nullable=False),
+    sa.Column('asset_id', sa.Uuid(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('code', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('scanned_at', sa.DateTime(), nullable=False),
+    sa.Column('scanned_by', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+    sa.Column('device_id', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+    sa.ForeignKeyConstraint(['asset_id'], ['assets_fixed_asset.id'], ),
+    sa.ForeignKeyConstraint(['campaign_id'], ['assets_verification_campaign.id'], ),
+    sa.PrimaryKeyConstraint('campaign_id', 'asset_id')
+    )
+    op.create_index('ix_assets_verification_scan_campaign_version', 'assets_verification_scan', ['campaign_id', 'version'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_assets_verification_scan_campaign_version', table_name='assets_verification_scan')
+    op.drop_table('assets_verification_scan')
+    op.drop_index(op.f('ix_assets_verification_campaign_id'), table_name='assets_verification_campaign')
+    op.drop_table('assets_verification_campaign')
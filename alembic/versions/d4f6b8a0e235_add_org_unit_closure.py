@@ -0,0 +1,54 @@
+"""add org unit closure
+
+Revision ID: d4f6b8a0e235
+Revises: c3e5a7b9d124
+Create Date: 2026-10-19 11:40:05.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f6b8a0e235'
+down_revision: Union[str, Sequence[str], None] = 'c3e5a7b9d124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('core_org_unit_closure',
+    sa.Column('ancestor_id', sa.Uuid(), nullable=False),
+    sa.Column('descendant_id', sa.Uuid(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['core_org_unit.id'], ),
+    sa.ForeignKeyConstraint(['descendant_id'], ['core_org_unit.id'], ),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index('ix_core_org_unit_closure_descendant', 'core_org_unit_closure', ['descendant_id', 'depth'], unique=False)
+
+    # Backfill from the existing parent_id hierarchy
+    op.execute(
+        """
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM core_org_unit
+            UNION ALL
+            SELECT tree.ancestor_id, child.id, tree.depth + 1
+            FROM core_org_unit AS child
+            JOIN tree ON child.parent_id = tree.descendant_id
+            WHERE tree.depth < 64
+        )
+        INSERT INTO core_org_unit_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_core_org_unit_closure_descendant', table_name='core_org_unit_closure')
+    op.drop_table('core_org_unit_closure')
@@ -0,0 +1,38 @@
+"""add asset code lookup indexes
+
+Revision ID: e1a3c5d7f902
+Revises: d0f2b4a6c891
+Create Date: 2026-10-19 20:31:05.274419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a3c5d7f902'
+down_revision: Union[str, Sequence[str], None] = 'd0f2b4a6c891'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.modules.assets.assets.models.normalized_code
+CODE_FIELDS = ('new_code', 'old_code', 'serial_number')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for field in CODE_FIELDS:
+        op.create_index(
+            f'ix_assets_fixed_asset_{field}_norm',
+            'assets_fixed_asset',
+            [sa.text(f"upper(replace(replace({field}, ' ', ''), '-', ''))")],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for field in reversed(CODE_FIELDS):
+        op.drop_index(f'ix_assets_fixed_asset_{field}_norm', table_name='assets_fixed_asset')
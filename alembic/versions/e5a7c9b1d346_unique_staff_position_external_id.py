@@ -0,0 +1,32 @@
+"""unique staff position external id
+
+Revision ID: e5a7c9b1d346
+Revises: d4f6b8a0e235
+Create Date: 2026-10-19 12:31:48.660127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9b1d346'
+down_revision: Union[str, Sequence[str], None] = 'd4f6b8a0e235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ON CONFLICT (external_id) in the SIGER sync needs a unique index
+    op.drop_index(op.f('ix_core_staff_position_external_id'), table_name='core_staff_position')
+    op.create_index(op.f('ix_core_staff_position_external_id'), 'core_staff_position', ['external_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_core_staff_position_external_id'), table_name='core_staff_position')
+    op.create_index(op.f('ix_core_staff_position_external_id'), 'core_staff_position', ['external_id'], unique=False)
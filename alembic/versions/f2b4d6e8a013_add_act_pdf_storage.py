@@ -0,0 +1,35 @@
+"""add act pdf storage
+
+Revision ID: f2b4d6e8a013
+Revises: e1a3c5d7f902
+Create Date: 2026-10-19 21:12:40.518362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b4d6e8a013'
+down_revision: Union[str, Sequence[str], None] = 'e1a3c5d7f902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assets_act', sa.Column('pdf_sha256', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+    op.add_column('assets_act', sa.Column('pdf_size', sa.Integer(), nullable=True))
+    op.add_column('assets_act', sa.Column('pdf_filename', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True))
+    op.create_index(op.f('ix_assets_act_pdf_sha256'), 'assets_act', ['pdf_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_assets_act_pdf_sha256'), table_name='assets_act')
+    op.drop_column('assets_act', 'pdf_filename')
+    op.drop_column('assets_act', 'pdf_size')
+    op.drop_column('assets_act', 'pdf_sha256')
@@ -0,0 +1,41 @@
+"""add sync state tables
+
+Revision ID: f6b8d0c2e457
+Revises: e5a7c9b1d346
+Create Date: 2026-10-19 13:22:09.517346
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b8d0c2e457'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c9b1d346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('core_sync_row_hash',
+    sa.Column('entity', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('external_id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.PrimaryKeyConstraint('entity', 'external_id')
+    )
+    op.create_table('core_sync_watermark',
+    sa.Column('entity', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('value', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('entity')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('core_sync_watermark')
+    op.drop_table('core_sync_row_hash')
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.auth import schemas, utils
 from app.auth.service import AuthService
 from app.core.db import SessionDep
+from app.core.http_cache import etag_matches, not_modified, set_etag
 from app.models.user import User as UserModel
 
 router = APIRouter()
@@ -64,12 +65,19 @@ async def read_users_roles(
     description=(
         "Retrieves the hierarchical menu structure (Module Groups -> Modules) "
         "for the current user in the context of a specific Role. "
-        "Validates that the user holds the role."
+        "Validates that the user holds the role. "
+        "Supports If-None-Match: answers 304 when the menu has not changed."
     ),
 )
 async def read_user_menu(
     role_slug: str,
+    request: Request,
+    response: Response,
     current_user: UserModel = Depends(utils.get_current_user),
     service: AuthService = Depends(get_auth_service),
 ):
+    etag = service.get_role_menu_etag(current_user, role_slug)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     return service.get_role_menu(current_user, role_slug)
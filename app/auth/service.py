@@ -17,11 +17,16 @@ from app.core.exceptions import (
     NotFoundException,
     UnauthorizedException,
 )
+from app.core.http_cache import compute_etag, get_table_versions, track_table_versions
 from app.models.module import ModuleGroup
 from app.models.role import Role
 from app.models.user import User, UserLogLogin, UserRevokedToken
 from app.util.datetime import get_current_time
 
+# Tables the role menu is built from; writes to any of them change its ETag
+MENU_TABLES = ("roles", "role_modules", "modules", "module_groups", "user_roles")
+track_table_versions(MENU_TABLES)
+
 
 class AuthService:
     def __init__(self, session: SessionDep):
@@ -327,6 +332,15 @@ class AuthService:
         # 3. Build & Sort Response
         return self._build_menu_structure(groups_map, modules_by_group)
 
+    def get_role_menu_etag(self, user: User, role_slug: str) -> str:
+        """
+        ETag of the role menu, computed from table versions without building
+        the menu. Access to the role is still validated.
+        """
+        self._validate_role_access(user, role_slug)
+        versions = get_table_versions(self.session, MENU_TABLES)
+        return compute_etag("menu", role_slug, user.id, user.is_superuser, versions)
+
     def _validate_role_access(self, user: User, role_slug: str) -> Role:
         if user.is_superuser:
             query = select(Role).where(Role.slug == role_slug)
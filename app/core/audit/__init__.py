@@ -3,10 +3,12 @@ from .context import (
     get_audit_user_agent,
     get_audit_user_id,
     get_audit_username,
+    get_system_job,
     set_audit_context,
     skip_access_audit,
+    system_job,
 )
-from .hooks import audit_changes, register_audit_hooks
+from .hooks import audit_changes, record_bulk_changes, register_audit_hooks
 from .middleware import AuditMiddleware
 
 __all__ = [
@@ -16,6 +18,9 @@ __all__ = [
     "get_audit_ip_address",
     "get_audit_user_agent",
     "skip_access_audit",
+    "system_job",
+    "get_system_job",
+    "record_bulk_changes",
     "register_audit_hooks",
     "audit_changes",
     "AuditMiddleware",
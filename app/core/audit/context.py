@@ -1,4 +1,7 @@
+import threading
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 
 from fastapi import Request
@@ -19,6 +22,35 @@ audit_user_agent_cv: ContextVar[str | None] = ContextVar(
 )
 
 
+class SystemJob:
+    """
+    Audit scope of a bulk system job (sync, seeds, archiving). While active,
+    row-level audit entries are replaced by one summary event per batch.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.batches = 0
+        # {entity_type: {action: count}} over the whole job
+        self.totals: dict[str, dict[str, int]] = {}
+
+    def add(self, entity_type: str, counts: dict[str, int]) -> int:
+        """Accumulates a batch and returns its sequence number."""
+        with self._lock:
+            self.batches += 1
+            totals = self.totals.setdefault(entity_type, {})
+            for action, count in counts.items():
+                totals[action] = totals.get(action, 0) + count
+            return self.batches
+
+
+# ContextVar holding the active system job, if any
+audit_system_job_cv: ContextVar[SystemJob | None] = ContextVar(
+    "audit_system_job", default=None
+)
+
+
 def set_audit_context(
     user_id: uuid.UUID | int | None,
     ip_address: str | None,
@@ -51,6 +83,31 @@ def get_audit_user_agent() -> str | None:
     return audit_user_agent_cv.get()
 
 
+def get_system_job() -> SystemJob | None:
+    return audit_system_job_cv.get()
+
+
+@contextmanager
+def system_job(name: str) -> Iterator[SystemJob]:
+    """
+    Runs a bulk job with summarized auditing. Nested calls reuse the outer job.
+
+    Usage:
+        with system_job("siger_sync") as job:
+            ...
+    """
+    current = audit_system_job_cv.get()
+    if current is not None:
+        yield current
+        return
+    job = SystemJob(name)
+    token = audit_system_job_cv.set(job)
+    try:
+        yield job
+    finally:
+        audit_system_job_cv.reset(token)
+
+
 async def skip_access_audit(request: Request):
     """
     Dependency to skip access audit for specific endpoints.
@@ -0,0 +1,464 @@
+"""
+Reconstrucción temporal de entidades ("estado al momento T") a partir del
+registro de auditoría: snapshot de CREATE + diffs de UPDATE + DELETE.
+
+Cada reconstrucción parte del snapshot materializado más reciente anterior
+a T (`audit_snapshots`) y solo reproduce los eventos posteriores. Cuando una
+reproducción supera `AUDIT_SNAPSHOT_INTERVAL` eventos se agenda un nuevo
+snapshot, por lo que el costo de una consulta queda acotado. Las lecturas no
+escriben: los snapshots pendientes se guardan después de la respuesta, en su
+propia sesión (`schedule_snapshots`).
+
+Los resúmenes `SYSTEM_JOB` de escrituras masivas se aplican cuando guardan los
+valores escritos y el trabajo registró cómo obtener sus entidades
+(`register_summary_members`). Los demás no se pueden reproducir: la
+reconstrucción que los atraviesa queda marcada como incompleta (`complete`).
+"""
+
+import uuid
+from collections.abc import Callable, Collection, Iterable
+from datetime import datetime
+from typing import Any
+
+import structlog
+from fastapi import BackgroundTasks
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    case,
+    func,
+    literal,
+    or_,
+    tuple_,
+    union_all,
+)
+from sqlalchemy import select as sa_select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.core.audit.hooks import SYSTEM_JOB_ACTION
+from app.core.config import settings
+from app.models.audit import AuditLog, AuditSnapshot
+
+logger = structlog.get_logger()
+
+REPLAYED_ACTIONS = ("CREATE", "UPDATE", "DELETE")
+
+type SnapshotRow = dict[str, Any]
+type Position = tuple[datetime, uuid.UUID]
+# Ids of every entity a SYSTEM_JOB summary (its ``changes``) applied its
+# ``values`` to, or None when they cannot be told apart any more
+type SummaryMembers = Callable[[Session, dict[str, Any]], Collection[str] | None]
+
+# Job name -> SummaryMembers
+summary_members: dict[str, SummaryMembers] = {}
+
+
+def register_summary_members(job_name: str, resolver: SummaryMembers) -> None:
+    summary_members[job_name] = resolver
+
+
+# Sentinel for "no snapshot / no event seen yet"
+_UNKNOWN: Any = object()
+
+
+class EntityState:
+    """Replay cursor for a single entity."""
+
+    def __init__(self, state: Any = _UNKNOWN, position: Position | None = None):
+        self.state = state
+        self.position = position
+        # Where the replay started: summaries before it are in the snapshot
+        self.base = position
+        self.replayed = 0
+        # False once an unreplayable summary fell in the replayed window
+        self.complete = True
+
+    @property
+    def exists(self) -> bool:
+        return self.state is not _UNKNOWN and self.state is not None
+
+    def apply(self, log: AuditLog) -> None:
+        if log.action == "CREATE":
+            self.state = dict(log.changes or {})
+        elif log.action == "UPDATE":
+            current = dict(self.state) if self.exists else {}
+            for key, diff in (log.changes or {}).items():
+                current[key] = _decode_value(diff.get("new"))
+            self.state = current
+        elif log.action == "DELETE":
+            self.state = None
+        elif log.action == SYSTEM_JOB_ACTION and self.exists:
+            self.state = {**self.state, **(log.changes or {}).get("values", {})}
+        self.position = (log.timestamp, log.id)
+        self.replayed += 1
+
+
+def _decode_value(value: Any) -> Any:
+    # Legacy diffs were stored as str(value); "None" is the only value that
+    # cannot be coerced back by the read schemas.
+    return None if value == "None" else value
+
+
+def materialize_snapshots(bind: Engine | Connection, rows: list[SnapshotRow]) -> int:
+    """
+    Writes replay checkpoints in a session of its own. Best effort: a
+    snapshot only saves work for later reads, so a failure is logged and
+    dropped. Returns the snapshots written.
+    """
+    try:
+        with Session(bind) as session:
+            session.add_all(AuditSnapshot(**row) for row in rows)
+            session.commit()
+    except SQLAlchemyError:
+        logger.warning("audit_snapshots_not_written", count=len(rows), exc_info=True)
+        return 0
+    return len(rows)
+
+
+class EntityHistoryService:
+    def __init__(self, session: Session):
+        self.session = session
+        # Checkpoints earned by read-only reconstructions, not yet written
+        self.pending_snapshots: list[SnapshotRow] = []
+        # False once a reconstruction missed a bulk summary it could not apply
+        self.complete = True
+
+    def get_state_as_of(
+        self, entity_type: str, entity_id: str, as_of: datetime
+    ) -> dict[str, Any] | None:
+        """State of one entity at ``as_of``; None if it did not exist."""
+        states = self.get_states_as_of(entity_type, as_of, [entity_id])
+        return states.get(entity_id)
+
+    def get_states_as_of(
+        self,
+        entity_type: str,
+        as_of: datetime,
+        entity_ids: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Batch reconstruction: one query for the snapshots and one for the
+        events after them. Entities that did not exist at ``as_of`` are
+        omitted. With ``entity_ids=None`` every entity of the type is rebuilt.
+        """
+        ids = list(entity_ids) if entity_ids is not None else None
+        if ids == []:
+            return {}
+
+        cursors = self._load_snapshots(entity_type, as_of, ids)
+        self._replay(entity_type, as_of, ids, cursors)
+
+        self.pending_snapshots += self._snapshot_rows(entity_type, cursors)
+        return {
+            entity_id: cursor.state
+            for entity_id, cursor in cursors.items()
+            if cursor.exists
+        }
+
+    def schedule_snapshots(self, background_tasks: BackgroundTasks) -> None:
+        """Writes the pending checkpoints once the response has been sent."""
+        if self.pending_snapshots:
+            background_tasks.add_task(
+                materialize_snapshots,
+                self.session.get_bind(),
+                self.pending_snapshots,
+            )
+            self.pending_snapshots = []
+
+    def get_entity_ids_as_of(
+        self,
+        entity_type: str,
+        as_of: datetime,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> list[str]:
+        """
+        Ids of the entities alive at ``as_of`` (created, not deleted nor
+        soft-deleted), in id order. Deletion is decided in SQL, before
+        paginating, from the latest event that set the entity's liveness;
+        snapshots count as events so archived history is still reachable.
+        """
+        markers = self._liveness_markers(entity_type, as_of).subquery()
+        latest = sa_select(
+            markers.c.entity_id,
+            markers.c.alive,
+            func.row_number()
+            .over(
+                partition_by=markers.c.entity_id,
+                order_by=(markers.c.position.desc(), markers.c.tiebreak.desc()),
+            )
+            .label("rank"),
+            # Bare UPDATE/DELETE events (no CREATE nor snapshot) are not enough
+            func.max(markers.c.is_base)
+            .over(partition_by=markers.c.entity_id)
+            .label("has_base"),
+        ).subquery()
+        statement = (
+            sa_select(latest.c.entity_id)
+            .where(latest.c.rank == 1, latest.c.alive == 1, latest.c.has_base == 1)
+            .order_by(latest.c.entity_id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [row for row in self.session.execute(statement).scalars() if row]
+
+    def checkpoint(
+        self, entity_type: str, as_of: datetime, entity_ids: Iterable[str]
+    ) -> int:
+        """
+        Force a snapshot at ``as_of`` for the given entities (e.g. before the
+        audit archive removes their older events). Returns snapshots written.
+        """
+        ids = list(entity_ids)
+        if not ids:
+            return 0
+        cursors = self._load_snapshots(entity_type, as_of, ids)
+        self._replay(entity_type, as_of, ids, cursors)
+        rows = self._snapshot_rows(entity_type, cursors, force=True)
+        if rows:
+            self.session.add_all(AuditSnapshot(**row) for row in rows)
+            self.session.commit()
+        return len(rows)
+
+    # --- Private Helpers ---
+
+    def _replay(
+        self,
+        entity_type: str,
+        as_of: datetime,
+        ids: list[str] | None,
+        cursors: dict[str, EntityState],
+    ) -> None:
+        """
+        Applies the events after each cursor, bulk summaries included, in
+        (timestamp, id) order per entity.
+        """
+        items = [
+            (log.entity_id or "", log)
+            for log in self._load_events(entity_type, as_of, ids, cursors)
+        ]
+        unresolved: list[Position] = []
+        wanted = set(ids) if ids is not None else None
+        for summary in self._load_summaries(entity_type, as_of, ids, cursors):
+            members = self._summary_members(summary)
+            if members is None:
+                unresolved.append((summary.timestamp, summary.id))
+                continue
+            items += [
+                (entity_id, summary)
+                for entity_id in members
+                if wanted is None or entity_id in wanted
+            ]
+        items.sort(key=lambda item: (item[0], item[1].timestamp, item[1].id))
+
+        for entity_id, log in items:
+            if log.action == SYSTEM_JOB_ACTION and entity_id not in cursors:
+                continue  # Not created yet: nothing to apply the values to
+            cursor = cursors.setdefault(entity_id, EntityState())
+            if cursor.position and (log.timestamp, log.id) <= cursor.position:
+                continue
+            cursor.apply(log)
+
+        for cursor in cursors.values():
+            if any(cursor.base is None or cursor.base < p for p in unresolved):
+                cursor.complete = False
+        # Entities created by a bulk load have no cursor at all
+        missing = ids is None or any(id not in cursors for id in ids)
+        if (unresolved and missing) or not all(c.complete for c in cursors.values()):
+            self.complete = False
+
+    def _summary_members(self, summary: AuditLog) -> Collection[str] | None:
+        changes = summary.changes or {}
+        resolver = summary_members.get(changes.get("job", ""))
+        if resolver is None or "values" not in changes:
+            return None
+        return resolver(self.session, changes)
+
+    def _after_snapshots(
+        self,
+        statement: SelectOfScalar[AuditLog],
+        ids: list[str] | None,
+        cursors: dict[str, EntityState],
+    ) -> SelectOfScalar[AuditLog]:
+        """
+        Skips what the snapshots already cover. The earliest snapshot is a
+        safe lower bound for the range scan; per-entity positions are
+        checked in memory by the replay.
+        """
+        positions = [c.position for c in cursors.values() if c.position]
+        if ids is not None and positions and len(positions) == len(ids):
+            lower = min(positions)
+            statement = statement.where(
+                tuple_(col(AuditLog.timestamp), col(AuditLog.id))
+                > tuple_(literal(lower[0]), literal(lower[1]))
+            )
+        return statement
+
+    def _liveness_markers(self, entity_type: str, as_of: datetime):
+        """
+        Events up to ``as_of`` that decide whether an entity exists, as rows
+        (entity_id, position, tiebreak, alive, is_base). Soft deletes are
+        UPDATE diffs on ``deleted_at``; a diff always changes the value, so
+        it touches the column when either side is set. Legacy diffs store
+        null as the string "None".
+        """
+
+        def is_set(value: ColumnElement[Any]) -> ColumnElement[bool]:
+            return and_(value.is_not(None), value != "None")
+
+        def flag(condition: ColumnElement[bool]) -> ColumnElement[int]:
+            return case((condition, 1), else_=0)
+
+        deleted_at = col(AuditLog.changes)["deleted_at"]
+        diff_old = deleted_at["old"].as_string()
+        diff_new = deleted_at["new"].as_string()
+        logs: Select[Any] = sa_select(
+            col(AuditLog.entity_id).label("entity_id"),
+            col(AuditLog.timestamp).label("position"),
+            col(AuditLog.id).label("tiebreak"),
+            flag(
+                or_(
+                    and_(
+                        col(AuditLog.action) == "CREATE",
+                        ~is_set(deleted_at.as_string()),
+                    ),
+                    and_(col(AuditLog.action) == "UPDATE", ~is_set(diff_new)),
+                )
+            ).label("alive"),
+            flag(col(AuditLog.action) == "CREATE").label("is_base"),
+        ).where(
+            col(AuditLog.entity_type) == entity_type,
+            col(AuditLog.timestamp) <= as_of,
+            or_(
+                col(AuditLog.action).in_(("CREATE", "DELETE")),
+                and_(
+                    col(AuditLog.action) == "UPDATE",
+                    or_(is_set(diff_old), is_set(diff_new)),
+                ),
+            ),
+        )
+        state = col(AuditSnapshot.state)
+        snapshots: Select[Any] = sa_select(
+            col(AuditSnapshot.entity_id).label("entity_id"),
+            col(AuditSnapshot.snapshot_at).label("position"),
+            col(AuditSnapshot.audit_log_id).label("tiebreak"),
+            # A null state means the entity was deleted at that point
+            flag(
+                and_(
+                    state["id"].as_string().is_not(None),
+                    ~is_set(state["deleted_at"].as_string()),
+                )
+            ).label("alive"),
+            literal(1).label("is_base"),
+        ).where(
+            col(AuditSnapshot.entity_type) == entity_type,
+            col(AuditSnapshot.snapshot_at) <= as_of,
+        )
+        return union_all(logs, snapshots)
+
+    def _load_snapshots(
+        self, entity_type: str, as_of: datetime, ids: list[str] | None
+    ) -> dict[str, EntityState]:
+        latest = select(
+            AuditSnapshot.entity_id,
+            func.max(AuditSnapshot.snapshot_at).label("snapshot_at"),
+        ).where(
+            AuditSnapshot.entity_type == entity_type,
+            col(AuditSnapshot.snapshot_at) <= as_of,
+        )
+        if ids is not None:
+            latest = latest.where(col(AuditSnapshot.entity_id).in_(ids))
+        latest_sq = latest.group_by(col(AuditSnapshot.entity_id)).subquery()
+
+        statement = select(AuditSnapshot).join(
+            latest_sq,
+            (col(AuditSnapshot.entity_id) == latest_sq.c.entity_id)
+            & (col(AuditSnapshot.snapshot_at) == latest_sq.c.snapshot_at),
+        )
+        statement = statement.where(AuditSnapshot.entity_type == entity_type)
+
+        cursors: dict[str, EntityState] = {}
+        for snapshot in self.session.exec(statement).all():
+            position = (snapshot.snapshot_at, snapshot.audit_log_id)
+            current = cursors.get(snapshot.entity_id)
+            if current and current.position and current.position >= position:
+                continue
+            cursors[snapshot.entity_id] = EntityState(snapshot.state, position)
+        return cursors
+
+    def _load_events(
+        self,
+        entity_type: str,
+        as_of: datetime,
+        ids: list[str] | None,
+        cursors: dict[str, EntityState],
+    ) -> list[AuditLog]:
+        statement = select(AuditLog).where(
+            AuditLog.entity_type == entity_type,
+            col(AuditLog.action).in_(REPLAYED_ACTIONS),
+            col(AuditLog.timestamp) <= as_of,
+        )
+        if ids is not None:
+            statement = statement.where(col(AuditLog.entity_id).in_(ids))
+        statement = self._after_snapshots(statement, ids, cursors)
+        statement = statement.order_by(
+            col(AuditLog.entity_id), col(AuditLog.timestamp), col(AuditLog.id)
+        )
+        events = []
+        for log in self.session.exec(statement).all():
+            cursor = cursors.get(log.entity_id or "")
+            covered = cursor.position if cursor else None
+            if covered and (log.timestamp, log.id) <= covered:
+                continue
+            events.append(log)
+        return events
+
+    def _load_summaries(
+        self,
+        entity_type: str,
+        as_of: datetime,
+        ids: list[str] | None,
+        cursors: dict[str, EntityState],
+    ) -> list[AuditLog]:
+        statement = select(AuditLog).where(
+            AuditLog.entity_type == entity_type,
+            AuditLog.action == SYSTEM_JOB_ACTION,
+            col(AuditLog.timestamp) <= as_of,
+        )
+        statement = self._after_snapshots(statement, ids, cursors)
+        statement = statement.order_by(col(AuditLog.timestamp), col(AuditLog.id))
+        return list(self.session.exec(statement).all())
+
+    def _snapshot_rows(
+        self,
+        entity_type: str,
+        cursors: dict[str, EntityState],
+        force: bool = False,
+    ) -> list[SnapshotRow]:
+        """Checkpoints for the cursors that replayed enough events."""
+        interval = 1 if force else settings.AUDIT_SNAPSHOT_INTERVAL
+        if interval <= 0:
+            return []
+
+        rows = []
+        for entity_id, cursor in cursors.items():
+            if cursor.replayed < interval or not cursor.position:
+                continue
+            # A checkpoint would hide the missed summary from later reads
+            if not cursor.complete and not force:
+                continue
+            snapshot_at, audit_log_id = cursor.position
+            rows.append(
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "state": cursor.state if cursor.exists else None,
+                    "snapshot_at": snapshot_at,
+                    "audit_log_id": audit_log_id,
+                }
+            )
+        return rows
@@ -1,30 +1,45 @@
+import hashlib
+from collections.abc import Iterable
 from typing import Any
 
+from pydantic_core import PydanticSerializationError, to_jsonable_python
 from sqlalchemy import event, inspect
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_mapper
 
 # Import models you want to track to ensure they are loaded
 # Or track generic SQLModel
 from sqlmodel import SQLModel
 
 from app.core.config import settings
-from app.models.audit import AuditLog
+from app.models.audit import AuditLog, AuditSnapshot
 
 from .context import (
     get_audit_ip_address,
     get_audit_user_agent,
     get_audit_user_id,
     get_audit_username,
+    get_system_job,
 )
 
+# Audit bookkeeping tables are never audited themselves
+UNAUDITED_MODELS = (AuditLog, AuditSnapshot)
+
+# Summary event written per batch inside a system job (see history.py for replay)
+SYSTEM_JOB_ACTION = "SYSTEM_JOB"
+
 
 def register_audit_hooks(engine: Engine):
     if not settings.ENABLE_DATA_AUDIT:
         return
 
-    event.listen(Session, "after_flush", audit_changes)
-    event.listen(Session, "before_flush", set_audit_user_fields)
+    # Idempotent: the app lifespan and the test setup may both register
+    for name, fn in (
+        ("after_flush", audit_changes),
+        ("before_flush", set_audit_user_fields),
+    ):
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
 
 
 def set_audit_user_fields(session: Session, flush_context, instances):
@@ -52,6 +67,10 @@ def audit_changes(session: Session, flush_context: Any) -> None:
     # This hook runs after flush but before commit
     # We collect changes and insert audit logs into the SAME transaction
 
+    if get_system_job() is not None:
+        _summarize_flush(session)
+        return
+
     user_id = get_audit_user_id()
     ip_address = get_audit_ip_address()
     username = get_audit_username()
@@ -59,21 +78,104 @@ def audit_changes(session: Session, flush_context: Any) -> None:
 
     # Iterate over new, changed, and deleted objects
     for obj in session.new:
-        if isinstance(obj, AuditLog):
+        if isinstance(obj, UNAUDITED_MODELS):
             continue
         create_log(session, obj, "CREATE", user_id, ip_address, username, user_agent)
 
     for obj in session.dirty:
-        if isinstance(obj, AuditLog):
+        if isinstance(obj, UNAUDITED_MODELS):
             continue
         create_log(session, obj, "UPDATE", user_id, ip_address, username, user_agent)
 
     for obj in session.deleted:
-        if isinstance(obj, AuditLog):
+        if isinstance(obj, UNAUDITED_MODELS):
             continue
         create_log(session, obj, "DELETE", user_id, ip_address, username, user_agent)
 
 
+def _summarize_flush(session: Session) -> None:
+    batches: dict[str, dict[str, list[Any]]] = {}
+    for action, objects in (
+        ("CREATE", session.new),
+        ("UPDATE", session.dirty),
+        ("DELETE", session.deleted),
+    ):
+        for obj in objects:
+            if isinstance(obj, UNAUDITED_MODELS) or not isinstance(obj, SQLModel):
+                continue
+            pk = object_mapper(obj).primary_key[0]
+            entity = batches.setdefault(obj.__class__.__name__, {})
+            entity.setdefault(action, []).append(getattr(obj, pk.name))
+
+    for entity_type, ids_by_action in batches.items():
+        counts = {action: len(ids) for action, ids in ids_by_action.items()}
+        ids = [id for action_ids in ids_by_action.values() for id in action_ids]
+        record_bulk_changes(session, entity_type, counts, ids)
+
+
+def id_digest(ids: Iterable[Any]) -> dict[str, Any]:
+    """Compact fingerprint of a set of ids: count, range and a SHA-256."""
+    keys = sorted(str(id) for id in ids)
+    if not keys:
+        return {"count": 0}
+    return {
+        "count": len(keys),
+        "first": keys[0],
+        "last": keys[-1],
+        "sha256": hashlib.sha256("\n".join(keys).encode()).hexdigest(),
+    }
+
+
+def record_bulk_changes(
+    session: Session,
+    entity_type: str,
+    counts: dict[str, int],
+    ids: Iterable[Any],
+    values: dict[str, Any] | None = None,
+    **context: Any,
+) -> None:
+    """
+    Writes one summary audit event for a batch of changes made by the active
+    system job. Also used directly by jobs writing through Core statements,
+    which the flush hook does not see.
+
+    ``values`` are the column values the batch set on every entity, and
+    ``context`` (e.g. ``act_id``) whatever tells its entities apart later;
+    with both, history replay can apply the batch (``register_summary_members``).
+    """
+    job = get_system_job()
+    if job is None or not settings.ENABLE_DATA_AUDIT:
+        return
+    batch = job.add(entity_type, counts)
+    session.add(
+        AuditLog(
+            user_id=get_audit_user_id(),
+            username=get_audit_username(),
+            ip_address=get_audit_ip_address(),
+            user_agent=get_audit_user_agent(),
+            action=SYSTEM_JOB_ACTION,
+            entity_type=entity_type,
+            entity_id=None,
+            changes={
+                "job": job.name,
+                "batch": batch,
+                "counts": counts,
+                "ids": id_digest(ids),
+                **({"values": _to_json_value(values)} if values is not None else {}),
+                **_to_json_value(context),
+            },
+        )
+    )
+
+
+def _to_json_value(value: Any) -> Any:
+    # Keep diff values typed (null, bool, numbers) so history can be replayed
+    try:
+        return to_jsonable_python(value)
+    except PydanticSerializationError:
+        return str(value)
+
+
 def create_log(
     session: Session,
     obj: Any,
@@ -104,7 +206,10 @@ def create_log(
                 old_val = history.deleted[0] if history.deleted else None
                 new_val = history.added[0] if history.added else None
                 if old_val != new_val:
-                    changes[attr.key] = {"old": str(old_val), "new": str(new_val)}
+                    changes[attr.key] = {
+                        "old": _to_json_value(old_val),
+                        "new": _to_json_value(new_val),
+                    }
 
     elif action == "CREATE":
         # Log initial values for CREATE
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import literal, tuple_
+from sqlmodel import Session, col, select
+
+from app.core.repository import BaseRepository
+from app.models.audit import AuditLog
+
+
+class AuditLogRepository(BaseRepository[AuditLog]):
+    def __init__(self, session: Session):
+        super().__init__(session, AuditLog)
+
+    def get_page(
+        self,
+        filters: Optional[list[Any]] = None,
+        after: Optional[tuple[datetime, uuid.UUID]] = None,
+        limit: int = 50,
+    ) -> Sequence[AuditLog]:
+        """
+        Keyset page ordered newest first by (timestamp, id).
+        ``after`` is the (timestamp, id) of the last row of the previous page.
+        """
+        statement = select(AuditLog)
+        if filters:
+            statement = statement.where(*filters)
+        if after:
+            statement = statement.where(
+                tuple_(col(AuditLog.timestamp), col(AuditLog.id))
+                < tuple_(literal(after[0]), literal(after[1]))
+            )
+        statement = statement.order_by(
+            col(AuditLog.timestamp).desc(), col(AuditLog.id).desc()
+        ).limit(limit)
+        return self.session.exec(statement).all()
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+
+from app.auth.permissions import PermissionAction, PermissionChecker
+from app.auth.schemas import UserModulePermission
+from app.core.audit.history import EntityHistoryService
+from app.core.audit.schemas import AuditLogPage, EntityStateRead
+from app.core.audit.service import AuditLogService
+from app.core.db import SessionDep
+from app.modules.core.constants import CoreModuleSlug
+
+router = APIRouter(prefix="/audit", tags=["Global - Audit"])
+
+
+@router.get("/logs", response_model=AuditLogPage)
+def get_audit_logs(
+    session: SessionDep,
+    entity_type: str | None = Query(None),
+    entity_id: str | None = Query(None),
+    user_id: uuid.UUID | None = Query(None),
+    action: str | None = Query(None),
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.AUDIT, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """
+    Consulta el registro de auditoría, del más reciente al más antiguo.
+    La paginación es por cursor (keyset): envíe `next_cursor` de la respuesta
+    anterior en `cursor` para obtener la página siguiente.
+    """
+    service = AuditLogService(session)
+    return service.search(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        user_id=user_id,
+        action=action,
+        date_from=date_from,
+        date_to=date_to,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+@router.get("/entities/{entity_type}/{entity_id}/history", response_model=AuditLogPage)
+def get_entity_history(
+    session: SessionDep,
+    entity_type: str,
+    entity_id: str,
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.AUDIT, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """
+    Historial de cambios de una entidad (ej. `FixedAsset`), del más reciente
+    al más antiguo.
+    """
+    service = AuditLogService(session)
+    return service.get_entity_history(entity_type, entity_id, cursor, limit)
+
+
+@router.get("/entities/{entity_type}/{entity_id}/as-of", response_model=EntityStateRead)
+def get_entity_state_as_of(
+    session: SessionDep,
+    background_tasks: BackgroundTasks,
+    entity_type: str,
+    entity_id: str,
+    as_of: datetime = Query(..., description="Momento a reconstruir"),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.AUDIT, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """
+    Reconstruye el estado de una entidad en un momento dado a partir de su
+    historial de auditoría. `exists` es falso si aún no existía o ya estaba
+    eliminada; `complete` es falso si en el intervalo hubo un cambio masivo
+    (`SYSTEM_JOB`) que no se pudo reproducir.
+    """
+    history = EntityHistoryService(session)
+    state = history.get_state_as_of(entity_type, entity_id, as_of)
+    history.schedule_snapshots(background_tasks)
+    return EntityStateRead(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        as_of=as_of,
+        exists=state is not None,
+        state=state,
+        complete=history.complete,
+    )
@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AuditLogRead(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID | None = None
+    username: str | None = None
+    action: str
+    entity_type: str
+    entity_id: str | None = None
+    changes: Any | None = None
+    ip_address: str | None = None
+    user_agent: str | None = None
+    timestamp: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AuditLogPage(BaseModel):
+    items: list[AuditLogRead]
+    next_cursor: str | None = None
+
+
+class EntityStateRead(BaseModel):
+    entity_type: str
+    entity_id: str
+    as_of: datetime
+    exists: bool
+    state: dict[str, Any] | None = None
+    # False when a bulk change in the window could not be replayed
+    complete: bool = True
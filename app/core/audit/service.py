@@ -0,0 +1,94 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ColumnElement
+from sqlmodel import Session, col
+
+from app.core.audit.repository import AuditLogRepository
+from app.core.audit.schemas import AuditLogPage, AuditLogRead
+from app.core.exceptions import BadRequestException
+from app.models.audit import AuditLog
+
+
+class AuditLogService:
+    def __init__(self, session: Session):
+        self.repository = AuditLogRepository(session)
+
+    def search(
+        self,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+        user_id: uuid.UUID | None = None,
+        action: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> AuditLogPage:
+        filters = self._build_filters(
+            entity_type, entity_id, user_id, action, date_from, date_to
+        )
+        after = self._decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra row to know whether another page exists
+        rows = list(self.repository.get_page(filters, after, limit + 1))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1])
+
+        return AuditLogPage(
+            items=[AuditLogRead.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    def get_entity_history(
+        self,
+        entity_type: str,
+        entity_id: str,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> AuditLogPage:
+        return self.search(
+            entity_type=entity_type, entity_id=entity_id, cursor=cursor, limit=limit
+        )
+
+    # --- Private Helpers ---
+
+    def _build_filters(
+        self,
+        entity_type: str | None,
+        entity_id: str | None,
+        user_id: uuid.UUID | None,
+        action: str | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
+        if entity_type:
+            filters.append(col(AuditLog.entity_type) == entity_type)
+        if entity_id:
+            filters.append(col(AuditLog.entity_id) == entity_id)
+        if user_id:
+            filters.append(col(AuditLog.user_id) == user_id)
+        if action:
+            filters.append(col(AuditLog.action) == action.upper())
+        if date_from:
+            filters.append(col(AuditLog.timestamp) >= date_from)
+        if date_to:
+            filters.append(col(AuditLog.timestamp) < date_to)
+        return filters
+
+    def _encode_cursor(self, log: AuditLog) -> str:
+        raw = f"{log.timestamp.isoformat()}|{log.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> tuple[datetime, uuid.UUID]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            timestamp, log_id = raw.split("|", 1)
+            return datetime.fromisoformat(timestamp), uuid.UUID(log_id)
+        except binascii.Error, UnicodeDecodeError, ValueError:
+            raise BadRequestException(detail="Invalid pagination cursor") from None
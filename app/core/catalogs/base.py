@@ -1,4 +1,5 @@
-from typing import Protocol
+# Base catalogs module
+from typing import ClassVar, Protocol
 
 from sqlmodel import Session
 
@@ -6,6 +7,11 @@ from app.core.catalogs.schemas import CatalogItemSchema
 
 
 class CatalogProvider(Protocol):
+    # Tables whose writes invalidate this provider's cached responses
+    depends_on: ClassVar[tuple[str, ...]] = ()
+    # Seconds a response stays cached; 0 disables caching for the provider
+    cache_ttl: ClassVar[int] = 0
+
     def get_items(self, session: Session, **kwargs) -> list[CatalogItemSchema]:
         """Hace la consulta a la BD y formatea el resultado en CatalogItemSchema."""
         ...
@@ -0,0 +1,111 @@
+"""
+Caché en memoria de respuestas de catálogos con invalidación por dependencias.
+
+Cada proveedor declara las tablas de las que depende (`depends_on`) y un TTL
+(`cache_ttl`). Los resultados se guardan por (catálogo, parámetros
+normalizados) en un LRU acotado, y se invalidan cuando una transacción que
+escribe en alguna de esas tablas hace commit (ver `app/core/table_changes.py`).
+Esa invalidación es local al proceso: cada entrada guarda además las versiones
+de sus tablas (`cache_versions`, las mismas del ETag) y no se sirve si la
+versión actual es otra, de modo que un worker que no vio el commit tampoco
+entrega un cuerpo viejo bajo el ETag nuevo.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.catalogs.schemas import CatalogItemSchema
+from app.core.config import settings
+from app.core.table_changes import on_tables_committed
+
+CacheKey = tuple[str, str]
+TableVersions = dict[str, int]
+
+
+class CatalogCache:
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            CacheKey,
+            tuple[float, frozenset[str], TableVersions | None, list[CatalogItemSchema]],
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a result computed across an
+        # invalidation may be stale and is not stored
+        self._epoch = 0
+
+    @staticmethod
+    def make_key(catalog: str, params: dict[str, Any]) -> CacheKey:
+        return catalog, json.dumps(params, sort_keys=True, default=str)
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(
+        self, key: CacheKey, versions: TableVersions | None = None
+    ) -> list[CatalogItemSchema] | None:
+        """
+        Cached items for ``key``; a miss when expired or when stored under
+        table versions other than ``versions``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, stored_versions, items = entry
+            if expires_at <= time.monotonic() or stored_versions != versions:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(items)
+
+    def set(
+        self,
+        key: CacheKey,
+        items: list[CatalogItemSchema],
+        ttl: float,
+        tables: Iterable[str],
+        epoch: int | None = None,
+        versions: TableVersions | None = None,
+    ) -> None:
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            expires_at = time.monotonic() + ttl
+            self._entries[key] = (expires_at, frozenset(tables), versions, list(items))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> None:
+        changed = set(tables)
+        if not changed:
+            return
+        with self._lock:
+            self._epoch += 1
+            stale = [
+                key
+                for key, (_, depends_on, _, _) in self._entries.items()
+                if depends_on & changed
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+catalog_cache = CatalogCache(max_entries=settings.CATALOG_CACHE_MAX_ENTRIES)
+
+# Writes committed to a dependent table drop the cached responses
+on_tables_committed(catalog_cache.invalidate_tables)
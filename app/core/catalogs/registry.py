@@ -1,18 +1,205 @@
+import contextvars
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session
+
 from app.core.catalogs.base import CatalogProvider
-from app.core.exceptions import NotFoundException
+from app.core.catalogs.cache import CatalogCache, TableVersions, catalog_cache
+from app.core.catalogs.schemas import CatalogItemSchema
+from app.core.config import settings
+from app.core.exceptions import GatewayTimeoutException, NotFoundException
+from app.core.http_cache import compute_etag, get_table_versions, track_table_versions
 
 
 class CatalogRegistry:
-    def __init__(self) -> None:
+    def __init__(self, cache: CatalogCache | None = None) -> None:
         self._providers: dict[str, CatalogProvider] = {}
+        self.cache = cache if cache is not None else catalog_cache
 
     def register(self, key: str, provider: CatalogProvider) -> None:
         self._providers[key] = provider
+        track_table_versions(getattr(provider, "depends_on", ()))
 
     def get_provider(self, key: str) -> CatalogProvider:
         if key not in self._providers:
             raise NotFoundException(detail=f"Catalog '{key}' not found")
         return self._providers[key]
 
+    def get_versions(self, key: str, session: Session) -> TableVersions:
+        """Current write versions of the tables the provider depends on."""
+        provider = self.get_provider(key)
+        return get_table_versions(session, getattr(provider, "depends_on", ()))
+
+    def get_items(
+        self,
+        key: str,
+        session: Session,
+        params: dict[str, Any],
+        versions: TableVersions | None = None,
+    ) -> list[CatalogItemSchema]:
+        """
+        Resolve a catalog through its provider, serving cached responses for
+        providers that declare a ``cache_ttl``. Cached responses are only
+        served for the current table ``versions`` (read when not given).
+        """
+        provider = self.get_provider(key)
+        ttl = getattr(provider, "cache_ttl", 0)
+        if ttl <= 0:
+            return provider.get_items(session, **params)
+
+        if versions is None:
+            versions = self.get_versions(key, session)
+        items = self.get_cached(key, params, versions)
+        if items is None:
+            epoch = self.cache.epoch
+            items = provider.get_items(session, **params)
+            depends_on = getattr(provider, "depends_on", ())
+            cache_key = CatalogCache.make_key(key, params)
+            self.cache.set(cache_key, items, ttl, depends_on, epoch, versions)
+        return items
+
+    def get_cached(
+        self, key: str, params: dict[str, Any], versions: TableVersions
+    ) -> list[CatalogItemSchema] | None:
+        provider = self.get_provider(key)
+        if getattr(provider, "cache_ttl", 0) <= 0:
+            return None
+        return self.cache.get(CatalogCache.make_key(key, params), versions)
+
+    def get_bulk_items(
+        self,
+        session: Session,
+        requests: dict[str, dict[str, Any]],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, list[CatalogItemSchema]]:
+        """
+        Resolve several catalogs at once. Cache hits are served first; the
+        remaining providers run concurrently (at most ``max_workers`` per
+        request), each on its own session and pooled connection, so the call
+        costs roughly the slowest provider instead of the sum. A provider
+        exceeding ``timeout`` seconds aborts the request.
+        """
+        # Unknown catalogs fail fast, before any query runs
+        depends_on = {
+            key: tuple(getattr(self.get_provider(key), "depends_on", ()))
+            for key in requests
+        }
+        # Table versions of every requested catalog in a single query
+        current = get_table_versions(
+            session, {table for tables in depends_on.values() for table in tables}
+        )
+        versions = {
+            key: {table: current[table] for table in tables}
+            for key, tables in depends_on.items()
+        }
+
+        max_workers = max_workers or settings.CATALOG_BULK_MAX_WORKERS
+        timeout = timeout or settings.CATALOG_PROVIDER_TIMEOUT
+
+        result: dict[str, list[CatalogItemSchema]] = {}
+        pending: dict[str, dict[str, Any]] = {}
+        for key, params in requests.items():
+            cached = self.get_cached(key, params, versions[key])
+            if cached is not None:
+                result[key] = cached
+            else:
+                pending[key] = params
+
+        bind = session.get_bind()
+        # SQLite (tests / local) shares a single connection: stay sequential
+        if len(pending) <= 1 or max_workers <= 1 or bind.dialect.name == "sqlite":
+            for key, params in pending.items():
+                result[key] = self.get_items(key, session, params, versions[key])
+        else:
+            result.update(
+                self._load_concurrently(bind, pending, max_workers, timeout, versions)
+            )
+
+        return {key: result[key] for key in requests}
+
+    def _load_concurrently(
+        self,
+        bind: Engine | Connection,
+        pending: dict[str, dict[str, Any]],
+        max_workers: int,
+        timeout: float,
+        versions: dict[str, TableVersions] | None = None,
+    ) -> dict[str, list[CatalogItemSchema]]:
+        deadline = time.monotonic() + timeout
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            thread_name_prefix="catalog-bulk",
+        )
+        futures: dict[str, Future[list[CatalogItemSchema]]] = {
+            # copy_context keeps request-scoped ContextVars (logging, audit)
+            key: executor.submit(
+                contextvars.copy_context().run,
+                self._load_isolated,
+                bind,
+                key,
+                params,
+                versions.get(key) if versions else None,
+                timeout,
+            )
+            for key, params in pending.items()
+        }
+        try:
+            results = {}
+            for key, future in futures.items():
+                remaining = max(deadline - time.monotonic(), 0)
+                try:
+                    results[key] = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    raise GatewayTimeoutException(
+                        detail=f"Catalog '{key}' timed out"
+                    ) from None
+            return results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load_isolated(
+        self,
+        bind: Engine | Connection,
+        key: str,
+        params: dict[str, Any],
+        versions: TableVersions | None,
+        timeout: float,
+    ) -> list[CatalogItemSchema]:
+        with Session(bind) as worker_session:
+            if bind.dialect.name == "postgresql":
+                # Let the server abort the query too, freeing the connection
+                timeout_ms = int(timeout * 1000)
+                worker_session.exec(
+                    text(f"SET LOCAL statement_timeout = {timeout_ms}")  # type: ignore[call-overload]
+                )
+            return self.get_items(key, worker_session, params, versions)
+
+    def get_etag(
+        self,
+        key: str,
+        session: Session,
+        params: dict[str, Any],
+        versions: TableVersions | None = None,
+    ) -> str | None:
+        """
+        Strong ETag for a catalog response, derived from the write versions
+        of the provider's tables. None when the provider declares no tables.
+        """
+        provider = self.get_provider(key)
+        depends_on = getattr(provider, "depends_on", ())
+        if not depends_on:
+            return None
+        if versions is None:
+            versions = get_table_versions(session, depends_on)
+        return compute_etag(
+            "catalog", key, CatalogCache.make_key(key, params), versions
+        )
+
 
 global_registry = CatalogRegistry()
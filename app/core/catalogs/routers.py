@@ -1,11 +1,12 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.auth.utils import get_current_user
 from app.core.catalogs.registry import global_registry
 from app.core.catalogs.schemas import CatalogItemSchema
 from app.core.db import SessionDep
+from app.core.http_cache import etag_matches, not_modified, set_etag
 
 router = APIRouter(prefix="/catalogs", tags=["Global - Catalogs"])
 
@@ -21,12 +22,9 @@ def get_bulk_catalogs(
     El cuerpo de la petición debe ser un mapa JSON donde las llaves son los nombres
     de los catálogos y los valores son objetos conteniendo los parámetros específicos
     para cada proveedor (por ejemplo: {"departamentos": {"gerencia_id": "..."}}).
+    Los proveedores sin caché vigente se ejecutan en paralelo.
     """
-    result = {}
-    for catalog_name, params in request_data.items():
-        provider = global_registry.get_provider(catalog_name)
-        result[catalog_name] = provider.get_items(session, **params)
-    return result
+    return global_registry.get_bulk_items(session, request_data)
 
 
 @router.get("/{catalog_name}", response_model=list[CatalogItemSchema])
@@ -34,10 +32,19 @@ def get_single_catalog(
     session: SessionDep,
     catalog_name: str,
     request: Request,
+    response: Response,
     _=Depends(get_current_user),
 ):
     """
     Recupera un catálogo individual de forma dinámica y genérica.
+    Soporta `If-None-Match`: si el catálogo no cambió responde `304`.
     """
-    provider = global_registry.get_provider(catalog_name)
-    return provider.get_items(session, **dict(request.query_params))
+    params = dict(request.query_params)
+    # Read once: the ETag and the (possibly cached) body use the same versions
+    versions = global_registry.get_versions(catalog_name, session)
+    etag = global_registry.get_etag(catalog_name, session, params, versions)
+    if etag:
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+    return global_registry.get_items(catalog_name, session, params, versions)
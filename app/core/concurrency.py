@@ -0,0 +1,38 @@
+"""
+Control de concurrencia optimista para endpoints de edición.
+
+Los modelos con `VersionMixin` exponen su `version_id` como `ETag` (`"3"`).
+Un cliente que reenvía ese valor en `If-Match` al hacer `PATCH` solo
+sobrescribe la versión que leyó: si otro usuario guardó antes, la respuesta es
+409 y nada se escribe. Sin `If-Match` el `PATCH` se aplica como siempre, pero
+`version_id_col` sigue protegiendo la ventana entre la lectura y la escritura.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, Header, Response
+
+from app.core.exceptions import BadRequestException
+
+
+def version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def set_version_etag(response: Response, version: int) -> None:
+    response.headers["ETag"] = version_etag(version)
+
+
+def if_match_version(
+    if_match: Annotated[str | None, Header(description="ETag leído (versión)")] = None,
+) -> int | None:
+    """Version requested by ``If-Match``; None when absent or ``*``."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip().removeprefix("W/").strip('"')
+    if not value.isdigit():
+        raise BadRequestException(detail="If-Match must be an ETag from this API")
+    return int(value)
+
+
+IfMatchDep = Annotated[int | None, Depends(if_match_version)]
@@ -26,6 +26,10 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     SYNC_DATABASE_URL: str | None = None
+    # SIGER sync: rows per INSERT … ON CONFLICT statement
+    SYNC_CHUNK_SIZE: int = 1000
+    # Independent sync steps (cargos, unidades) run in parallel
+    SYNC_MAX_WORKERS: int = 2
 
     # Auth
     SECRET_KEY: str
@@ -46,6 +50,26 @@ class Settings(BaseSettings):
     # Audit
     ENABLE_ACCESS_AUDIT: bool = True
     ENABLE_DATA_AUDIT: bool = True
+    # Replayed events after which history reconstruction stores a snapshot
+    AUDIT_SNAPSHOT_INTERVAL: int = 50
+
+    # Catalog Cache (bounded LRU shared by all cached catalog providers)
+    CATALOG_CACHE_MAX_ENTRIES: int = 512
+    # POST /catalogs/bulk: providers run in parallel per request, each bounded
+    CATALOG_BULK_MAX_WORKERS: int = 4
+    CATALOG_PROVIDER_TIMEOUT: float = 10.0
+
+    # Streaming exports: rows fetched from the server-side cursor per batch
+    EXPORT_BATCH_SIZE: int = 1000
+    # Asset imports: rows per COPY batch and per merge transaction
+    ASSET_IMPORT_CHUNK_SIZE: int = 5000
+    # Verification campaigns: max scans per uploaded batch
+    VERIFICATION_MAX_BATCH: int = 1000
+
+    # File storage (act PDFs): backend name and local filesystem root
+    STORAGE_BACKEND: str = "local"
+    STORAGE_LOCAL_ROOT: str = "storage"
+    ACT_PDF_MAX_SIZE: int = 20 * 1024 * 1024
 
     # Log Controls
     ENABLE_ACCESS_LOGS: bool = True  # Master switch for access logging
@@ -3,7 +3,8 @@ import uuid
 from typing import Annotated, Any
 
 from fastapi import Depends
-from sqlalchemy.engine import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection, Engine
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.core.config import settings
@@ -45,3 +46,14 @@ def get_session():
 
 
 SessionDep = Annotated[Session, Depends(get_session)]
+
+
+def dialect_insert(bind: Session | Connection, model: type[SQLModel]) -> Any:
+    """
+    INSERT construct for the session's (or connection's) dialect, exposing
+    ``on_conflict_do_update`` / ``on_conflict_do_nothing`` (PostgreSQL, SQLite).
+    """
+    dialect = bind.dialect if isinstance(bind, Connection) else bind.get_bind().dialect
+    if dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
@@ -31,7 +31,19 @@ class ForbiddenException(CustomException):
     pass
 
 
+class ConflictException(CustomException):
+    """Raised when a write conflicts with the current state of a resource."""
+
+    pass
+
+
 class InternalServerErrorException(CustomException):
     """Raised when an unexpected error occurs."""
 
     pass
+
+
+class GatewayTimeoutException(CustomException):
+    """Raised when a dependent operation does not finish in time."""
+
+    pass
@@ -0,0 +1,225 @@
+"""
+Exportación en streaming (CSV / NDJSON / XLSX) de listados completos.
+
+El repositorio lee con un cursor del lado del servidor (`yield_per`) y entrega
+lotes de tamaño fijo; cada lote se serializa con el esquema de lectura y se
+escribe en la respuesta antes de pedir el siguiente. `StreamingResponse`
+consume el generador a medida que el cliente recibe los bytes, de modo que la
+memoria del servidor es de un lote sin importar el tamaño del inventario.
+"""
+
+import csv
+import io
+import json
+import re
+import zipfile
+from collections.abc import Buffer, Iterable, Iterator, Sequence
+from enum import Enum
+from typing import Any
+from xml.sax.saxutils import escape
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.serialization import type_adapter
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    XLSX = "xlsx"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.XLSX: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+}
+
+type Batch = Sequence[dict[str, Any]]
+
+
+def schema_columns(schema: type[BaseModel]) -> list[str]:
+    """Output keys of ``schema``: visible fields followed by computed fields."""
+    fields = [name for name, info in schema.model_fields.items() if not info.exclude]
+    return fields + list(schema.model_computed_fields)
+
+
+def serialize_batches(
+    batches: Iterable[Sequence[Any]], schema: type[BaseModel]
+) -> Iterator[Batch]:
+    """Turns batches of ORM objects into JSON-ready dicts shaped by ``schema``."""
+    adapter = type_adapter(list[schema])  # type: ignore[valid-type]
+    for batch in batches:
+        models = adapter.validate_python(batch, from_attributes=True)
+        yield adapter.dump_python(models, mode="json")
+
+
+def export_response(
+    batches: Iterable[Batch],
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    writers = {
+        ExportFormat.CSV: _csv_chunks,
+        ExportFormat.NDJSON: _ndjson_chunks,
+        ExportFormat.XLSX: _xlsx_chunks,
+    }
+    return StreamingResponse(
+        writers[export_format](batches, columns),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+    )
+
+
+# Spreadsheet apps evaluate cells starting with these as formulas (CSV injection)
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False)
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_chunks(batches: Iterable[Batch], columns: Sequence[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM: Excel opens UTF-8 CSV (accents, ñ) correctly
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows([_csv_value(row.get(c)) for c in columns] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _ndjson_chunks(batches: Iterable[Batch], columns: Sequence[str]) -> Iterator[bytes]:
+    for batch in batches:
+        lines = (
+            json.dumps({c: row.get(c) for c in columns}, ensure_ascii=False)
+            for row in batch
+        )
+        yield ("\n".join(lines) + "\n").encode()
+
+
+# --- XLSX ---
+# Minimal SpreadsheetML package written as a streamed zip: the sheet XML is
+# compressed batch by batch and the zip uses data descriptors, so nothing is
+# held in memory or spooled to disk.
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Type="http://schemas.openxml'
+        'formats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+        'main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/'
+        'relationships"><sheets><sheet name="Export" sheetId="1" r:id="rId1"/>'
+        "</sheets></workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Type="http://schemas.openxml'
+        'formats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/></Relationships>'
+    ),
+}
+
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_XLSX_SHEET_TAIL = "</sheetData></worksheet>"
+
+# Control characters are not allowed in XML 1.0 text
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable target for ``ZipFile``; drained after each batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Buffer) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _xlsx_cell(value: Any) -> str:
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    if isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False)
+    text = escape(_XML_ILLEGAL.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(values: Iterable[Any]) -> str:
+    return "<row>" + "".join(_xlsx_cell(value) for value in values) + "</row>"
+
+
+def _xlsx_chunks(batches: Iterable[Batch], columns: Sequence[str]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as package:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            package.writestr(name, content)
+        with package.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write((_XLSX_SHEET_HEAD + _xlsx_row(columns)).encode())
+            for batch in batches:
+                rows = "".join(_xlsx_row(row.get(c) for c in columns) for row in batch)
+                sheet.write(rows.encode())
+                yield sink.drain()
+            sheet.write(_XLSX_SHEET_TAIL.encode())
+    yield sink.drain()
@@ -0,0 +1,57 @@
+"""
+Sparse fieldsets (`?fields=a,b,c`) para endpoints de listado.
+
+El repositorio selecciona en SQL solo las columnas pedidas (siempre dentro de
+su lista blanca `selectable_fields`) y devuelve filas planas, sin hidratar
+objetos ORM. Aquí se serializan con un esquema reducido derivado del esquema
+de lectura completo, de modo que tipos y formatos coinciden con la respuesta
+normal.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, create_model
+
+from app.core.exceptions import BadRequestException
+from app.core.serialization import json_response
+
+# Every sparse row keeps its primary key
+ALWAYS_SELECTED = ("id",)
+
+
+def parse_fields(fields: str | None, allowed: Sequence[str]) -> tuple[str, ...] | None:
+    """
+    Parses a comma separated ``fields`` parameter against a whitelist. Returns
+    None when no projection was requested.
+    """
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise BadRequestException(
+            detail=f"Invalid fields: {', '.join(unknown)}. "
+            f"Allowed: {', '.join(allowed)}"
+        )
+    # dict.fromkeys: de-duplicated, in request order
+    return tuple(dict.fromkeys([*ALWAYS_SELECTED, *requested]))
+
+
+@lru_cache(maxsize=128)
+def _sparse_model(schema: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    definitions: dict[str, Any] = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in fields
+    }
+    return create_model(f"{schema.__name__}Fields", **definitions)
+
+
+def fieldset_response(
+    schema: type[BaseModel], fields: tuple[str, ...], rows: Sequence[Any]
+) -> Response:
+    """Serializes projected rows with the subset of ``schema`` they carry."""
+    sparse = _sparse_model(schema, fields)
+    return json_response(list[sparse], rows)  # type: ignore[valid-type]
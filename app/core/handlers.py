@@ -7,7 +7,9 @@ from sqlalchemy.exc import IntegrityError
 
 from .exceptions import (
     BadRequestException,
+    ConflictException,
     ForbiddenException,
+    GatewayTimeoutException,
     InternalServerErrorException,
     NotFoundException,
     UnauthorizedException,
@@ -53,6 +55,15 @@ async def forbidden_exception_handler(request: Request, exc: ForbiddenException)
     )
 
 
+async def conflict_exception_handler(request: Request, exc: ConflictException):
+    property_logger.warning("conflict_error", detail=exc.detail)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
+
+
 async def internal_server_error_handler(
     request: Request, exc: InternalServerErrorException
 ):
@@ -64,6 +75,17 @@ async def internal_server_error_handler(
     )
 
 
+async def gateway_timeout_exception_handler(
+    request: Request, exc: GatewayTimeoutException
+):
+    property_logger.error("gateway_timeout", detail=exc.detail)
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
+
+
 async def integrity_error_handler(request: Request, exc: IntegrityError):
     err_msg = str(exc)
     detail = "Error de integridad de datos."
@@ -0,0 +1,85 @@
+"""
+Respuestas condicionales (ETag / If-None-Match) para endpoints de lectura
+muy consultados y que cambian poco (catálogos, menú por rol).
+
+El ETag se deriva de contadores de versión por tabla (`cache_versions`) que
+se incrementan en la misma transacción que la escritura, por lo que es
+consistente entre workers. Si el ETag coincide se responde `304 Not Modified`
+sin ejecutar la consulta ni construir la respuesta.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import Request, Response, status
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, col, select
+
+from app.core.db import dialect_insert
+from app.core.table_changes import before_tables_committed
+from app.models.cache_version import CacheVersion
+
+# Only writes to these tables bump a version counter
+versioned_tables: set[str] = set()
+
+
+def track_table_versions(tables: Iterable[str]) -> None:
+    versioned_tables.update(tables)
+
+
+def get_table_versions(session: Session, tables: Iterable[str]) -> dict[str, int]:
+    keys = sorted(set(tables))
+    if not keys:
+        return {}
+    statement = select(CacheVersion).where(col(CacheVersion.key).in_(keys))
+    found = {row.key: row.version for row in session.exec(statement).all()}
+    return {key: found.get(key, 0) for key in keys}
+
+
+def _bump_table_versions(session: OrmSession, tables: set[str]) -> None:
+    keys = sorted(tables & versioned_tables)
+    if not keys:
+        return
+    connection = session.connection()
+    statement = dialect_insert(connection, CacheVersion).values(
+        [{"key": key, "version": 1} for key in keys]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"version": CacheVersion.__table__.c.version + 1},  # type: ignore[attr-defined]
+    )
+    # Core execution: does not re-enter the ORM execute/flush hooks
+    connection.execute(statement)
+
+
+before_tables_committed(_bump_table_versions)
+
+
+def compute_etag(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return '"' + hashlib.sha256(payload.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2)
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    # Clients may keep the body but must revalidate before reusing it
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
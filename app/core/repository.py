@@ -1,16 +1,44 @@
 import uuid
-from typing import Any, Optional, Sequence, Type
+from typing import Any, Iterator, Optional, Sequence, Type
 
-from sqlalchemy import String, cast
+from sqlalchemy import RowMapping, String, cast
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlmodel import Session, SQLModel, col, func, or_, select
 
+from app.core.audit import get_audit_user_id
+from app.core.concurrency import version_etag
+from app.core.exceptions import ConflictException
+from app.core.serialization import nest_row
+from app.models.mixins import SoftDeleteMixin
+from app.util.datetime import get_current_time
+
+type LoadingProfiles = dict[str, Sequence[ORMOption]]
+
+# Loading profiles per repository class, built on first use
+_resolved_profiles: dict[type, LoadingProfiles] = {}
+
 
 class BaseRepository[ModelType: SQLModel]:
     searchable_fields: list[str] = []
+    # Columns a client may request through ``fields=`` (sparse fieldsets)
+    selectable_fields: list[str] = []
+    # Read-only list path (get_all_rows): selected columns, related ones
+    # labelled "relation__field", and the (target, onclause, outer) joins
+    row_columns: Sequence[Any] = ()
+    row_joins: Sequence[tuple[Any, Any, bool]] = ()
 
     def __init__(self, session: Session, model: Type[ModelType]):
         self.session = session
         self.model = model
+        # Models with SoftDeleteMixin: delete() marks rows, queries skip them
+        self.soft_delete = issubclass(model, SoftDeleteMixin)
+
+    def _apply_live(self, statement):
+        if self.soft_delete:
+            statement = statement.where(col(self.model.deleted_at).is_(None))
+        return statement
 
     def _apply_search(self, statement, search: Optional[str]):
         if search and self.searchable_fields:
@@ -32,6 +60,30 @@ class BaseRepository[ModelType: SQLModel]:
                 statement = statement.where(or_(*search_filters))
         return statement
 
+    @classmethod
+    def loading_profiles(cls) -> LoadingProfiles:
+        """
+        Named loader option sets (eager loads + column projections) selected
+        per endpoint, e.g. "list", "detail", "export". Built on first use:
+        loader options configure the mappers, which requires every related
+        model to be registered already.
+        """
+        return {}
+
+    def _profile_options(self, profile: Optional[str]) -> Sequence[ORMOption]:
+        if profile is None:
+            return ()
+        profiles = _resolved_profiles.get(type(self))
+        if profiles is None:
+            profiles = _resolved_profiles.setdefault(
+                type(self), self.loading_profiles()
+            )
+        if profile not in profiles:
+            raise ValueError(
+                f"Unknown loading profile '{profile}' for {self.model.__name__}"
+            )
+        return profiles[profile]
+
     def get_all(
         self,
         offset: int = 0,
@@ -40,8 +92,109 @@ class BaseRepository[ModelType: SQLModel]:
         sort_order: str = "asc",
         search: Optional[str] = None,
         extra_filters: Optional[list[Any]] = None,
+        profile: Optional[str] = None,
     ) -> Sequence[ModelType]:
-        statement = select(self.model)
+        statement = select(self.model).options(*self._profile_options(profile))
+        statement = self._apply_listing(
+            statement, offset, limit, sort_by, sort_order, search, extra_filters
+        )
+        return self.session.exec(statement).all()  # type: ignore[no-any-return]
+
+    def get_all_fields(
+        self,
+        fields: Sequence[str],
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+        search: Optional[str] = None,
+        extra_filters: Optional[list[Any]] = None,
+    ) -> Sequence[RowMapping]:
+        """
+        Sparse fieldset variant of ``get_all``: selects only ``fields`` (which
+        must be in ``selectable_fields``) and returns plain row mappings
+        instead of hydrated model instances.
+        """
+        not_allowed = set(fields) - set(self.selectable_fields)
+        if not_allowed:
+            raise ValueError(
+                f"Fields not selectable on {self.model.__name__}: {sorted(not_allowed)}"
+            )
+        # Plain SQLAlchemy select: rows stay tuples even for a single column
+        statement = sa_select(*(col(getattr(self.model, name)) for name in fields))
+        statement = self._apply_listing(
+            statement, offset, limit, sort_by, sort_order, search, extra_filters
+        )
+        return self.session.execute(statement).mappings().all()
+
+    def get_all_rows(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+        search: Optional[str] = None,
+        extra_filters: Optional[list[Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        ``get_all`` for read-only listings without hydrating ORM objects: one
+        SELECT of ``row_columns`` over ``row_joins``, each row returned as a
+        nested dict (``nest_row``) ready to validate into the read schema.
+        """
+        statement = sa_select(*self.row_columns).select_from(self.model)
+        for target, onclause, outer in self.row_joins:
+            statement = statement.join(target, onclause, isouter=outer)
+        statement = self._apply_listing(
+            statement, offset, limit, sort_by, sort_order, search, extra_filters
+        )
+        rows = self.session.execute(statement).mappings()
+        return [nest_row(row) for row in rows]
+
+    def stream_all(
+        self,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+        search: Optional[str] = None,
+        extra_filters: Optional[list[Any]] = None,
+        profile: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[ModelType]]:
+        """
+        Every matching row, in batches read from a server-side cursor. Runs on
+        its own session: a streamed response outlives the request session.
+        """
+        statement = select(self.model).options(*self._profile_options(profile))
+        statement = self._apply_filters(
+            statement, sort_by, sort_order, search, extra_filters
+        )
+        statement = statement.execution_options(yield_per=batch_size)
+        with Session(self.session.get_bind()) as session:
+            yield from session.exec(statement).partitions()
+
+    def _apply_listing(
+        self,
+        statement,
+        offset: int,
+        limit: int,
+        sort_by: Optional[str],
+        sort_order: str,
+        search: Optional[str],
+        extra_filters: Optional[list[Any]],
+    ):
+        statement = self._apply_filters(
+            statement, sort_by, sort_order, search, extra_filters
+        )
+        return statement.offset(offset).limit(limit)
+
+    def _apply_filters(
+        self,
+        statement,
+        sort_by: Optional[str],
+        sort_order: str,
+        search: Optional[str],
+        extra_filters: Optional[list[Any]],
+    ):
+        statement = self._apply_live(statement)
 
         # Apply generic search
         statement = self._apply_search(statement, search)
@@ -56,14 +209,13 @@ class BaseRepository[ModelType: SQLModel]:
                 statement = statement.order_by(column.desc())
             else:
                 statement = statement.order_by(column.asc())
-
-        statement = statement.offset(offset).limit(limit)
-        return self.session.exec(statement).all()  # type: ignore[no-any-return]
+        return statement
 
     def count(
         self, search: Optional[str] = None, extra_filters: Optional[list[Any]] = None
     ) -> int:
         statement = select(func.count()).select_from(self.model)
+        statement = self._apply_live(statement)
 
         # Apply generic search to count
         statement = self._apply_search(statement, search)
@@ -73,10 +225,15 @@ class BaseRepository[ModelType: SQLModel]:
             statement = statement.where(*extra_filters)
 
         result = self.session.exec(statement).one()
-        return int(result)  # type: ignore[arg-type]
+        return int(result)
 
-    def get_by_id(self, id: uuid.UUID | int) -> Optional[ModelType]:
-        return self.session.get(self.model, id)
+    def get_by_id(
+        self, id: uuid.UUID | int, profile: Optional[str] = None
+    ) -> Optional[ModelType]:
+        obj = self.session.get(self.model, id, options=self._profile_options(profile))
+        if obj is not None and self.soft_delete and obj.deleted_at is not None:  # type: ignore[attr-defined]
+            return None
+        return obj
 
     def create(self, obj: ModelType) -> ModelType:
         self.session.add(obj)
@@ -84,16 +241,40 @@ class BaseRepository[ModelType: SQLModel]:
         self.session.refresh(obj)
         return obj
 
-    def update(self, id: uuid.UUID | int, obj_data: dict) -> Optional[ModelType]:
+    def update(
+        self,
+        id: uuid.UUID | int,
+        obj_data: dict,
+        expected_version: Optional[int] = None,
+    ) -> Optional[ModelType]:
+        """
+        ``expected_version`` (models with VersionMixin): the version the client
+        read; a different current version raises ConflictException.
+        """
         db_obj = self.get_by_id(id)
         if not db_obj:
             return None
+        current: Optional[int] = getattr(db_obj, "version_id", None)
+        if expected_version is not None and current != expected_version:
+            etag = version_etag(current) if current is not None else None
+            raise ConflictException(
+                detail=f"{self.model.__name__} was modified by another user "
+                f"(version {current}, expected {expected_version})",
+                headers={"ETag": etag} if etag else None,
+            )
 
         for key, value in obj_data.items():
             setattr(db_obj, key, value)
 
         self.session.add(db_obj)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except StaleDataError:
+            # Changed between our read and the versioned UPDATE
+            self.session.rollback()
+            raise ConflictException(
+                detail=f"{self.model.__name__} was modified by another user"
+            ) from None
         self.session.refresh(db_obj)
         return db_obj
 
@@ -102,6 +283,11 @@ class BaseRepository[ModelType: SQLModel]:
         if not db_obj:
             return False
 
-        self.session.delete(db_obj)
+        if self.soft_delete:
+            db_obj.deleted_at = get_current_time()
+            db_obj.deleted_by_id = get_audit_user_id()
+            self.session.add(db_obj)
+        else:
+            self.session.delete(db_obj)
         self.session.commit()
         return True
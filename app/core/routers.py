@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.auth import routers as Auth
+from app.core.audit.routers import router as Audit
 from app.core.catalogs.routers import router as Catalogs
 from app.modules.assets import routers as Assets
 from app.modules.core import routers as Core
@@ -11,6 +12,8 @@ router = APIRouter()
 router.include_router(Auth.router, prefix="/auth", tags=["Auth"])
 # Global Catalogs
 router.include_router(Catalogs)
+# Global Audit Query
+router.include_router(Audit)
 # Modules
 router.include_router(Task.router, prefix="/tasks", tags=["Tasks"])
 
@@ -0,0 +1,70 @@
+"""
+Serialización rápida de respuestas JSON para listados.
+
+Con `response_model`, FastAPI valida cada objeto devuelto, lo convierte a
+tipos JSON con `jsonable_encoder` y recién entonces lo codifica. Aquí el tipo
+de respuesta se valida con un `TypeAdapter` construido una sola vez por tipo
+y pydantic-core escribe los bytes JSON directamente (en Rust), devolviendo un
+`Response` que FastAPI ya no procesa. El `response_model` del endpoint se
+mantiene para la documentación OpenAPI.
+
+Los listados de solo lectura pueden además entregar filas planas en lugar de
+objetos ORM (`BaseRepository.get_all_rows`): `nest_row` arma los diccionarios
+anidados que esperan los esquemas a partir de columnas `relacion__campo`.
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# Label separator for related columns: "area__institution__name"
+NESTED_SEPARATOR = "__"
+
+
+@lru_cache(maxsize=256)
+def type_adapter(response_type: Any) -> TypeAdapter[Any]:
+    """One adapter (schema + validator + serializer) per response type."""
+    return TypeAdapter(response_type)
+
+
+def json_response(
+    response_type: Any,
+    data: Any,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Validates ``data`` (ORM objects or dicts) as ``response_type`` and writes
+    it as JSON, with the same output as FastAPI's ``response_model`` path.
+    """
+    adapter = type_adapter(response_type)
+    value = adapter.validate_python(data, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(value, by_alias=True),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def nest_row(row: Mapping[Any, Any]) -> dict[str, Any]:
+    """
+    ``{"id": 1, "area__id": 2, "area__name": "A"}`` →
+    ``{"id": 1, "area": {"id": 2, "name": "A"}}``. A related dict whose ``id``
+    is null (outer join without match) becomes None.
+    """
+    values: dict[str, Any] = {}
+    related: dict[str, dict[str, Any]] = {}
+    for key, value in row.items():
+        relation, separator, rest = key.partition(NESTED_SEPARATOR)
+        if separator:
+            related.setdefault(relation, {})[rest] = value
+        else:
+            values[key] = value
+    for relation, columns in related.items():
+        nested = nest_row(columns)
+        values[relation] = nested if nested.get("id") is not None else None
+    return values
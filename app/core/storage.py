@@ -0,0 +1,165 @@
+"""
+Almacenamiento de archivos direccionado por contenido.
+
+Cada archivo se identifica por el SHA-256 de sus bytes, calculado mientras se
+escribe: subir dos veces el mismo documento lo guarda una sola vez. El
+backend es intercambiable (`STORAGE_BACKEND`); el sistema de archivos local
+es el predeterminado y el único que expone rutas, lo que permite servir las
+descargas con `FileResponse` (Range, ETag y `pathsend` sin copias cuando el
+servidor lo soporta).
+"""
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol, Self
+
+from app.core.config import settings
+
+# Bytes kept from the start of every upload, for format checks
+HEAD_SIZE = 8
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    key: str
+    size: int
+    # False when identical content was already stored
+    created: bool
+
+
+class StorageWriter(Protocol):
+    head: bytes
+
+    def write(self, data: bytes) -> None: ...
+
+    def commit(self) -> StoredObject:
+        """
+        Publishes the object. The bytes are kept until the writer is closed,
+        so calling it again re-publishes an object deleted in the meantime.
+        """
+        ...
+
+    def abort(self) -> None: ...
+
+    def __enter__(self) -> Self: ...
+
+    def __exit__(self, *exc_info: object) -> None: ...
+
+
+class Storage(Protocol):
+    def writer(self) -> StorageWriter:
+        """Incremental writer; the key is known once ``commit`` is called."""
+        ...
+
+    def exists(self, key: str) -> bool: ...
+
+    def size(self, key: str) -> int: ...
+
+    def iter_chunks(self, key: str) -> Iterator[bytes]: ...
+
+    def local_path(self, key: str) -> Path | None:
+        """Filesystem path of the object, or None for remote backends."""
+        ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class LocalFileWriter:
+    def __init__(self, storage: "LocalStorage"):
+        self.storage = storage
+        self.head = b""
+        self._hash = hashlib.sha256()
+        self._size = 0
+        tmp_dir = storage.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=tmp_dir)
+        self._file = os.fdopen(fd, "wb")
+        self._tmp_path = Path(name)
+
+    def write(self, data: bytes) -> None:
+        if len(self.head) < HEAD_SIZE:
+            self.head = (self.head + data)[:HEAD_SIZE]
+        self._hash.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def commit(self) -> StoredObject:
+        self._file.close()
+        key = self._hash.hexdigest()
+        path = self.storage.path(key)
+        if path.exists():
+            # The copy stays until __exit__, in case a concurrent release of
+            # the same content deletes the stored one before it is referenced
+            return StoredObject(key=key, size=self._size, created=False)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic on the same filesystem: readers never see a partial file
+        os.replace(self._tmp_path, path)
+        return StoredObject(key=key, size=self._size, created=True)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        # Drops the temp copy; a no-op once it was moved into place
+        self.abort()
+
+
+class LocalStorage:
+    """Objects live under ``root/ab/cd/<sha256>``."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def writer(self) -> LocalFileWriter:
+        return LocalFileWriter(self)
+
+    def exists(self, key: str) -> bool:
+        return self.path(key).is_file()
+
+    def size(self, key: str) -> int:
+        return self.path(key).stat().st_size
+
+    def iter_chunks(self, key: str) -> Iterator[bytes]:
+        with self.path(key).open("rb") as source:
+            while chunk := source.read(READ_CHUNK_SIZE):
+                yield chunk
+
+    def local_path(self, key: str) -> Path | None:
+        return self.path(key)
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+
+# Backend name (STORAGE_BACKEND) -> factory
+storage_backends: dict[str, Callable[[], Storage]] = {
+    "local": lambda: LocalStorage(Path(settings.STORAGE_LOCAL_ROOT)),
+}
+
+
+def register_storage_backend(name: str, factory: Callable[[], Storage]) -> None:
+    storage_backends[name] = factory
+
+
+@lru_cache(maxsize=1)
+def get_storage() -> Storage:
+    try:
+        factory = storage_backends[settings.STORAGE_BACKEND]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage backend '{settings.STORAGE_BACKEND}'"
+        ) from None
+    return factory()
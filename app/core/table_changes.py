@@ -0,0 +1,98 @@
+"""
+Seguimiento de las tablas escritas por cada sesión de SQLAlchemy.
+
+Recolecta los nombres de tabla afectados por los flush del ORM y por las
+sentencias masivas (`insert` / `update` / `delete`), y notifica a los
+suscriptores:
+
+* `before_tables_committed`: dentro de la transacción, justo antes del commit
+  (p. ej. para incrementar contadores de versión de forma atómica).
+* `on_tables_committed`: después de un commit exitoso (p. ej. para invalidar
+  cachés en memoria). En rollback las tablas se descartan.
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+_WRITTEN_TABLES_KEY = "written_tables"
+
+_pre_commit_listeners: list[Callable[[Session, set[str]], None]] = []
+_commit_listeners: list[Callable[[set[str]], None]] = []
+
+
+def before_tables_committed(fn: Callable[[Session, set[str]], None]) -> None:
+    if fn not in _pre_commit_listeners:
+        _pre_commit_listeners.append(fn)
+
+
+def on_tables_committed(fn: Callable[[set[str]], None]) -> None:
+    if fn not in _commit_listeners:
+        _commit_listeners.append(fn)
+
+
+def written_tables(session: Session) -> set[str]:
+    return set(session.info.get(_WRITTEN_TABLES_KEY, ()))
+
+
+def _mark_written(session: Session, tables: Iterable[str]) -> None:
+    session.info.setdefault(_WRITTEN_TABLES_KEY, set()).update(tables)
+
+
+def _collect_flushed_tables(session: Session, flush_context: Any) -> None:
+    tables = {
+        table
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if (table := getattr(obj, "__tablename__", None))
+    }
+    _mark_written(session, tables)
+
+
+def _collect_bulk_statement_tables(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk insert/update/delete statements bypass the unit of work
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None:
+        _mark_written(orm_execute_state.session, {table.name})
+
+
+def _before_commit(session: Session) -> None:
+    if not _pre_commit_listeners:
+        return
+    # Flush now so the pending writes are part of the collected tables
+    session.flush()
+    tables = written_tables(session)
+    if tables:
+        for fn in _pre_commit_listeners:
+            fn(session, tables)
+
+
+def _after_commit(session: Session) -> None:
+    tables = session.info.pop(_WRITTEN_TABLES_KEY, None)
+    if tables:
+        for fn in _commit_listeners:
+            fn(tables)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES_KEY, None)
+
+
+def register_table_change_hooks() -> None:
+    listeners = (
+        ("after_flush", _collect_flushed_tables),
+        ("do_orm_execute", _collect_bulk_statement_tables),
+        ("before_commit", _before_commit),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+    )
+    for name, fn in listeners:
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
@@ -0,0 +1,109 @@
+"""
+Recepción de archivos grandes sin pasar por `UploadFile`.
+
+`request.form()` vuelca cada archivo a un `SpooledTemporaryFile` y recién
+después el endpoint puede leerlo, es decir, el archivo se escribe dos veces.
+Aquí el cuerpo `multipart/form-data` se analiza a medida que llega
+(`request.stream()`) y los bytes del campo pedido se entregan directamente al
+`StorageWriter`, que calcula el hash mientras escribe en su destino final.
+"""
+
+from fastapi import Request
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+from app.core.exceptions import BadRequestException
+from app.core.storage import StorageWriter
+
+
+class _FileFieldParser:
+    """Collects the data of one file field; every other part is ignored."""
+
+    def __init__(self, field: str, boundary: bytes):
+        self.field = field.encode()
+        self.filename: str | None = None
+        self.pending: list[bytes] = []
+        self._in_field = False
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self.parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+            },
+        )
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition"))
+        filename = options.get(b"filename")
+        # Only the first part with the expected name is taken
+        if options.get(b"name") == self.field and filename is not None:
+            if self.filename is None:
+                self.filename = filename.decode("utf-8", "replace")
+                self._in_field = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_field:
+            self.pending.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        self._in_field = False
+
+
+async def stream_multipart_file(
+    request: Request, field: str, writer: StorageWriter, max_size: int
+) -> str:
+    """
+    Writes the file sent in the ``field`` part of a multipart request to
+    ``writer`` as the body arrives and returns its client-side filename.
+    Nothing is committed: the caller validates and commits the writer.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise BadRequestException(detail="Expected a multipart/form-data body")
+
+    state = _FileFieldParser(field, boundary)
+    size = 0
+    try:
+        async for chunk in request.stream():
+            state.parser.write(chunk)
+            if not state.pending:
+                continue
+            data = b"".join(state.pending)
+            state.pending.clear()
+            size += len(data)
+            if size > max_size:
+                raise BadRequestException(
+                    detail=f"File too large: the limit is {max_size} bytes"
+                )
+            # Disk (or network) writes must not block the event loop
+            await run_in_threadpool(writer.write, data)
+        state.parser.finalize()
+    except MultipartParseError:
+        raise BadRequestException(detail="Malformed multipart body") from None
+
+    if state.filename is None:
+        raise BadRequestException(detail=f"Missing file field '{field}'")
+    return state.filename
@@ -17,14 +17,18 @@ from app.core.config import settings
 from app.core.db import create_db_and_tables, engine
 from app.core.exceptions import (
     BadRequestException,
+    ConflictException,
     ForbiddenException,
+    GatewayTimeoutException,
     InternalServerErrorException,
     NotFoundException,
     UnauthorizedException,
 )
 from app.core.handlers import (
     bad_request_exception_handler,
+    conflict_exception_handler,
     forbidden_exception_handler,
+    gateway_timeout_exception_handler,
     integrity_error_handler,
     internal_server_error_handler,
     not_found_exception_handler,
@@ -32,6 +36,7 @@ from app.core.handlers import (
 )
 from app.core.logging import configure_logging
 from app.core.routers import router as api_router
+from app.core.table_changes import register_table_change_hooks
 
 # Setup Logging
 configure_logging()
@@ -52,6 +57,7 @@ async def lifespan(app: FastAPI):
     app.state.engine = engine
     create_db_and_tables()
     register_audit_hooks(engine)
+    register_table_change_hooks()
     yield
 
 
@@ -120,6 +126,15 @@ app = FastAPI(
             "description": "Gestión centralizada de Bienes de Uso, "
             "códigos SAF y verificación física.",
         },
+        {
+            "name": "Assets - Summary",
+            "description": "Contadores precalculados del inventario para el dashboard.",
+        },
+        {
+            "name": "Assets - Verification",
+            "description": "Campañas de verificación física con sincronización "
+            "incremental para equipos sin conexión.",
+        },
     ],
     openapi_url="/openapi.json",
 )
@@ -172,7 +187,9 @@ app.add_exception_handler(NotFoundException, not_found_exception_handler)  # typ
 app.add_exception_handler(BadRequestException, bad_request_exception_handler)  # type: ignore
 app.add_exception_handler(UnauthorizedException, unauthorized_exception_handler)  # type: ignore
 app.add_exception_handler(ForbiddenException, forbidden_exception_handler)  # type: ignore
+app.add_exception_handler(ConflictException, conflict_exception_handler)  # type: ignore[arg-type]
 app.add_exception_handler(InternalServerErrorException, internal_server_error_handler)  # type: ignore
+app.add_exception_handler(GatewayTimeoutException, gateway_timeout_exception_handler)  # type: ignore[arg-type]
 app.add_exception_handler(IntegrityError, integrity_error_handler)  # type: ignore
 
 
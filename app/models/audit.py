@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import JSON, Column, DateTime
-from sqlmodel import Field
+from sqlmodel import Field, Index
 
 from app.models.base_model import BaseModel
 from app.util.datetime import get_current_time
@@ -11,12 +11,27 @@ from app.util.datetime import get_current_time
 
 class AuditLog(BaseModel, table=True):
     __tablename__ = "audit_logs"
+    # Composite indexes backing the audit query API. ``id`` (uuid7) is the
+    # keyset tie-breaker, so an entity or user timeline is a single range scan.
+    # They also cover plain ``entity_type`` / ``user_id`` / ``action`` lookups,
+    # which previously had single-column indexes of their own.
+    __table_args__ = (
+        Index(
+            "ix_audit_logs_entity_timeline",
+            "entity_type",
+            "entity_id",
+            "timestamp",
+            "id",
+        ),
+        Index("ix_audit_logs_user_timeline", "user_id", "timestamp", "id"),
+        Index("ix_audit_logs_action_timeline", "action", "timestamp", "id"),
+    )
 
     # id inherited from BaseModel (UUID)
-    user_id: uuid.UUID | None = Field(default=None, index=True)
+    user_id: uuid.UUID | None = Field(default=None)
     username: str | None = Field(default=None)
-    action: str = Field(index=True)  # CREATE, READ, UPDATE, DELETE, ACCESS
-    entity_type: str = Field(index=True)  # Product, User, Endpoint
+    action: str  # CREATE, READ, UPDATE, DELETE, ACCESS
+    entity_type: str  # Product, User, Endpoint
     entity_id: str | None = Field(default=None, index=True)
     changes: Any | None = Field(default=None, sa_column=Column(JSON))
     ip_address: str | None = Field(default=None)
@@ -25,3 +40,34 @@ class AuditLog(BaseModel, table=True):
         default_factory=get_current_time,
         sa_column=Column(DateTime(timezone=False), index=True),
     )
+
+
+class AuditSnapshot(BaseModel, table=True):
+    """
+    Materialized state of an entity at a given audit event, used as a
+    replay checkpoint by the history reconstruction service.
+    """
+
+    __tablename__ = "audit_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_audit_snapshots_entity_timeline",
+            "entity_type",
+            "entity_id",
+            "snapshot_at",
+        ),
+    )
+
+    entity_type: str
+    entity_id: str
+    # None means the entity was deleted at this point of its history
+    state: Any | None = Field(default=None, sa_column=Column(JSON))
+    # (timestamp, id) of the last audit event folded into ``state``
+    snapshot_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=False), nullable=False)
+    )
+    audit_log_id: uuid.UUID
+    created_at: datetime = Field(
+        default_factory=get_current_time,
+        sa_column=Column(DateTime(timezone=False)),
+    )
@@ -0,0 +1,13 @@
+from sqlmodel import Field, SQLModel
+
+
+class CacheVersion(SQLModel, table=True):
+    """
+    Monotonic write counter per table, bumped in the same transaction as the
+    write. Conditional responses (ETag) are derived from these versions.
+    """
+
+    __tablename__ = "cache_versions"
+
+    key: str = Field(primary_key=True, max_length=100)
+    version: int = Field(default=0)
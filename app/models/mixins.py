@@ -1,6 +1,9 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
+from sqlalchemy import Index, text
+from sqlalchemy.orm import declared_attr
 from sqlmodel import DateTime, Field, SQLModel
 
 from app.util.datetime import get_current_time
@@ -34,3 +37,54 @@ class AuditMixin(SQLModel):
         foreign_key="users.id",
         description="The user who last updated this record",
     )
+
+
+class VersionMixin(SQLModel):
+    """
+    Opt-in optimistic concurrency: ``version_id`` is SQLAlchemy's
+    ``version_id_col``. Every ORM UPDATE checks the version it read and
+    increments it, so a concurrent change fails with ``StaleDataError``
+    instead of being overwritten. Core UPDATEs must bump it themselves.
+    """
+
+    version_id: int = Field(
+        default=1,
+        sa_column_kwargs={"server_default": "1"},
+        description="Row version, exposed as the ETag of the record",
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"version_id_col": cls.__table__.c.version_id}  # type: ignore[attr-defined]
+
+
+# Predicate of live rows, shared by the repository filter and partial indexes
+LIVE_ROWS = text("deleted_at IS NULL")
+
+
+class SoftDeleteMixin(SQLModel):
+    """
+    Opt-in soft delete: ``BaseRepository.delete`` marks the row with
+    ``deleted_at``/``deleted_by_id`` instead of removing it, and the
+    repository's default queries leave marked rows out.
+    """
+
+    deleted_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+        description="The timestamp when the data was deleted",
+    )
+    deleted_by_id: uuid.UUID | None = Field(
+        default=None,
+        foreign_key="users.id",
+        description="The user who deleted this record",
+    )
+
+
+def live_rows_index(name: str, *columns: str) -> Index:
+    """
+    Partial index over live rows only. Queries carrying the repository's
+    ``deleted_at IS NULL`` filter match its predicate, and deleted rows do
+    not grow it.
+    """
+    return Index(name, *columns, postgresql_where=LIVE_ROWS, sqlite_where=LIVE_ROWS)
@@ -5,7 +5,12 @@ from uuid import UUID
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.base_model import BaseModel
-from app.models.mixins import AuditMixin
+from app.models.mixins import (
+    AuditMixin,
+    SoftDeleteMixin,
+    VersionMixin,
+    live_rows_index,
+)
 
 if TYPE_CHECKING:
     from app.modules.assets.assets.models import FixedAsset
@@ -18,12 +23,19 @@ class AssetActLink(SQLModel, table=True):
     act_id: UUID = Field(foreign_key="assets_act.id", primary_key=True)
 
 
-class Act(BaseModel, AuditMixin, table=True):
+class Act(BaseModel, AuditMixin, SoftDeleteMixin, VersionMixin, table=True):
     __tablename__ = "assets_act"
+    __table_args__ = (
+        live_rows_index("ix_assets_act_live_registered_at", "registered_at"),
+    )
 
     act_number: str = Field(index=True, unique=True, max_length=100)
     registered_at: datetime | None = Field(default=None)
     pdf_attachment: str | None = Field(default=None, max_length=500)
+    # Stored PDF (app.core.storage): content hash is the storage key
+    pdf_sha256: str | None = Field(default=None, index=True, max_length=64)
+    pdf_size: int | None = Field(default=None)
+    pdf_filename: str | None = Field(default=None, max_length=255)
 
     staff_id: UUID | None = Field(default=None, foreign_key="core_staff.id")
 
@@ -1,11 +1,73 @@
-from sqlmodel import Session
+from collections.abc import Iterable
+from uuid import UUID
 
-from app.core.repository import BaseRepository
-from app.modules.assets.acts.models import Act
+from sqlalchemy import delete
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, select
+
+from app.core.db import dialect_insert
+from app.core.repository import BaseRepository, LoadingProfiles
+from app.modules.assets.acts.models import Act, AssetActLink
+from app.modules.assets.assets.models import FixedAsset
 
 
 class ActRepository(BaseRepository[Act]):
     searchable_fields = ["act_number", "description"]
 
+    @classmethod
+    def loading_profiles(cls) -> LoadingProfiles:
+        # Linked assets of a whole page in one extra SELECT (IN over the act
+        # ids), projecting only the columns ActAssetRead shows; soft-deleted
+        # assets are left out
+        linked_assets = (
+            selectinload(
+                Act.fixed_assets.and_(col(FixedAsset.deleted_at).is_(None))  # type: ignore[attr-defined]
+            ).load_only(
+                FixedAsset.old_code,  # type: ignore[arg-type]
+                FixedAsset.new_code,  # type: ignore[arg-type]
+                FixedAsset.description,  # type: ignore[arg-type]
+                FixedAsset.serial_number,  # type: ignore[arg-type]
+            ),
+        )
+        return {"list": linked_assets, "detail": linked_assets}
+
     def __init__(self, session: Session):
         super().__init__(session, Act)
+
+    def lock_pdf_references(self, sha256: str) -> int:
+        """
+        Acts whose attachment is the stored object ``sha256``, row-locked
+        (``SELECT ... FOR UPDATE``) until the transaction ends.
+        """
+        statement = (
+            select(Act.id).where(col(Act.pdf_sha256) == sha256).with_for_update()
+        )
+        return len(self.session.exec(statement).all())
+
+    def get_asset_ids(self, act_id: UUID) -> set[UUID]:
+        statement = select(AssetActLink.asset_id).where(AssetActLink.act_id == act_id)
+        return set(self.session.exec(statement).all())
+
+    def get_existing_asset_ids(self, asset_ids: Iterable[UUID]) -> set[UUID]:
+        statement = select(FixedAsset.id).where(
+            col(FixedAsset.id).in_(asset_ids), col(FixedAsset.deleted_at).is_(None)
+        )
+        return set(self.session.exec(statement).all())
+
+    def link_assets(self, act_id: UUID, asset_ids: Iterable[UUID]) -> None:
+        """One bulk INSERT of links; existing links are left as they are."""
+        params = [{"asset_id": id, "act_id": act_id} for id in asset_ids]
+        if not params:
+            return
+        statement = dialect_insert(self.session, AssetActLink).on_conflict_do_nothing()
+        self.session.exec(statement, params=params)
+
+    def unlink_assets(self, act_id: UUID, asset_ids: Iterable[UUID]) -> None:
+        """One DELETE for every link of ``act_id`` to ``asset_ids``."""
+        ids = list(asset_ids)
+        if not ids:
+            return
+        statement = delete(AssetActLink).where(
+            col(AssetActLink.act_id) == act_id, col(AssetActLink.asset_id).in_(ids)
+        )
+        self.session.exec(statement)
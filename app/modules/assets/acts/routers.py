@@ -1,13 +1,25 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from app.auth.permissions import PermissionAction, PermissionChecker
 from app.auth.schemas import UserModulePermission
+from app.core.concurrency import IfMatchDep, set_version_etag
+from app.core.config import settings
 from app.core.db import SessionDep
-from app.core.exceptions import NotFoundException
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.core.uploads import stream_multipart_file
 from app.modules.assets.acts.models import Act
-from app.modules.assets.acts.schemas import ActCreate, ActRead, ActUpdate
+from app.modules.assets.acts.schemas import (
+    ActAssetLinks,
+    ActAssetLinksResult,
+    ActCreate,
+    ActRead,
+    ActReadDetailed,
+    ActUpdate,
+)
 from app.modules.assets.acts.service import ActService
 from app.modules.assets.constants import AssetsModuleSlug
 
@@ -29,7 +41,7 @@ def create_act(
     return service.create(Act(**data.model_dump()))
 
 
-@router.get("/", response_model=list[ActRead])
+@router.get("/", response_model=list[ActReadDetailed])
 def get_acts(
     session: SessionDep,
     offset: int = 0,
@@ -63,9 +75,10 @@ def count_acts(
     return {"total": service.count(search)}
 
 
-@router.get("/{id}", response_model=ActRead)
+@router.get("/{id}", response_model=ActReadDetailed)
 def get_act(
     session: SessionDep,
+    response: Response,
     id: UUID,
     _: UserModulePermission = Depends(
         PermissionChecker(
@@ -75,17 +88,20 @@ def get_act(
     ),
 ):
     service = ActService(session)
-    act = service.get_by_id(id)
+    act = service.get_detail(id)
     if not act:
         raise NotFoundException(detail="Act not found")
+    set_version_etag(response, act.version_id)
     return act
 
 
 @router.patch("/{id}", response_model=ActRead)
 def update_act(
     session: SessionDep,
+    response: Response,
     id: UUID,
     data: ActUpdate,
+    if_match: IfMatchDep,
     _: UserModulePermission = Depends(
         PermissionChecker(
             module_slug=AssetsModuleSlug.GENERAL,
@@ -94,9 +110,10 @@ def update_act(
     ),
 ):
     service = ActService(session)
-    act = service.update(id, data.model_dump(exclude_unset=True))
+    act = service.update(id, data.model_dump(exclude_unset=True), if_match)
     if not act:
         raise NotFoundException(detail="Act not found")
+    set_version_etag(response, act.version_id)
     return act
 
 
@@ -115,3 +132,173 @@ def delete_act(
     if not service.delete(id):
         raise NotFoundException(detail="Act not found")
     return {"ok": True}
+
+
+PDF_MAGIC = b"%PDF-"
+
+PDF_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+@router.put("/{id}/pdf", response_model=ActRead, openapi_extra=PDF_UPLOAD_BODY)
+async def upload_act_pdf(
+    request: Request,
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    """
+    Adjunta el PDF del acta (campo ``file``). El cuerpo se escribe en el
+    almacenamiento a medida que llega; un PDF idéntico a uno ya guardado no
+    ocupa espacio adicional.
+    """
+    service = ActService(session)
+    if not await run_in_threadpool(service.get_by_id, id):
+        raise NotFoundException(detail="Act not found")
+    with service.storage.writer() as writer:
+        filename = await stream_multipart_file(
+            request, "file", writer, settings.ACT_PDF_MAX_SIZE
+        )
+        if not writer.head.startswith(PDF_MAGIC):
+            raise BadRequestException(detail="The file is not a PDF")
+        act = await run_in_threadpool(service.attach_pdf, id, writer, filename)
+    if not act:
+        raise NotFoundException(detail="Act not found")
+    return act
+
+
+@router.get("/{id}/pdf", response_class=FileResponse)
+def download_act_pdf(
+    request: Request,
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """
+    Descarga el PDF del acta. Admite ``Range`` (descargas reanudables) e
+    ``If-None-Match``: el ETag es el hash del contenido.
+    """
+    service = ActService(session)
+    act = service.get_by_id(id)
+    if not act:
+        raise NotFoundException(detail="Act not found")
+    if not act.pdf_sha256:
+        raise NotFoundException(detail="The act has no PDF attached")
+
+    etag = f'"{act.pdf_sha256}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    filename = act.pdf_filename or f"{act.act_number}.pdf"
+    path = service.storage.local_path(act.pdf_sha256)
+    if path is not None:
+        # FileResponse serves ranges and uses the ASGI pathsend extension
+        # (zero-copy sendfile) when the server supports it
+        return FileResponse(
+            path,
+            media_type="application/pdf",
+            filename=filename,
+            content_disposition_type="inline",
+            headers={"ETag": etag},
+        )
+    return StreamingResponse(
+        service.storage.iter_chunks(act.pdf_sha256),
+        media_type="application/pdf",
+        headers={
+            "ETag": etag,
+            "Content-Length": str(act.pdf_size),
+            "Content-Disposition": f'inline; filename="{filename}"',
+        },
+    )
+
+
+@router.delete("/{id}/pdf", response_model=ActRead)
+def delete_act_pdf(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    service = ActService(session)
+    act = service.detach_pdf(id)
+    if not act:
+        raise NotFoundException(detail="Act not found")
+    return act
+
+
+def _act_links_service(session: SessionDep, id: UUID) -> ActService:
+    service = ActService(session)
+    if not service.get_by_id(id):
+        raise NotFoundException(detail="Act not found")
+    return service
+
+
+@router.put("/{id}/assets", response_model=ActAssetLinksResult)
+def set_act_assets(
+    session: SessionDep,
+    id: UUID,
+    data: ActAssetLinks,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    """Reemplaza el conjunto de activos del acta por ``asset_ids``."""
+    return _act_links_service(session, id).set_assets(id, data.asset_ids)
+
+
+@router.post("/{id}/assets/link", response_model=ActAssetLinksResult)
+def link_act_assets(
+    session: SessionDep,
+    id: UUID,
+    data: ActAssetLinks,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    return _act_links_service(session, id).link_assets(id, data.asset_ids)
+
+
+@router.post("/{id}/assets/unlink", response_model=ActAssetLinksResult)
+def unlink_act_assets(
+    session: SessionDep,
+    id: UUID,
+    data: ActAssetLinks,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    return _act_links_service(session, id).unlink_assets(id, data.asset_ids)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActBase(BaseModel):
@@ -24,3 +24,34 @@ class ActUpdate(BaseModel):
 
 class ActRead(ActBase):
     id: UUID
+    version_id: int
+    pdf_sha256: str | None = None
+    pdf_size: int | None = None
+    pdf_filename: str | None = None
+
+
+class ActAssetRead(BaseModel):
+    id: UUID
+    old_code: str | None = None
+    new_code: str | None = None
+    description: str
+    serial_number: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActReadDetailed(ActRead):
+    fixed_assets: list[ActAssetRead] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActAssetLinks(BaseModel):
+    asset_ids: list[UUID] = Field(max_length=5000)
+
+
+class ActAssetLinksResult(BaseModel):
+    act_id: UUID
+    linked: int
+    unlinked: int
+    total: int
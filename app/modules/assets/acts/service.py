@@ -3,13 +3,20 @@ from uuid import UUID
 
 from sqlmodel import Session
 
-from app.modules.assets.acts.models import Act
+from app.core.audit import record_bulk_changes, system_job
+from app.core.exceptions import BadRequestException
+from app.core.storage import Storage, StorageWriter, get_storage
+from app.modules.assets.acts.models import Act, AssetActLink
 from app.modules.assets.acts.repository import ActRepository
+from app.modules.assets.acts.schemas import ActAssetLinksResult
+
+LINKS_JOB_NAME = "act_asset_links"
 
 
 class ActService:
     def __init__(self, session: Session):
         self.repository = ActRepository(session)
+        self.storage: Storage = get_storage()
 
     def create(self, data: Act) -> Act:
         return self.repository.create(data)
@@ -22,16 +29,122 @@ class ActService:
         sort_order: str = "asc",
         search: str | None = None,
     ) -> Sequence[Act]:
-        return self.repository.get_all(offset, limit, sort_by, sort_order, search)
+        return self.repository.get_all(
+            offset, limit, sort_by, sort_order, search, profile="list"
+        )
 
     def get_by_id(self, id: UUID) -> Act | None:
         return self.repository.get_by_id(id)
 
-    def update(self, id: UUID, data: dict) -> Act | None:
-        return self.repository.update(id, data)
+    def get_detail(self, id: UUID) -> Act | None:
+        return self.repository.get_by_id(id, profile="detail")
+
+    def link_assets(self, id: UUID, asset_ids: list[UUID]) -> ActAssetLinksResult:
+        current = self.repository.get_asset_ids(id)
+        return self._apply_links(id, current, set(asset_ids) - current, set())
+
+    def unlink_assets(self, id: UUID, asset_ids: list[UUID]) -> ActAssetLinksResult:
+        current = self.repository.get_asset_ids(id)
+        return self._apply_links(id, current, set(), current & set(asset_ids))
+
+    def set_assets(self, id: UUID, asset_ids: list[UUID]) -> ActAssetLinksResult:
+        """Makes ``asset_ids`` the act's exact set of assets."""
+        current = self.repository.get_asset_ids(id)
+        requested = set(asset_ids)
+        return self._apply_links(id, current, requested - current, current - requested)
+
+    def _apply_links(
+        self, id: UUID, current: set[UUID], added: set[UUID], removed: set[UUID]
+    ) -> ActAssetLinksResult:
+        """
+        Writes a diff against the current links: one INSERT for ``added`` and
+        one DELETE for ``removed``, in a single transaction.
+        """
+        missing = added - self.repository.get_existing_asset_ids(added)
+        if missing:
+            raise BadRequestException(
+                detail=f"Assets not found: {', '.join(sorted(map(str, missing)))}"
+            )
+        session = self.repository.session
+        if added or removed:
+            with system_job(LINKS_JOB_NAME):
+                try:
+                    self.repository.link_assets(id, added)
+                    self.repository.unlink_assets(id, removed)
+                    record_bulk_changes(
+                        session,
+                        AssetActLink.__name__,
+                        {"CREATE": len(added), "DELETE": len(removed)},
+                        [*added, *removed],
+                    )
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+        return ActAssetLinksResult(
+            act_id=id,
+            linked=len(added),
+            unlinked=len(removed),
+            total=len(current) + len(added) - len(removed),
+        )
+
+    def update(
+        self, id: UUID, data: dict, expected_version: int | None = None
+    ) -> Act | None:
+        return self.repository.update(id, data, expected_version)
 
     def delete(self, id: UUID) -> bool:
+        # Soft delete: the act keeps its PDF
         return self.repository.delete(id)
 
+    def attach_pdf(self, id: UUID, writer: StorageWriter, filename: str) -> Act | None:
+        """
+        Publishes the upload in ``writer`` and points the act at it. Called
+        before the writer is closed: its bytes re-publish the object if a
+        concurrent release deleted the identical stored copy.
+        """
+        stored = writer.commit()
+        act = self.repository.get_by_id(id)
+        if not act:
+            self._release_pdf(stored.key)
+            return None
+        previous = act.pdf_sha256
+        # Waits for a release of the same content holding its references;
+        # the locks last until the update below commits
+        self.repository.lock_pdf_references(stored.key)
+        if not self.storage.exists(stored.key):
+            stored = writer.commit()
+        act = self.repository.update(
+            id,
+            {
+                "pdf_sha256": stored.key,
+                "pdf_size": stored.size,
+                "pdf_filename": filename,
+            },
+        )
+        if previous != stored.key:
+            self._release_pdf(previous)
+        return act
+
+    def detach_pdf(self, id: UUID) -> Act | None:
+        act = self.repository.get_by_id(id)
+        if not act:
+            return None
+        previous = act.pdf_sha256
+        act = self.repository.update(
+            id, {"pdf_sha256": None, "pdf_size": None, "pdf_filename": None}
+        )
+        self._release_pdf(previous)
+        return act
+
+    def _release_pdf(self, sha256: str | None) -> None:
+        # Identical PDFs are stored once: delete only when no act uses it,
+        # holding the references locked so an attach cannot interleave
+        if not sha256:
+            return
+        if not self.repository.lock_pdf_references(sha256):
+            self.storage.delete(sha256)
+        self.repository.session.commit()
+
     def count(self, search: str | None = None) -> int:
         return self.repository.count(search)
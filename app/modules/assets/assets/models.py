@@ -1,11 +1,17 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List, Optional
 from uuid import UUID
 
+from sqlalchemy import ColumnElement, Index, String, func, literal_column
 from sqlmodel import Field, Relationship
 
 from app.models.base_model import BaseModel
-from app.models.mixins import AuditMixin
+from app.models.mixins import (
+    AuditMixin,
+    SoftDeleteMixin,
+    VersionMixin,
+    live_rows_index,
+)
 from app.modules.assets.acts.models import AssetActLink
 
 if TYPE_CHECKING:
@@ -13,10 +19,16 @@ if TYPE_CHECKING:
     from app.modules.assets.areas.models import Area
     from app.modules.assets.groups.models import AssetGroup
     from app.modules.assets.statuses.models import AssetStatus
+    from app.modules.core.org_units.models import OrgUnit
+    from app.modules.core.staff.models import Staff
 
 
-class FixedAsset(BaseModel, AuditMixin, table=True):
+class FixedAsset(BaseModel, AuditMixin, SoftDeleteMixin, VersionMixin, table=True):
     __tablename__ = "assets_fixed_asset"
+    __table_args__ = (
+        live_rows_index("ix_assets_fixed_asset_live_org_unit_id", "org_unit_id"),
+        live_rows_index("ix_assets_fixed_asset_live_area_id", "area_id"),
+    )
 
     old_code: str | None = Field(default=None, index=True, max_length=100)
     new_code: str | None = Field(default=None, index=True, max_length=100)
@@ -45,8 +57,43 @@ class FixedAsset(BaseModel, AuditMixin, table=True):
     group: "AssetGroup" = Relationship(back_populates="fixed_assets")
     status: "AssetStatus" = Relationship(back_populates="fixed_assets")
     area: "Area" = Relationship(back_populates="fixed_assets")
+    org_unit: "OrgUnit" = Relationship()
+    assigned_staff: Optional["Staff"] = Relationship(
+        sa_relationship_kwargs={"foreign_keys": "[FixedAsset.assigned_staff_id]"}
+    )
+    custodian_staff: Optional["Staff"] = Relationship(
+        sa_relationship_kwargs={"foreign_keys": "[FixedAsset.custodian_staff_id]"}
+    )
 
     # Acts relationship (M2M)
     acts: List["Act"] = Relationship(
         back_populates="fixed_assets", link_model=AssetActLink
     )
+
+
+# Scanner lookups: codes compare case-insensitively, ignoring spaces and dashes
+CODE_FIELDS = ("new_code", "old_code", "serial_number")
+
+
+def normalize_code(value: str) -> str:
+    """Python twin of ``normalized_code``: both must produce the same string."""
+    return value.replace(" ", "").replace("-", "").upper()
+
+
+def normalized_code(column: Any) -> ColumnElement[str]:
+    # Inline literals, not bound parameters: the planner only uses the index
+    # when the query expression is textually the indexed one
+    space, dash, empty = (literal_column(f"'{c}'", String) for c in (" ", "-", ""))
+    return func.upper(func.replace(func.replace(column, space, empty), dash, empty))
+
+
+# Expression indexes: a lookup by normalized code is an index probe. The
+# literal operands keep Index() from inferring its table, so it is attached
+# explicitly (otherwise create_all and autogenerate never see it)
+for _field in CODE_FIELDS:
+    FixedAsset.__table__.append_constraint(  # type: ignore[attr-defined]
+        Index(
+            f"ix_assets_fixed_asset_{_field}_norm",
+            normalized_code(FixedAsset.__table__.c[_field]),  # type: ignore[attr-defined]
+        )
+    )
@@ -1,11 +1,151 @@
-from sqlmodel import Session
+from typing import Any
+from uuid import UUID
 
-from app.core.repository import BaseRepository
-from app.modules.assets.assets.models import FixedAsset
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import joinedload, raiseload
+from sqlmodel import Session, col
+
+from app.core.repository import BaseRepository, LoadingProfiles
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import CODE_FIELDS, FixedAsset, normalized_code
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.staff.models import Staff
+
+
+def _named_relations() -> tuple[Any, ...]:
+    # Every relation is many-to-one: joined into the main query, so a page of
+    # assets is a single SELECT. Related rows only project the names shown.
+    return (
+        joinedload(FixedAsset.group, innerjoin=True).load_only(AssetGroup.name),  # type: ignore[arg-type]
+        joinedload(FixedAsset.status, innerjoin=True).load_only(AssetStatus.name),  # type: ignore[arg-type]
+        joinedload(FixedAsset.area, innerjoin=True)  # type: ignore[arg-type]
+        .load_only(Area.name, Area.institution_id)  # type: ignore[arg-type]
+        .joinedload(Area.institution, innerjoin=True)  # type: ignore[arg-type]
+        .load_only(Institution.name),  # type: ignore[arg-type]
+        joinedload(FixedAsset.org_unit, innerjoin=True).load_only(OrgUnit.name),  # type: ignore[arg-type]
+        joinedload(FixedAsset.assigned_staff).load_only(Staff.full_name),  # type: ignore[arg-type]
+        joinedload(FixedAsset.custodian_staff).load_only(Staff.full_name),  # type: ignore[arg-type]
+    )
+
+
+# Same data as the "list" profile as flat rows (get_all_rows)
+# Core table aliases: aliased() would configure the mappers at import time
+_AssignedStaff = Staff.__table__.alias("assigned_staff")  # type: ignore[attr-defined]
+_CustodianStaff = Staff.__table__.alias("custodian_staff")  # type: ignore[attr-defined]
+_ROW_COLUMNS = (
+    *FixedAsset.__table__.columns,  # type: ignore[attr-defined]
+    col(AssetGroup.id).label("group__id"),
+    col(AssetGroup.name).label("group__name"),
+    col(AssetStatus.id).label("status__id"),
+    col(AssetStatus.name).label("status__name"),
+    col(Area.id).label("area__id"),
+    col(Area.name).label("area__name"),
+    col(Institution.id).label("area__institution__id"),
+    col(Institution.name).label("area__institution__name"),
+    col(OrgUnit.id).label("org_unit__id"),
+    col(OrgUnit.name).label("org_unit__name"),
+    _AssignedStaff.c.id.label("assigned_staff__id"),
+    _AssignedStaff.c.full_name.label("assigned_staff__full_name"),
+    _CustodianStaff.c.id.label("custodian_staff__id"),
+    _CustodianStaff.c.full_name.label("custodian_staff__full_name"),
+)
+_ROW_JOINS = (
+    (AssetGroup, FixedAsset.group_id == AssetGroup.id, False),
+    (AssetStatus, FixedAsset.status_id == AssetStatus.id, False),
+    (Area, FixedAsset.area_id == Area.id, False),
+    (Institution, Area.institution_id == Institution.id, False),
+    (OrgUnit, FixedAsset.org_unit_id == OrgUnit.id, False),
+    (_AssignedStaff, FixedAsset.assigned_staff_id == _AssignedStaff.c.id, True),
+    (_CustodianStaff, FixedAsset.custodian_staff_id == _CustodianStaff.c.id, True),
+)
 
 
 class FixedAssetRepository(BaseRepository[FixedAsset]):
     searchable_fields = ["name", "code_saf", "serial_number", "model"]
+    selectable_fields = [
+        "id",
+        "old_code",
+        "new_code",
+        "description",
+        "serial_number",
+        "location_detail",
+        "observations",
+        "is_saf",
+        "is_physically_verified",
+        "is_decommissioned",
+        "registered_at",
+        "source_files",
+        "group_id",
+        "status_id",
+        "area_id",
+        "org_unit_id",
+        "assigned_staff_id",
+        "custodian_staff_id",
+    ]
+    row_columns = _ROW_COLUMNS
+    row_joins = _ROW_JOINS
+
+    @classmethod
+    def loading_profiles(cls) -> LoadingProfiles:
+        named_relations = _named_relations()
+        return {
+            "list": named_relations,
+            # Single row: full related rows are cheap
+            "detail": (
+                joinedload(FixedAsset.group),  # type: ignore[arg-type]
+                joinedload(FixedAsset.status),  # type: ignore[arg-type]
+                joinedload(FixedAsset.area).joinedload(Area.institution),  # type: ignore[arg-type]
+                joinedload(FixedAsset.org_unit),  # type: ignore[arg-type]
+                joinedload(FixedAsset.assigned_staff),  # type: ignore[arg-type]
+                joinedload(FixedAsset.custodian_staff),  # type: ignore[arg-type]
+            ),
+            # Large reads: anything outside the profile fails loudly instead
+            # of issuing one lazy load per row
+            "export": (*named_relations, raiseload("*")),
+        }
 
     def __init__(self, session: Session):
         super().__init__(session, FixedAsset)
+
+    def count_by(self, field: str, filters: list) -> dict[Any, int]:
+        column = getattr(FixedAsset, field)
+        statement = select(column, func.count()).where(*filters).group_by(column)
+        return dict(self.session.execute(statement).tuples().all())
+
+    def lookup_codes(
+        self, codes: list[str]
+    ) -> list[tuple[FixedAsset, dict[str, str | None]]]:
+        """
+        Assets whose normalized new_code, old_code or serial_number is among
+        ``codes`` (already normalized), each with its normalized values. Every
+        branch of the OR is a probe on an expression index.
+        """
+        columns = [
+            normalized_code(getattr(FixedAsset, field)).label(f"{field}_norm")
+            for field in CODE_FIELDS
+        ]
+        statement = select(FixedAsset, *columns).where(
+            col(FixedAsset.deleted_at).is_(None),
+            or_(*(column.in_(codes) for column in columns)),
+        )
+        return [
+            (asset, dict(zip(CODE_FIELDS, values, strict=True)))
+            for asset, *values in self.session.execute(statement).all()
+        ]
+
+    def update_where(self, filters: list, values: dict[str, Any]) -> list[UUID]:
+        """
+        Set-based UPDATE of every asset matching ``filters``; returns the ids
+        it touched. Bypasses the flush hooks: callers record the audit. The
+        row version is bumped as an ORM update would.
+        """
+        statement = (
+            update(FixedAsset)
+            .where(*filters)
+            .values({**values, "version_id": FixedAsset.version_id + 1})
+            .returning(col(FixedAsset.id))
+        )
+        return list(self.session.exec(statement).scalars())
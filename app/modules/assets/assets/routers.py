@@ -1,15 +1,26 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response
 
 from app.auth.permissions import PermissionAction, PermissionChecker
 from app.auth.schemas import UserModulePermission
+from app.core.audit.history import EntityHistoryService
+from app.core.concurrency import IfMatchDep, set_version_etag
 from app.core.db import SessionDep
 from app.core.exceptions import NotFoundException
+from app.core.export import ExportFormat, export_response, schema_columns
+from app.core.fieldsets import fieldset_response
+from app.core.serialization import json_response
 from app.modules.assets.assets.models import FixedAsset
 from app.modules.assets.assets.schemas import (
+    AssetTransfer,
+    AssetTransferResult,
+    CodeLookup,
+    CodeLookupResult,
     FixedAssetCreate,
     FixedAssetRead,
+    FixedAssetReadDetailed,
     FixedAssetUpdate,
 )
 from app.modules.assets.assets.service import FixedAssetService
@@ -17,6 +28,8 @@ from app.modules.assets.constants import AssetsModuleSlug
 
 router = APIRouter(prefix="/assets", tags=["Assets - Fixed Assets"])
 
+HISTORY_INCOMPLETE_HEADER = "X-History-Incomplete"
+
 
 @router.post("/", response_model=FixedAssetRead)
 def create_asset(
@@ -33,7 +46,47 @@ def create_asset(
     return service.create(FixedAsset(**data.model_dump()))
 
 
-@router.get("/", response_model=list[FixedAssetRead])
+@router.post("/transfer", response_model=AssetTransferResult)
+def transfer_assets(
+    session: SessionDep,
+    data: AssetTransfer,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    """
+    Transferencia masiva respaldada por un acta: reasigna unidad y/o personal
+    de los activos indicados (`asset_ids` o `filter`) y los vincula al acta
+    `act_number` (se crea si no existe), en una sola transacción.
+    """
+    service = FixedAssetService(session)
+    return service.transfer(data)
+
+
+@router.post("/lookup", response_model=list[CodeLookupResult])
+def lookup_assets(
+    session: SessionDep,
+    data: CodeLookup,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """
+    Búsqueda por lote de códigos escaneados (`new_code`, `old_code` o
+    `serial_number`), sin distinguir mayúsculas, espacios ni guiones. Un
+    resultado por código distinto, en el orden enviado.
+    """
+    service = FixedAssetService(session)
+    return service.lookup(data.codes)
+
+
+@router.get("/", response_model=list[FixedAssetReadDetailed])
 def get_assets(
     session: SessionDep,
     offset: int = 0,
@@ -41,6 +94,12 @@ def get_assets(
     sort_by: str | None = Query(None),
     sort_order: str = Query("asc"),
     search: str | None = Query(None),
+    org_unit_subtree_id: UUID | None = Query(
+        None, description="Unidad raíz: incluye todas sus dependencias"
+    ),
+    fields: str | None = Query(
+        None, description="Columnas separadas por coma (sparse fieldset)"
+    ),
     _: UserModulePermission = Depends(
         PermissionChecker(
             module_slug=AssetsModuleSlug.GENERAL,
@@ -49,13 +108,46 @@ def get_assets(
     ),
 ):
     service = FixedAssetService(session)
-    return service.get_all(offset, limit, sort_by, sort_order, search)
+    selected = service.parse_fields(fields)
+    if selected:
+        field_rows = service.get_all_fields(
+            selected, offset, limit, sort_by, sort_order, search, org_unit_subtree_id
+        )
+        return fieldset_response(FixedAssetRead, selected, field_rows)
+    rows = service.get_all_rows(
+        offset, limit, sort_by, sort_order, search, org_unit_subtree_id
+    )
+    return json_response(list[FixedAssetReadDetailed], rows)
 
 
 @router.get("/count")
 def count_assets(
     session: SessionDep,
     search: str | None = Query(None),
+    org_unit_subtree_id: UUID | None = Query(
+        None, description="Unidad raíz: incluye todas sus dependencias"
+    ),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    service = FixedAssetService(session)
+    return {"total": service.count(search, org_unit_subtree_id)}
+
+
+@router.get("/export")
+def export_assets(
+    session: SessionDep,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    sort_by: str | None = Query(None),
+    sort_order: str = Query("asc"),
+    search: str | None = Query(None),
+    org_unit_subtree_id: UUID | None = Query(
+        None, description="Unidad raíz: incluye todas sus dependencias"
+    ),
     _: UserModulePermission = Depends(
         PermissionChecker(
             module_slug=AssetsModuleSlug.GENERAL,
@@ -63,13 +155,50 @@ def count_assets(
         )
     ),
 ):
+    """
+    Exporta todos los activos que cumplen la búsqueda y los filtros del
+    listado, en streaming (CSV, NDJSON o XLSX) sin paginación.
+    """
     service = FixedAssetService(session)
-    return {"total": service.count(search)}
+    batches = service.export_batches(sort_by, sort_order, search, org_unit_subtree_id)
+    return export_response(
+        batches, schema_columns(FixedAssetReadDetailed), export_format, "fixed_assets"
+    )
+
+
+@router.get("/as-of", response_model=list[FixedAssetRead])
+def get_assets_as_of(
+    session: SessionDep,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    as_of: datetime = Query(..., description="Fecha de corte del inventario"),
+    offset: int = 0,
+    limit: int = 100,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """
+    Inventario a una fecha de corte: reconstruye los activos tal como estaban
+    en `as_of` a partir del historial de auditoría. Si algún cambio masivo del
+    intervalo no se pudo reproducir, responde `X-History-Incomplete: true`.
+    """
+    history = EntityHistoryService(session)
+    assets = FixedAssetService(session).get_all_as_of(as_of, offset, limit, history)
+    if not history.complete:
+        response.headers[HISTORY_INCOMPLETE_HEADER] = "true"
+    # Replay checkpoints are written after the response, never by the read
+    history.schedule_snapshots(background_tasks)
+    return assets
 
 
-@router.get("/{id}", response_model=FixedAssetRead)
+@router.get("/{id}", response_model=FixedAssetReadDetailed)
 def get_asset(
     session: SessionDep,
+    response: Response,
     id: UUID,
     _: UserModulePermission = Depends(
         PermissionChecker(
@@ -82,14 +211,17 @@ def get_asset(
     asset = service.get_by_id(id)
     if not asset:
         raise NotFoundException(detail="Asset not found")
+    set_version_etag(response, asset.version_id)
     return asset
 
 
 @router.patch("/{id}", response_model=FixedAssetRead)
 def update_asset(
     session: SessionDep,
+    response: Response,
     id: UUID,
     data: FixedAssetUpdate,
+    if_match: IfMatchDep,
     _: UserModulePermission = Depends(
         PermissionChecker(
             module_slug=AssetsModuleSlug.GENERAL,
@@ -97,10 +229,15 @@ def update_asset(
         )
     ),
 ):
+    """
+    Actualización parcial. Con ``If-Match`` (el ETag del GET) solo se aplica
+    si nadie modificó el activo desde esa lectura; si no, responde 409.
+    """
     service = FixedAssetService(session)
-    asset = service.update(id, data.model_dump(exclude_unset=True))
+    asset = service.update(id, data.model_dump(exclude_unset=True), if_match)
     if not asset:
         raise NotFoundException(detail="Asset not found")
+    set_version_etag(response, asset.version_id)
     return asset
 
 
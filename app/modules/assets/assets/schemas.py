@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Self
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 
 class FixedAssetBase(BaseModel):
@@ -50,3 +51,140 @@ class FixedAssetUpdate(BaseModel):
 
 class FixedAssetRead(FixedAssetBase):
     id: UUID
+    # Versión de la fila (ETag); ausente en estados históricos anteriores
+    version_id: int | None = None
+
+
+class RelatedName(BaseModel):
+    id: UUID
+    name: str
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AreaWithInstitution(RelatedName):
+    institution: RelatedName | None = None
+
+
+class StaffName(BaseModel):
+    id: UUID
+    full_name: str
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FixedAssetReadDetailed(FixedAssetRead):
+    # Relaciones cargadas por el perfil del repositorio; solo se exponen nombres
+    group_detail: RelatedName | None = Field(None, alias="group", exclude=True)
+    status_detail: RelatedName | None = Field(None, alias="status", exclude=True)
+    area_detail: AreaWithInstitution | None = Field(None, alias="area", exclude=True)
+    org_unit_detail: RelatedName | None = Field(None, alias="org_unit", exclude=True)
+    assigned_staff_detail: StaffName | None = Field(
+        None, alias="assigned_staff", exclude=True
+    )
+    custodian_staff_detail: StaffName | None = Field(
+        None, alias="custodian_staff", exclude=True
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def group_name(self) -> str | None:
+        return self.group_detail.name if self.group_detail else None
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def status_name(self) -> str | None:
+        return self.status_detail.name if self.status_detail else None
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def area_name(self) -> str | None:
+        return self.area_detail.name if self.area_detail else None
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def institution_name(self) -> str | None:
+        if not self.area_detail or not self.area_detail.institution:
+            return None
+        return self.area_detail.institution.name
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def org_unit_name(self) -> str | None:
+        return self.org_unit_detail.name if self.org_unit_detail else None
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def assigned_staff_name(self) -> str | None:
+        if not self.assigned_staff_detail:
+            return None
+        return self.assigned_staff_detail.full_name
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def custodian_staff_name(self) -> str | None:
+        if not self.custodian_staff_detail:
+            return None
+        return self.custodian_staff_detail.full_name
+
+
+class AssetTransferTarget(BaseModel):
+    # Solo se escriben los campos enviados: null explícito libera la asignación
+    org_unit_id: UUID | None = None
+    assigned_staff_id: UUID | None = None
+    custodian_staff_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> Self:
+        if not self.model_fields_set:
+            raise ValueError("The transfer target is empty")
+        if "org_unit_id" in self.model_fields_set and self.org_unit_id is None:
+            raise ValueError("org_unit_id cannot be null")
+        return self
+
+
+class AssetTransferFilter(BaseModel):
+    org_unit_id: UUID | None = None
+    org_unit_subtree_id: UUID | None = None
+    area_id: UUID | None = None
+    group_id: UUID | None = None
+    status_id: UUID | None = None
+    assigned_staff_id: UUID | None = None
+    custodian_staff_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> Self:
+        if not any(value is not None for value in self.model_dump().values()):
+            raise ValueError("The filter must set at least one criterion")
+        return self
+
+
+class AssetTransfer(BaseModel):
+    act_number: str = Field(max_length=100)
+    registered_at: datetime | None = None
+    asset_ids: list[UUID] | None = None
+    filter: AssetTransferFilter | None = None
+    target: AssetTransferTarget
+
+    @model_validator(mode="after")
+    def check_selection(self) -> Self:
+        if (self.asset_ids is None) == (self.filter is None):
+            raise ValueError("Send either asset_ids or filter")
+        if self.asset_ids is not None and not self.asset_ids:
+            raise ValueError("asset_ids is empty")
+        return self
+
+
+class AssetTransferResult(BaseModel):
+    act_id: UUID
+    act_number: str
+    transferred: int
+
+
+class CodeLookup(BaseModel):
+    codes: list[str] = Field(min_length=1, max_length=500)
+
+
+class CodeLookupResult(BaseModel):
+    code: str
+    # Campo que coincidió: new_code, old_code o serial_number (None si no hay)
+    matched_by: str | None = None
+    assets: list[FixedAssetRead]
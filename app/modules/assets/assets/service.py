@@ -1,16 +1,74 @@
-from typing import Sequence
+from datetime import datetime
+from typing import Any, Iterator, Sequence
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlalchemy import RowMapping
+from sqlmodel import Session, col, select
 
-from app.modules.assets.assets.models import FixedAsset
+from app.core.audit import get_audit_user_id, record_bulk_changes, system_job
+from app.core.audit.history import EntityHistoryService, register_summary_members
+from app.core.audit.hooks import id_digest
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.core.export import Batch, serialize_batches
+from app.core.fieldsets import parse_fields
+from app.modules.assets.acts.models import Act
+from app.modules.assets.acts.repository import ActRepository
+from app.modules.assets.assets.models import CODE_FIELDS, FixedAsset, normalize_code
 from app.modules.assets.assets.repository import FixedAssetRepository
+from app.modules.assets.assets.schemas import (
+    AssetTransfer,
+    AssetTransferFilter,
+    AssetTransferResult,
+    CodeLookupResult,
+    FixedAssetReadDetailed,
+)
+from app.modules.assets.summary.counters import apply_deltas, shift_deltas
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.org_units.repository import OrgUnitRepository
+from app.modules.core.staff.models import Staff
+from app.util.datetime import get_current_time
+
+TRANSFER_JOB_NAME = "asset_transfer"
+
+
+def _transferred_assets(session: Session, changes: dict[str, Any]) -> set[str] | None:
+    """
+    Assets of a transfer summary: those linked to its act, as long as the
+    act's links are exactly the ones the transfer wrote.
+    """
+    act_id = changes.get("act_id")
+    if not act_id:
+        return None
+    ids = {str(id) for id in ActRepository(session).get_asset_ids(UUID(act_id))}
+    return ids if id_digest(ids) == changes.get("ids") else None
+
+
+register_summary_members(TRANSFER_JOB_NAME, _transferred_assets)
 
 
 class FixedAssetService:
     def __init__(self, session: Session):
         self.repository = FixedAssetRepository(session)
 
+    def _build_filters(self, org_unit_subtree_id: UUID | None = None) -> list:
+        filters = []
+        if org_unit_subtree_id:
+            filters.append(
+                col(FixedAsset.org_unit_id).in_(
+                    OrgUnitRepository.subtree_ids(org_unit_subtree_id)
+                )
+            )
+        return filters
+
+    def _transfer_filters(self, criteria: AssetTransferFilter) -> list:
+        filters = self._build_filters(criteria.org_unit_subtree_id)
+        for name, value in criteria.model_dump(
+            exclude={"org_unit_subtree_id"}, exclude_none=True
+        ).items():
+            filters.append(getattr(FixedAsset, name) == value)
+        return filters
+
     def create(self, data: FixedAsset) -> FixedAsset:
         return self.repository.create(data)
 
@@ -21,17 +79,207 @@ class FixedAssetService:
         sort_by: str | None = None,
         sort_order: str = "asc",
         search: str | None = None,
+        org_unit_subtree_id: UUID | None = None,
     ) -> Sequence[FixedAsset]:
-        return self.repository.get_all(offset, limit, sort_by, sort_order, search)
+        filters = self._build_filters(org_unit_subtree_id)
+        return self.repository.get_all(
+            offset,
+            limit,
+            sort_by,
+            sort_order,
+            search,
+            extra_filters=filters,
+            profile="list",
+        )
+
+    def get_all_rows(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        search: str | None = None,
+        org_unit_subtree_id: UUID | None = None,
+    ) -> list[dict[str, Any]]:
+        """``get_all`` as plain nested rows (no ORM objects) for the list API."""
+        filters = self._build_filters(org_unit_subtree_id)
+        return self.repository.get_all_rows(
+            offset, limit, sort_by, sort_order, search, extra_filters=filters
+        )
+
+    def parse_fields(self, fields: str | None) -> tuple[str, ...] | None:
+        return parse_fields(fields, self.repository.selectable_fields)
+
+    def get_all_fields(
+        self,
+        fields: tuple[str, ...],
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        search: str | None = None,
+        org_unit_subtree_id: UUID | None = None,
+    ) -> Sequence[RowMapping]:
+        filters = self._build_filters(org_unit_subtree_id)
+        return self.repository.get_all_fields(
+            fields, offset, limit, sort_by, sort_order, search, extra_filters=filters
+        )
+
+    def export_batches(
+        self,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        search: str | None = None,
+        org_unit_subtree_id: UUID | None = None,
+    ) -> Iterator[Batch]:
+        filters = self._build_filters(org_unit_subtree_id)
+        batches = self.repository.stream_all(
+            sort_by,
+            sort_order,
+            search,
+            extra_filters=filters,
+            profile="export",
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+        return serialize_batches(batches, FixedAssetReadDetailed)
+
+    def lookup(self, codes: list[str]) -> list[CodeLookupResult]:
+        """
+        Resolves scanned codes in one query. For each code the assets matching
+        the first field that hits (new_code, then old_code, then
+        serial_number) are returned; several assets mean an ambiguous code.
+        """
+        normalized = {code: normalize_code(code) for code in codes}
+        index: dict[tuple[str, str | None], list[FixedAsset]] = {}
+        for asset, values in self.repository.lookup_codes(
+            sorted(set(normalized.values()))
+        ):
+            for field, value in values.items():
+                index.setdefault((field, value), []).append(asset)
+        results = []
+        for code, key in normalized.items():
+            matched = next((f for f in CODE_FIELDS if (f, key) in index), None)
+            results.append(
+                CodeLookupResult.model_validate(
+                    {
+                        "code": code,
+                        "matched_by": matched,
+                        "assets": index[(matched, key)] if matched else [],
+                    },
+                    from_attributes=True,
+                )
+            )
+        return results
 
     def get_by_id(self, id: UUID) -> FixedAsset | None:
-        return self.repository.get_by_id(id)
+        return self.repository.get_by_id(id, profile="detail")
 
-    def update(self, id: UUID, data: dict) -> FixedAsset | None:
-        return self.repository.update(id, data)
+    def update(
+        self, id: UUID, data: dict, expected_version: int | None = None
+    ) -> FixedAsset | None:
+        return self.repository.update(id, data, expected_version)
 
     def delete(self, id: UUID) -> bool:
         return self.repository.delete(id)
 
-    def count(self, search: str | None = None) -> int:
-        return self.repository.count(search)
+    def count(
+        self, search: str | None = None, org_unit_subtree_id: UUID | None = None
+    ) -> int:
+        filters = self._build_filters(org_unit_subtree_id)
+        return self.repository.count(search, extra_filters=filters)
+
+    def get_all_as_of(
+        self,
+        as_of: datetime,
+        offset: int = 0,
+        limit: int = 100,
+        history: EntityHistoryService | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Point-in-time inventory: assets as they were at ``as_of``, rebuilt
+        from the audit history. Assets deleted by then are left out before
+        paginating, so pages stay full. Pass ``history`` to schedule the
+        replay checkpoints it earns.
+        """
+        entity_type = FixedAsset.__name__
+        history = history or EntityHistoryService(self.repository.session)
+        ids = history.get_entity_ids_as_of(entity_type, as_of, offset, limit)
+        states = history.get_states_as_of(entity_type, as_of, ids)
+        return [states[entity_id] for entity_id in ids if entity_id in states]
+
+    def transfer(self, data: AssetTransfer) -> AssetTransferResult:
+        """
+        Reassigns a set of assets (explicit ids or a filter) and links them to
+        an act, in one transaction: one UPDATE, one bulk insert of links and
+        a summarized audit entry. The act is created if it does not exist.
+        """
+        session = self.repository.session
+        values = data.target.model_dump(exclude_unset=True)
+        for name, model in (
+            ("org_unit_id", OrgUnit),
+            ("assigned_staff_id", Staff),
+            ("custodian_staff_id", Staff),
+        ):
+            if not values.get(name):
+                continue
+            target = session.get(model, values[name])
+            if not target or getattr(target, "deleted_at", None):
+                raise BadRequestException(detail=f"Target {name} not found")
+
+        if data.asset_ids is not None:
+            asset_ids = set(data.asset_ids)
+            filters = [col(FixedAsset.id).in_(asset_ids)]
+        else:
+            filters = self._transfer_filters(data.filter)  # type: ignore[arg-type]
+        # Soft-deleted assets are never transferred (explicit ids: "not found")
+        filters.append(col(FixedAsset.deleted_at).is_(None))
+
+        with system_job(TRANSFER_JOB_NAME):
+            try:
+                act = session.exec(
+                    select(Act).where(Act.act_number == data.act_number)
+                ).first()
+                if act and act.deleted_at:
+                    raise BadRequestException(
+                        detail=f"Act {data.act_number} has been deleted"
+                    )
+                if not act:
+                    act = Act(
+                        act_number=data.act_number,
+                        registered_at=data.registered_at or get_current_time(),
+                    )
+                    session.add(act)
+                    session.flush()
+                # Summary counters: Core UPDATEs skip the mapper events
+                moved = (
+                    self.repository.count_by("org_unit_id", filters)
+                    if "org_unit_id" in values
+                    else {}
+                )
+                applied = {**values, "updated_by_id": get_audit_user_id()}
+                ids = self.repository.update_where(filters, applied)
+                if data.asset_ids is not None and len(ids) != len(asset_ids):
+                    missing = sorted(str(id) for id in asset_ids - set(ids))
+                    raise BadRequestException(
+                        detail=f"Assets not found: {', '.join(missing)}"
+                    )
+                ActRepository(session).link_assets(act.id, ids)
+                apply_deltas(
+                    session.connection(),
+                    shift_deltas("org_unit_id", moved, values.get("org_unit_id")),
+                )
+                record_bulk_changes(
+                    session,
+                    FixedAsset.__name__,
+                    {"UPDATE": len(ids)},
+                    ids,
+                    applied,
+                    act_id=act.id,
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return AssetTransferResult(
+            act_id=act.id, act_number=act.act_number, transferred=len(ids)
+        )
@@ -0,0 +1,89 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import DateTime, Field, SQLModel
+
+from app.models.base_model import BaseModel
+from app.util.datetime import get_current_time
+
+
+class AssetImportStatus:
+    VALIDATED = "VALIDATED"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class AssetImport(BaseModel, table=True):
+    """
+    One uploaded spreadsheet. Rows are staged and validated first
+    (``VALIDATED``); committing merges the valid ones into the inventory.
+    """
+
+    __tablename__ = "assets_import"
+
+    filename: str = Field(max_length=255)
+    status: str = Field(default=AssetImportStatus.VALIDATED, max_length=20)
+    total_rows: int = Field(default=0)
+    valid_rows: int = Field(default=0)
+    error_rows: int = Field(default=0)
+    to_insert: int = Field(default=0)
+    to_update: int = Field(default=0)
+    error: str | None = Field(default=None)
+    triggered_by: str | None = Field(default=None, max_length=100)
+    created_at: datetime = Field(
+        default_factory=get_current_time,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+        index=True,
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+    )
+
+
+class AssetImportRow(SQLModel, table=True):
+    """
+    Staging row: the spreadsheet values as read, the ids their references
+    resolved to, and the validation errors. Loaded with COPY and validated
+    with set-based statements before anything touches ``assets_fixed_asset``.
+    """
+
+    __tablename__ = "assets_import_row"
+
+    import_id: UUID = Field(foreign_key="assets_import.id", primary_key=True)
+    row_number: int = Field(primary_key=True)
+
+    # Values as read (typed where parsing succeeded)
+    old_code: str | None = None
+    new_code: str | None = None
+    description: str | None = None
+    serial_number: str | None = None
+    location_detail: str | None = None
+    observations: str | None = None
+    is_saf: bool | None = None
+    is_physically_verified: bool | None = None
+    is_decommissioned: bool | None = None
+    registered_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+    )
+    source_files: str | None = None
+    group: str | None = None
+    status: str | None = None
+    area: str | None = None
+    org_unit: str | None = None
+    assigned_staff: str | None = None
+    custodian_staff: str | None = None
+
+    # Resolved references
+    group_id: UUID | None = None
+    status_id: UUID | None = None
+    area_id: UUID | None = None
+    org_unit_id: UUID | None = None
+    assigned_staff_id: UUID | None = None
+    custodian_staff_id: UUID | None = None
+
+    # Target asset: an existing one matched by new_code, or a fresh id
+    asset_id: UUID
+    is_new: bool = Field(default=True)
+    errors: str | None = None
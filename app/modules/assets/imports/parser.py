@@ -0,0 +1,187 @@
+"""
+Lectura en streaming de planillas de activos (CSV o XLSX).
+
+Las filas se entregan una a una como diccionarios de texto, indexados por los
+nombres de columna de `IMPORT_COLUMNS`; la conversión de tipos y la
+resolución de referencias ocurren al cargar la tabla de staging. Ninguno de
+los dos formatos se lee completo en memoria: el CSV se recorre línea a línea
+y la hoja XLSX se procesa con `iterparse`, liberando cada fila leída.
+"""
+
+import csv
+import io
+import itertools
+import re
+import zipfile
+from collections.abc import Iterator
+from typing import BinaryIO
+from xml.etree import ElementTree
+
+from app.core.exceptions import BadRequestException
+
+IMPORT_COLUMNS = (
+    "old_code",
+    "new_code",
+    "description",
+    "serial_number",
+    "location_detail",
+    "observations",
+    "is_saf",
+    "is_physically_verified",
+    "is_decommissioned",
+    "registered_at",
+    "source_files",
+    "group",
+    "status",
+    "area",
+    "org_unit",
+    "assigned_staff",
+    "custodian_staff",
+)
+REQUIRED_COLUMNS = ("description", "group", "status", "area", "org_unit")
+
+type RawRow = dict[str, str | None]
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def read_rows(stream: BinaryIO, filename: str) -> Iterator[tuple[int, RawRow]]:
+    """
+    Yields ``(row_number, values)`` for every non-empty data row. Row numbers
+    are the spreadsheet's own (CSV line, XLSX row) so errors can be located.
+    """
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        rows = _csv_rows(stream)
+    elif extension == "xlsx":
+        rows = _xlsx_rows(stream)
+    else:
+        raise BadRequestException(detail="Unsupported file type: use .csv or .xlsx")
+
+    first = next(rows, None)
+    if first is None:
+        raise BadRequestException(detail="The file is empty")
+    columns = _map_header(first[1])
+    for row_number, values in rows:
+        cells = [value.strip() if value else None for value in values]
+        if not any(cells):
+            continue
+        yield (
+            row_number,
+            {
+                name: cells[index] if index < len(cells) else None
+                for index, name in columns
+            },
+        )
+
+
+def _map_header(header: list[str | None]) -> list[tuple[int, str]]:
+    names = [re.sub(r"\s+", "_", (cell or "").strip().lower()) for cell in header]
+    unknown = sorted({name for name in names if name and name not in IMPORT_COLUMNS})
+    if unknown:
+        raise BadRequestException(
+            detail=f"Unknown columns: {', '.join(unknown)}. "
+            f"Allowed: {', '.join(IMPORT_COLUMNS)}"
+        )
+    missing = [name for name in REQUIRED_COLUMNS if name not in names]
+    if missing:
+        raise BadRequestException(
+            detail=f"Missing required columns: {', '.join(missing)}"
+        )
+    return [(index, name) for index, name in enumerate(names) if name]
+
+
+def _csv_rows(stream: BinaryIO) -> Iterator[tuple[int, list[str | None]]]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        first = text.readline()
+        # Legacy spreadsheets are often exported with ";" separators
+        delimiter = max(",;\t", key=first.count)
+        reader = csv.reader(itertools.chain([first], text), delimiter=delimiter)
+        for values in reader:
+            yield reader.line_num, list(values)
+    except UnicodeDecodeError:
+        raise BadRequestException(detail="CSV files must be UTF-8 encoded") from None
+    finally:
+        # Closed already when the caller's stream was closed before the
+        # generator was finalized
+        if not text.closed:
+            text.detach()
+
+
+def _xlsx_rows(stream: BinaryIO) -> Iterator[tuple[int, list[str | None]]]:
+    try:
+        package = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile:
+        raise BadRequestException(detail="Invalid XLSX file") from None
+    with package:
+        shared = _shared_strings(package)
+        with package.open(_first_sheet(package)) as sheet:
+            number = 0
+            for _, element in ElementTree.iterparse(sheet):
+                if element.tag == f"{_MAIN_NS}row":
+                    # Empty rows may be omitted from the XML: keep their numbers
+                    number = int(element.get("r") or number + 1)
+                    yield number, _row_values(element, shared)
+                    element.clear()
+
+
+def _first_sheet(package: zipfile.ZipFile) -> str:
+    workbook = ElementTree.fromstring(package.read("xl/workbook.xml"))
+    sheet = workbook.find(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet")
+    if sheet is None:
+        raise BadRequestException(detail="The workbook has no sheets")
+    rels = ElementTree.fromstring(package.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+        if rel.get("Id") == sheet.get(f"{_REL_NS}id"):
+            target = rel.get("Target", "")
+            return target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+    raise BadRequestException(detail="Invalid XLSX file")
+
+
+def _shared_strings(package: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in package.namelist():
+        return []
+    strings = []
+    with package.open("xl/sharedStrings.xml") as source:
+        for _, element in ElementTree.iterparse(source):
+            if element.tag == f"{_MAIN_NS}si":
+                strings.append(
+                    "".join(t.text or "" for t in element.iter(f"{_MAIN_NS}t"))
+                )
+                element.clear()
+    return strings
+
+
+def _column_index(reference: str) -> int:
+    index = 0
+    for letter in reference.rstrip("0123456789"):
+        index = index * 26 + ord(letter.upper()) - ord("A") + 1
+    return index - 1
+
+
+def _row_values(row: ElementTree.Element, shared: list[str]) -> list[str | None]:
+    values: list[str | None] = []
+    for cell in row.iter(f"{_MAIN_NS}c"):
+        # Empty cells are omitted from the XML: place values by reference
+        reference = cell.get("r")
+        if reference:
+            values.extend([None] * (_column_index(reference) - len(values)))
+        values.append(_cell_value(cell, shared))
+    return values
+
+
+def _cell_value(cell: ElementTree.Element, shared: list[str]) -> str | None:
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(f"{_MAIN_NS}t"))
+    value = cell.find(f"{_MAIN_NS}v")
+    if value is None or value.text is None:
+        return None
+    if kind == "s":
+        return shared[int(value.text)]
+    if kind == "b":
+        return "true" if value.text == "1" else "false"
+    return value.text
@@ -0,0 +1,14 @@
+from sqlmodel import Session
+
+from app.core.repository import BaseRepository
+from app.modules.assets.imports.models import AssetImport, AssetImportRow
+
+
+class AssetImportRepository(BaseRepository[AssetImport]):
+    def __init__(self, session: Session):
+        super().__init__(session, AssetImport)
+
+
+class AssetImportRowRepository(BaseRepository[AssetImportRow]):
+    def __init__(self, session: Session):
+        super().__init__(session, AssetImportRow)
@@ -0,0 +1,93 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+
+from app.auth.permissions import PermissionAction, PermissionChecker
+from app.auth.schemas import UserModulePermission
+from app.auth.utils import get_current_user
+from app.core.db import SessionDep
+from app.core.exceptions import NotFoundException
+from app.core.export import ExportFormat, export_response, schema_columns
+from app.models.user import User
+from app.modules.assets.constants import AssetsModuleSlug
+from app.modules.assets.imports.schemas import AssetImportErrorRead, AssetImportRead
+from app.modules.assets.imports.service import AssetImportService
+
+router = APIRouter(prefix="/imports", tags=["Assets - Imports"])
+
+
+@router.post("/", response_model=AssetImportRead)
+def stage_import(
+    session: SessionDep,
+    file: UploadFile = File(..., description="Planilla .csv o .xlsx"),
+    current_user: User = Depends(get_current_user),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.CREATE,
+        )
+    ),
+):
+    """
+    Carga y valida una planilla de activos en la tabla de staging, sin tocar
+    el inventario. La respuesta resume filas válidas, con error, a insertar y
+    a actualizar; el detalle de errores está en `GET /imports/{id}/errors`.
+    """
+    service = AssetImportService(session)
+    return service.stage(file.filename or "", file.file, current_user.username)
+
+
+@router.post("/{id}/commit", response_model=AssetImportRead)
+def commit_import(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.CREATE,
+        )
+    ),
+):
+    """Aplica las filas válidas de una importación al inventario."""
+    service = AssetImportService(session)
+    return service.commit(id)
+
+
+@router.get("/{id}", response_model=AssetImportRead)
+def get_import(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    service = AssetImportService(session)
+    asset_import = service.get_by_id(id)
+    if not asset_import:
+        raise NotFoundException(detail="Import not found")
+    return asset_import
+
+
+@router.get("/{id}/errors")
+def get_import_errors(
+    session: SessionDep,
+    id: UUID,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """Reporte de filas rechazadas (número de fila y motivos), en streaming."""
+    service = AssetImportService(session)
+    return export_response(
+        service.stream_errors(id),
+        schema_columns(AssetImportErrorRead),
+        export_format,
+        "import_errors",
+    )
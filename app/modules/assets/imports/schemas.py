@@ -0,0 +1,29 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AssetImportRead(BaseModel):
+    id: UUID
+    filename: str
+    status: str
+    total_rows: int
+    valid_rows: int
+    error_rows: int
+    to_insert: int
+    to_update: int
+    error: str | None = None
+    triggered_by: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AssetImportErrorRead(BaseModel):
+    row_number: int
+    old_code: str | None = None
+    new_code: str | None = None
+    description: str | None = None
+    errors: str | None = None
+    model_config = ConfigDict(from_attributes=True)
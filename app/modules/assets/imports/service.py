@@ -0,0 +1,443 @@
+"""
+Importación masiva de activos fijos desde planillas (CSV / XLSX).
+
+1. **Staging**: la planilla se lee en streaming (`parser.read_rows`); cada
+   fila se tipa y sus referencias (grupo, estado, área, unidad, personal) se
+   resuelven contra mapas nombre → id cargados una sola vez en memoria. Las
+   filas se cargan en `assets_import_row` por lotes con `COPY` (PostgreSQL).
+2. **Validación**: las reglas entre filas y contra el inventario
+   (obligatorios, longitudes, códigos repetidos, activos existentes) son
+   sentencias `UPDATE` set-based sobre el staging, no bucles por fila.
+3. **Merge**: las filas válidas pasan a `assets_fixed_asset` por bloques con
+   `INSERT … SELECT` y `UPDATE … FROM`, con un commit por bloque. Las filas
+   con errores quedan como reporte descargable.
+"""
+
+import contextlib
+import csv
+import io
+import itertools
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO
+from uuid import UUID
+
+import structlog
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Uuid,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlmodel import Session, col
+
+from app.core.audit import get_audit_user_id, record_bulk_changes, system_job
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.core.export import Batch, serialize_batches
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.imports.models import (
+    AssetImport,
+    AssetImportRow,
+    AssetImportStatus,
+)
+from app.modules.assets.imports.parser import RawRow, read_rows
+from app.modules.assets.imports.repository import (
+    AssetImportRepository,
+    AssetImportRowRepository,
+)
+from app.modules.assets.imports.schemas import AssetImportErrorRead
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.assets.summary.counters import rebuild_summary
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.staff.models import Staff
+from app.util.datetime import get_current_time
+
+logger = structlog.get_logger()
+
+IMPORT_JOB_NAME = "asset_import"
+
+TEXT_COLUMNS = (
+    "old_code",
+    "new_code",
+    "description",
+    "serial_number",
+    "location_detail",
+    "observations",
+    "source_files",
+)
+FLAG_COLUMNS = ("is_saf", "is_physically_verified", "is_decommissioned")
+REFERENCE_COLUMNS = (
+    "group",
+    "status",
+    "area",
+    "org_unit",
+    "assigned_staff",
+    "custodian_staff",
+)
+REQUIRED_REFERENCES = ("group", "status", "area", "org_unit")
+
+# Staging columns written into assets_fixed_asset
+MERGE_COLUMNS = (
+    *TEXT_COLUMNS,
+    *FLAG_COLUMNS,
+    "registered_at",
+    *(f"{name}_id" for name in REFERENCE_COLUMNS),
+)
+
+_TRUE = {"1", "true", "si", "sí", "s", "yes", "y", "x"}
+_FALSE = {"0", "false", "no", "n"}
+_DATE_FORMATS = ("%d/%m/%Y", "%d/%m/%Y %H:%M", "%d-%m-%Y")
+# XLSX stores dates as days since 1899-12-30
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def normalize(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+class ReferenceResolver:
+    """
+    Name → id maps for the references a spreadsheet row carries, loaded once
+    per import: resolving 100k rows costs dictionary lookups, not queries.
+    A name shared by several records maps to None (ambiguous).
+    """
+
+    def __init__(self, session: Session):
+        # Only records an asset may still point to: active units, live staff
+        active_unit = col(OrgUnit.is_active).is_(True)
+        org_units = self._load(session, OrgUnit.name, OrgUnit.id, active_unit)
+        # An acronym beats a homonymous name
+        org_units.update(self._load(session, OrgUnit.acronym, OrgUnit.id, active_unit))
+        staff = self._load(
+            session, Staff.document_number, Staff.id, col(Staff.deleted_at).is_(None)
+        )
+        self.maps = {
+            "group": self._load(session, AssetGroup.name, AssetGroup.id),
+            "status": self._load(session, AssetStatus.name, AssetStatus.id),
+            "area": self._load(session, Area.name, Area.id),
+            "org_unit": org_units,
+            "assigned_staff": staff,
+            "custodian_staff": staff,
+        }
+
+    @staticmethod
+    def _load(
+        session: Session, key: Any, id: Any, *filters: ColumnElement[bool]
+    ) -> dict[str, UUID | None]:
+        mapping: dict[str, UUID | None] = {}
+        statement = select(col(key), col(id)).where(*filters)
+        for name, row_id in session.execute(statement).all():
+            if not name:
+                continue
+            name = normalize(name)
+            mapping[name] = None if mapping.get(name, row_id) != row_id else row_id
+        return mapping
+
+    def resolve(self, reference: str, value: str) -> tuple[UUID | None, str | None]:
+        mapping = self.maps[reference]
+        key = normalize(value)
+        if key not in mapping:
+            return None, f"unknown {reference} '{value}'"
+        if mapping[key] is None:
+            return None, f"ambiguous {reference} '{value}'"
+        return mapping[key], None
+
+
+def _parse_flag(name: str, value: str | None, errors: list[str]) -> bool | None:
+    if value is None:
+        return None
+    key = normalize(value)
+    if key in _TRUE:
+        return True
+    if key in _FALSE:
+        return False
+    errors.append(f"invalid {name} '{value}'")
+    return None
+
+
+def _parse_datetime(value: str | None, errors: list[str]) -> datetime | None:
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    try:
+        return _EXCEL_EPOCH + timedelta(days=float(value))
+    except ValueError:
+        errors.append(f"invalid registered_at '{value}'")
+        return None
+
+
+def staging_values(
+    import_id: UUID, row_number: int, raw: RawRow, resolver: ReferenceResolver
+) -> dict[str, Any]:
+    """Typed staging row; per-row problems are collected in ``errors``."""
+    errors: list[str] = []
+    values: dict[str, Any] = {
+        "import_id": import_id,
+        "row_number": row_number,
+        "asset_id": uuid.uuid7(),  # type: ignore[attr-defined]
+        "is_new": True,
+    }
+    for name in TEXT_COLUMNS:
+        values[name] = raw.get(name)
+    for name in FLAG_COLUMNS:
+        values[name] = _parse_flag(name, raw.get(name), errors)
+    values["registered_at"] = _parse_datetime(raw.get("registered_at"), errors)
+    for name in REFERENCE_COLUMNS:
+        value = raw.get(name)
+        values[name] = value
+        values[f"{name}_id"] = None
+        if value is None:
+            if name in REQUIRED_REFERENCES:
+                errors.append(f"{name} is required")
+            continue
+        values[f"{name}_id"], error = resolver.resolve(name, value)
+        if error:
+            errors.append(error)
+    values["errors"] = "; ".join(errors) or None
+    return values
+
+
+class AssetImportService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.repository = AssetImportRepository(session)
+        self.row_repository = AssetImportRowRepository(session)
+
+    def get_by_id(self, id: UUID) -> AssetImport | None:
+        return self.repository.get_by_id(id)
+
+    def stage(
+        self, filename: str, stream: BinaryIO, triggered_by: str | None = None
+    ) -> AssetImport:
+        """
+        Loads and validates a spreadsheet into the staging table. Nothing is
+        written to the inventory until ``commit``.
+        """
+        # The whole import is one job: a summary per batch, no row-level logs
+        with system_job(IMPORT_JOB_NAME):
+            asset_import = AssetImport(filename=filename, triggered_by=triggered_by)
+            self.session.add(asset_import)
+            self.session.flush()
+
+            resolver = ReferenceResolver(self.session)
+            rows = read_rows(stream, filename)
+            # No strict=: mypy checks against 3.12, where batched lacks it
+            for batch in itertools.batched(rows, settings.ASSET_IMPORT_CHUNK_SIZE):  # noqa: B911
+                self._copy(
+                    [
+                        staging_values(asset_import.id, row_number, raw, resolver)
+                        for row_number, raw in batch
+                    ]
+                )
+            self._validate(asset_import)
+            self.session.commit()
+            self.session.refresh(asset_import)
+        logger.info(
+            "asset_import_staged",
+            import_id=str(asset_import.id),
+            total=asset_import.total_rows,
+            errors=asset_import.error_rows,
+        )
+        return asset_import
+
+    def commit(self, id: UUID) -> AssetImport:
+        """Merges the valid staged rows into ``assets_fixed_asset``."""
+        asset_import = self.get_by_id(id)
+        if not asset_import:
+            raise NotFoundException(detail="Import not found")
+        if asset_import.status == AssetImportStatus.COMPLETED:
+            raise BadRequestException(detail="Import already committed")
+        with system_job(IMPORT_JOB_NAME):
+            try:
+                self._merge(asset_import.id)
+            except Exception as exc:
+                # Merged blocks stay committed: a retry continues with the rest
+                self.session.rollback()
+                rebuild_summary(self.session.connection())
+                asset_import.status = AssetImportStatus.FAILED
+                asset_import.error = str(exc)[:1000]
+                self.session.add(asset_import)
+                self.session.commit()
+                raise
+            # Updated rows may change any dimension: recount once per import
+            rebuild_summary(self.session.connection())
+            asset_import.status = AssetImportStatus.COMPLETED
+            asset_import.error = None
+            asset_import.finished_at = get_current_time()
+            self.session.add(asset_import)
+            self.session.commit()
+        self.session.refresh(asset_import)
+        return asset_import
+
+    def stream_errors(self, id: UUID) -> Iterator[Batch]:
+        if not self.get_by_id(id):
+            raise NotFoundException(detail="Import not found")
+        batches = self.row_repository.stream_all(
+            sort_by="row_number",
+            extra_filters=[
+                col(AssetImportRow.import_id) == id,
+                col(AssetImportRow.errors).is_not(None),
+            ],
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+        return serialize_batches(batches, AssetImportErrorRead)
+
+    def _copy(self, rows: list[dict[str, Any]]) -> None:
+        table = AssetImportRow.__table__  # type: ignore[attr-defined]
+        connection = self.session.connection()
+        if connection.dialect.name != "postgresql":
+            connection.execute(insert(table), rows)
+            return
+        columns = [column.name for column in table.columns]
+        buffer = io.StringIO()
+        # Unquoted empty fields are NULL in COPY's CSV format
+        csv.writer(buffer, lineterminator="\n").writerows(
+            [row[name] for name in columns] for row in rows
+        )
+        buffer.seek(0)
+        quote = connection.dialect.identifier_preparer.quote
+        statement = (
+            f"COPY {quote(table.name)} ({', '.join(quote(c) for c in columns)}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        with contextlib.closing(connection.connection.cursor()) as cursor:
+            cursor.copy_expert(statement, buffer)
+
+    def _validate(self, asset_import: AssetImport) -> None:
+        rows = AssetImportRow.__table__  # type: ignore[attr-defined]
+        assets = FixedAsset.__table__  # type: ignore[attr-defined]
+        scope = rows.c.import_id == asset_import.id
+
+        def flag(condition: Any, message: str) -> None:
+            self.session.exec(
+                update(rows)
+                .where(scope, condition)
+                .values(errors=func.coalesce(rows.c.errors + "; ", "") + message)
+            )
+
+        flag(rows.c.description.is_(None), "description is required")
+        for name in TEXT_COLUMNS:
+            limit = assets.c[name].type.length
+            flag(func.length(rows.c[name]) > limit, f"{name} exceeds {limit} chars")
+        others = rows.alias("others")
+        repeated = (
+            select(others.c.new_code)
+            .where(others.c.import_id == asset_import.id)
+            .group_by(others.c.new_code)
+            .having(func.count() > 1)
+        )
+        flag(rows.c.new_code.in_(repeated), "new_code repeated in the file")
+
+        # Rows whose new_code already exists update that (live) asset
+        existing = (
+            select(assets.c.id)
+            .where(assets.c.new_code == rows.c.new_code, assets.c.deleted_at.is_(None))
+            .order_by(assets.c.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        self.session.exec(
+            update(rows)
+            .where(scope, rows.c.new_code.is_not(None), existing.is_not(None))
+            .values(asset_id=existing, is_new=False)
+        )
+
+        summary = select(rows.c.errors.is_(None), rows.c.is_new, func.count()).where(
+            scope
+        )
+        summary = summary.group_by(rows.c.errors.is_(None), rows.c.is_new)
+        asset_import.total_rows = asset_import.valid_rows = 0
+        asset_import.to_insert = asset_import.to_update = 0
+        for is_valid, is_new, count in self.session.execute(summary).all():
+            asset_import.total_rows += count
+            if not is_valid:
+                continue
+            asset_import.valid_rows += count
+            if is_new:
+                asset_import.to_insert += count
+            else:
+                asset_import.to_update += count
+        asset_import.error_rows = asset_import.total_rows - asset_import.valid_rows
+        self.session.add(asset_import)
+
+    def _merge(self, import_id: UUID) -> None:
+        rows = AssetImportRow.__table__  # type: ignore[attr-defined]
+        assets = FixedAsset.__table__  # type: ignore[attr-defined]
+        valid = (rows.c.import_id == import_id, rows.c.errors.is_(None))
+        numbers = self.session.execute(
+            select(rows.c.row_number).where(*valid).order_by(rows.c.row_number)
+        ).all()
+        user_id = get_audit_user_id()
+
+        for chunk in itertools.batched(numbers, settings.ASSET_IMPORT_CHUNK_SIZE):  # noqa: B911
+            window = (*valid, rows.c.row_number.between(chunk[0][0], chunk[-1][0]))
+            now = get_current_time()
+            targets = self.session.execute(
+                select(rows.c.asset_id, rows.c.is_new).where(*window)
+            ).all()
+
+            # Blank flags take the model defaults on insert
+            new_values = [
+                func.coalesce(rows.c[name], FixedAsset.model_fields[name].default)
+                if name in FLAG_COLUMNS
+                else rows.c[name]
+                for name in MERGE_COLUMNS
+            ]
+            self.session.exec(
+                insert(assets).from_select(
+                    ["id", *MERGE_COLUMNS, "created_at", "created_by_id"],
+                    select(
+                        rows.c.asset_id,
+                        *new_values,
+                        literal(now, DateTime()),
+                        literal(user_id, Uuid()),
+                    ).where(*window, rows.c.is_new),
+                )
+            )
+            # Blank cells keep the asset's current value
+            self.session.exec(
+                update(assets)
+                .where(assets.c.id == rows.c.asset_id, *window, ~rows.c.is_new)
+                .values(
+                    {
+                        **{
+                            name: func.coalesce(rows.c[name], assets.c[name])
+                            for name in MERGE_COLUMNS
+                        },
+                        "updated_at": now,
+                        "updated_by_id": user_id,
+                        "version_id": assets.c.version_id + 1,
+                    }
+                )
+            )
+            created = sum(1 for _, is_new in targets if is_new)
+            # Values differ per row and the staged rows are dropped below, so
+            # history cannot replay the block: it reports it as incomplete
+            record_bulk_changes(
+                self.session,
+                FixedAsset.__name__,
+                {"CREATE": created, "UPDATE": len(targets) - created},
+                [asset_id for asset_id, _ in targets],
+                import_id=import_id,
+            )
+            # Merged rows leave the staging table with their block: a failed
+            # commit is retried with only what is left
+            self.session.exec(delete(rows).where(*window))
+            self.session.commit()
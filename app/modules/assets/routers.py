@@ -1,6 +1,7 @@
 """
 Módulo de enrutamiento unificado para el dominio Assets.
-Agrega los submódulos de instituciones, áreas, grupos, estados, actas y activos fijos.
+Agrega los submódulos de instituciones, áreas, grupos, estados, actas, activos fijos,
+importaciones masivas, contadores del dashboard y campañas de verificación.
 """
 
 from fastapi import APIRouter
@@ -9,8 +10,11 @@ from app.modules.assets.acts import routers as acts_router
 from app.modules.assets.areas import routers as areas_router
 from app.modules.assets.assets import routers as assets_router
 from app.modules.assets.groups import routers as groups_router
+from app.modules.assets.imports import routers as imports_router
 from app.modules.assets.institutions import routers as institutions_router
 from app.modules.assets.statuses import routers as statuses_router
+from app.modules.assets.summary import routers as summary_router
+from app.modules.assets.verification import routers as verification_router
 
 router = APIRouter(prefix="/assets")
 
@@ -21,3 +25,6 @@ router.include_router(groups_router.router)
 router.include_router(statuses_router.router)
 router.include_router(acts_router.router)
 router.include_router(assets_router.router)
+router.include_router(imports_router.router)
+router.include_router(summary_router.router)
+router.include_router(verification_router.router)
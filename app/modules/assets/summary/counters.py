@@ -0,0 +1,158 @@
+"""
+Contadores agregados del inventario (`assets_summary`).
+
+Cada escritura ORM de un activo se traduce en deltas `(dimensión, valor) → ±n`
+que se aplican con un único upsert (`count = count + delta`) dentro de la
+misma transacción, desde los eventos del mapper de `FixedAsset`. Solo se
+cuentan activos vigentes: un borrado lógico (`deleted_at`) resta el activo
+de todos los contadores y una restauración lo vuelve a sumar. Las
+escrituras masivas con sentencias Core (transferencias, importaciones) no
+pasan por esos eventos: aplican sus propios deltas con `apply_deltas` o
+recalculan todo con `rebuild_summary`.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm.attributes import get_history
+
+from app.core.db import dialect_insert
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.summary.models import AssetSummary
+
+# Total number of assets, stored as one more dimension
+TOTAL_DIMENSION = "total"
+TOTAL_KEY = "all"
+SUMMARY_DIMENSIONS = (
+    "status_id",
+    "group_id",
+    "area_id",
+    "org_unit_id",
+    "is_physically_verified",
+    "is_decommissioned",
+)
+
+# Stored values read back by the mapper events
+SUMMARY_COLUMNS = (*SUMMARY_DIMENSIONS, "deleted_at")
+
+type Deltas = Counter[tuple[str, str]]
+
+
+def summary_key(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def asset_deltas(values: Mapping[str, Any], sign: int) -> Deltas:
+    """Deltas for adding (``sign=1``) or removing (``-1``) one asset."""
+    deltas: Deltas = Counter({(TOTAL_DIMENSION, TOTAL_KEY): sign})
+    for dimension in SUMMARY_DIMENSIONS:
+        deltas[(dimension, summary_key(values[dimension]))] += sign
+    return deltas
+
+
+def shift_deltas(dimension: str, counts: Mapping[Any, int], value: Any) -> Deltas:
+    """Deltas for moving ``counts`` (old value → n assets) to ``value``."""
+    deltas: Deltas = Counter()
+    for old, count in counts.items():
+        deltas[(dimension, summary_key(old))] -= count
+        deltas[(dimension, summary_key(value))] += count
+    return deltas
+
+
+def apply_deltas(connection: Connection, deltas: Deltas) -> None:
+    rows = [
+        {"dimension": dimension, "key": key, "count": count}
+        for (dimension, key), count in sorted(deltas.items())
+        if count
+    ]
+    if not rows:
+        return
+    table = AssetSummary.__table__  # type: ignore[attr-defined]
+    statement = dialect_insert(connection, AssetSummary).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["dimension", "key"],
+        set_={"count": table.c.count + statement.excluded.count},
+    )
+    connection.execute(statement)
+
+
+def rebuild_summary(connection: Connection) -> None:
+    """Recomputes every counter from ``assets_fixed_asset`` (one GROUP BY each)."""
+    table = AssetSummary.__table__  # type: ignore[attr-defined]
+    assets = FixedAsset.__table__  # type: ignore[attr-defined]
+    live = assets.c.deleted_at.is_(None)
+    total = connection.execute(
+        select(func.count()).select_from(assets).where(live)
+    ).scalar_one()
+    rows = [{"dimension": TOTAL_DIMENSION, "key": TOTAL_KEY, "count": total}]
+    for dimension in SUMMARY_DIMENSIONS:
+        column = assets.c[dimension]
+        grouped = select(column, func.count()).where(live).group_by(column)
+        rows.extend(
+            {"dimension": dimension, "key": summary_key(value), "count": count}
+            for value, count in connection.execute(grouped)
+        )
+    connection.execute(delete(table))
+    connection.execute(insert(table), rows)
+
+
+def _current_values(target: FixedAsset) -> dict[str, Any]:
+    return {dimension: getattr(target, dimension) for dimension in SUMMARY_DIMENSIONS}
+
+
+def _persisted_values(
+    connection: Connection, id: UUID, dimensions: Iterable[str]
+) -> dict[str, Any]:
+    assets = FixedAsset.__table__  # type: ignore[attr-defined]
+    columns = [assets.c[dimension] for dimension in dimensions]
+    row = connection.execute(select(*columns).where(assets.c.id == id)).one()
+    return dict(row._mapping)
+
+
+@event.listens_for(FixedAsset, "after_insert")
+def _summary_after_insert(mapper, connection: Connection, target: FixedAsset) -> None:
+    apply_deltas(connection, asset_deltas(_current_values(target), 1))
+
+
+@event.listens_for(FixedAsset, "before_update")
+def _summary_before_update(mapper, connection: Connection, target: FixedAsset) -> None:
+    if get_history(target, "deleted_at").has_changes():
+        stored = _persisted_values(connection, target.id, SUMMARY_COLUMNS)
+        was_live = stored.pop("deleted_at") is None
+        if was_live and target.deleted_at is not None:
+            apply_deltas(connection, asset_deltas(stored, -1))
+            return
+        if not was_live and target.deleted_at is None:
+            apply_deltas(connection, asset_deltas(_current_values(target), 1))
+            return
+    if target.deleted_at is not None:
+        # Deleted assets are not counted: nothing to shift
+        return
+    changed = [
+        dimension
+        for dimension in SUMMARY_DIMENSIONS
+        if get_history(target, dimension).has_changes()
+    ]
+    if not changed:
+        return
+    # Still the stored row: the UPDATE has not been emitted yet
+    old = _persisted_values(connection, target.id, changed)
+    deltas: Deltas = Counter()
+    for dimension in changed:
+        deltas.update(
+            shift_deltas(dimension, {old[dimension]: 1}, vars(target)[dimension])
+        )
+    apply_deltas(connection, deltas)
+
+
+@event.listens_for(FixedAsset, "before_delete")
+def _summary_before_delete(mapper, connection: Connection, target: FixedAsset) -> None:
+    stored = _persisted_values(connection, target.id, SUMMARY_COLUMNS)
+    if stored.pop("deleted_at") is None:
+        apply_deltas(connection, asset_deltas(stored, -1))
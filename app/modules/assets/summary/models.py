@@ -0,0 +1,15 @@
+from sqlmodel import Field, SQLModel
+
+
+class AssetSummary(SQLModel, table=True):
+    """
+    Rollup counter: number of fixed assets per value of a dashboard
+    dimension (``status_id``, ``is_decommissioned``, ...). Kept in step with
+    ``assets_fixed_asset`` by incremental deltas in the same transaction.
+    """
+
+    __tablename__ = "assets_summary"
+
+    dimension: str = Field(primary_key=True, max_length=50)
+    key: str = Field(primary_key=True, max_length=50)
+    count: int = Field(default=0)
@@ -0,0 +1,22 @@
+from sqlmodel import Session, col, select
+
+from app.core.repository import BaseRepository
+from app.modules.assets.summary.counters import rebuild_summary
+from app.modules.assets.summary.models import AssetSummary
+
+
+class AssetSummaryRepository(BaseRepository[AssetSummary]):
+    def __init__(self, session: Session):
+        super().__init__(session, AssetSummary)
+
+    def get_counts(self) -> dict[str, dict[str, int]]:
+        """Every non-zero counter, grouped by dimension: a single small read."""
+        statement = select(AssetSummary).where(col(AssetSummary.count) > 0)
+        counts: dict[str, dict[str, int]] = {}
+        for row in self.session.exec(statement).all():
+            counts.setdefault(row.dimension, {})[row.key] = row.count
+        return counts
+
+    def rebuild(self) -> None:
+        rebuild_summary(self.session.connection())
+        self.session.commit()
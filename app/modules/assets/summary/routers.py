@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends
+
+from app.auth.permissions import PermissionAction, PermissionChecker
+from app.auth.schemas import UserModulePermission
+from app.core.db import SessionDep
+from app.modules.assets.constants import AssetsModuleSlug
+from app.modules.assets.summary.schemas import AssetSummaryRead
+from app.modules.assets.summary.service import AssetSummaryService
+
+router = APIRouter(prefix="/summary", tags=["Assets - Summary"])
+
+
+@router.get("/", response_model=AssetSummaryRead)
+def get_summary(
+    session: SessionDep,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """
+    Contadores del inventario para el dashboard (total, por estado, grupo,
+    área, unidad, verificación y baja). Se leen precalculados de
+    `assets_summary`, sin recorrer la tabla de activos.
+    """
+    service = AssetSummaryService(session)
+    return service.get_summary()
+
+
+@router.post("/rebuild", response_model=AssetSummaryRead)
+def rebuild_summary(
+    session: SessionDep,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    """Recalcula todos los contadores desde la tabla de activos."""
+    service = AssetSummaryService(session)
+    return service.rebuild()
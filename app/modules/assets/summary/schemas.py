@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class AssetSummaryRead(BaseModel):
+    # Conteos por id del catálogo / unidad; los flags usan "true" / "false"
+    total: int
+    by_status: dict[str, int]
+    by_group: dict[str, int]
+    by_area: dict[str, int]
+    by_org_unit: dict[str, int]
+    by_physically_verified: dict[str, int]
+    by_decommissioned: dict[str, int]
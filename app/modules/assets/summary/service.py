@@ -0,0 +1,34 @@
+from sqlmodel import Session
+
+from app.modules.assets.summary.counters import TOTAL_DIMENSION, TOTAL_KEY
+from app.modules.assets.summary.repository import AssetSummaryRepository
+from app.modules.assets.summary.schemas import AssetSummaryRead
+
+# Response field for each summary dimension
+SUMMARY_FIELDS = {
+    "status_id": "by_status",
+    "group_id": "by_group",
+    "area_id": "by_area",
+    "org_unit_id": "by_org_unit",
+    "is_physically_verified": "by_physically_verified",
+    "is_decommissioned": "by_decommissioned",
+}
+
+
+class AssetSummaryService:
+    def __init__(self, session: Session):
+        self.repository = AssetSummaryRepository(session)
+
+    def get_summary(self) -> AssetSummaryRead:
+        counts = self.repository.get_counts()
+        return AssetSummaryRead(
+            total=counts.get(TOTAL_DIMENSION, {}).get(TOTAL_KEY, 0),
+            **{
+                field: counts.get(dimension, {})
+                for dimension, field in SUMMARY_FIELDS.items()
+            },
+        )
+
+    def rebuild(self) -> AssetSummaryRead:
+        self.repository.rebuild()
+        return self.get_summary()
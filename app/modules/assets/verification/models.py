@@ -0,0 +1,54 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import DateTime, Field, Index, SQLModel
+
+from app.models.base_model import BaseModel
+from app.models.mixins import AuditMixin
+
+
+class VerificationCampaignStatus:
+    OPEN = "OPEN"
+    CLOSED = "CLOSED"
+
+
+class VerificationCampaign(BaseModel, AuditMixin, table=True):
+    """
+    Physical verification round over an area and/or org unit subtree.
+    ``version`` is the sync token: it grows with every accepted scan batch.
+    """
+
+    __tablename__ = "assets_verification_campaign"
+
+    name: str = Field(max_length=200)
+    status: str = Field(default=VerificationCampaignStatus.OPEN, max_length=20)
+    area_id: UUID | None = Field(default=None, foreign_key="assets_area.id")
+    org_unit_id: UUID | None = Field(default=None, foreign_key="core_org_unit.id")
+    version: int = Field(default=0)
+    closed_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+    )
+
+
+class VerificationScan(SQLModel, table=True):
+    """
+    First scan of an asset within a campaign. The primary key makes uploads
+    idempotent: a batch re-sent after a network failure inserts nothing new.
+    """
+
+    __tablename__ = "assets_verification_scan"
+    # Delta sync: scans of a campaign after a token
+    __table_args__ = (
+        Index("ix_assets_verification_scan_campaign_version", "campaign_id", "version"),
+    )
+
+    campaign_id: UUID = Field(
+        foreign_key="assets_verification_campaign.id", primary_key=True
+    )
+    asset_id: UUID = Field(foreign_key="assets_fixed_asset.id", primary_key=True)
+    version: int
+    code: str = Field(max_length=100)
+    scanned_at: datetime = Field(sa_type=DateTime(timezone=False))  # type: ignore[call-overload]
+    scanned_by: str | None = Field(default=None, max_length=100)
+    device_id: str | None = Field(default=None, max_length=100)
@@ -0,0 +1,142 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, RowMapping, and_, case, or_, update
+from sqlalchemy import select as sa_select
+from sqlmodel import Session, col, select
+
+from app.core.db import dialect_insert
+from app.core.repository import BaseRepository
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.verification.models import (
+    VerificationCampaign,
+    VerificationScan,
+)
+from app.modules.core.org_units.repository import OrgUnitRepository
+
+
+class VerificationCampaignRepository(BaseRepository[VerificationCampaign]):
+    searchable_fields = ["name"]
+
+    def __init__(self, session: Session):
+        super().__init__(session, VerificationCampaign)
+
+    @staticmethod
+    def scope_filters(campaign: VerificationCampaign) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = [
+            col(FixedAsset.deleted_at).is_(None),
+            col(FixedAsset.is_decommissioned).is_(False),
+        ]
+        if campaign.area_id:
+            filters.append(col(FixedAsset.area_id) == campaign.area_id)
+        if campaign.org_unit_id:
+            filters.append(
+                col(FixedAsset.org_unit_id).in_(
+                    OrgUnitRepository.subtree_ids(campaign.org_unit_id)
+                )
+            )
+        return filters
+
+    def get_snapshot(self, campaign: VerificationCampaign) -> list[RowMapping]:
+        """Assets in scope with their verification state, as flat rows."""
+        scanned = (
+            select(VerificationScan.asset_id)
+            .where(VerificationScan.campaign_id == campaign.id)
+            .where(VerificationScan.asset_id == FixedAsset.id)
+            .exists()
+        )
+        statement = (
+            sa_select(
+                col(FixedAsset.id),
+                col(FixedAsset.new_code),
+                col(FixedAsset.old_code),
+                col(FixedAsset.description),
+                col(FixedAsset.location_detail),
+                scanned.label("verified"),
+            )
+            .where(*self.scope_filters(campaign))
+            .order_by(col(FixedAsset.new_code))
+        )
+        return list(self.session.execute(statement).mappings().all())
+
+    def next_version(self, campaign_id: UUID) -> int:
+        """
+        Bumps the campaign token. The row lock it takes serializes concurrent
+        batches, so tokens become visible in order.
+        """
+        statement = (
+            update(VerificationCampaign)
+            .where(col(VerificationCampaign.id) == campaign_id)
+            .values(version=col(VerificationCampaign.version) + 1)
+            .returning(col(VerificationCampaign.version))
+        )
+        version: int = self.session.exec(statement).scalar_one()
+        return version
+
+    def match_codes(
+        self, campaign: VerificationCampaign, codes: list[str]
+    ) -> list[RowMapping]:
+        """Assets whose new or old code is among ``codes``, flagged in/out of scope."""
+        in_scope = case((and_(*self.scope_filters(campaign)), True), else_=False)
+        statement = sa_select(
+            col(FixedAsset.id),
+            col(FixedAsset.new_code),
+            col(FixedAsset.old_code),
+            in_scope.label("in_scope"),
+        ).where(
+            col(FixedAsset.deleted_at).is_(None),
+            or_(
+                col(FixedAsset.new_code).in_(codes), col(FixedAsset.old_code).in_(codes)
+            ),
+        )
+        return list(self.session.execute(statement).mappings().all())
+
+    def insert_scans(self, rows: list[dict[str, Any]]) -> list[UUID]:
+        """Inserts scans, skipping assets already scanned; returns the new ones."""
+        if not rows:
+            return []
+        statement = (
+            dialect_insert(self.session, VerificationScan)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(col(VerificationScan.asset_id))
+        )
+        return list(self.session.exec(statement).scalars())
+
+    def mark_verified(
+        self, asset_ids: list[UUID], values: dict[str, Any]
+    ) -> list[UUID]:
+        """Flags the assets as verified; returns those that were not yet."""
+        if not asset_ids:
+            return []
+        statement = (
+            update(FixedAsset)
+            .where(
+                col(FixedAsset.id).in_(asset_ids),
+                col(FixedAsset.is_physically_verified).is_(False),
+            )
+            .values(
+                {
+                    "is_physically_verified": True,
+                    "version_id": FixedAsset.version_id + 1,
+                    **values,
+                }
+            )
+            .returning(col(FixedAsset.id))
+        )
+        return list(self.session.exec(statement).scalars())
+
+    def get_changes(
+        self, campaign_id: UUID, since: int, until: int
+    ) -> list[VerificationScan]:
+        """Scans recorded after token ``since`` and up to token ``until``."""
+        statement = (
+            select(VerificationScan)
+            .where(
+                VerificationScan.campaign_id == campaign_id,
+                col(VerificationScan.version) > since,
+                col(VerificationScan.version) <= until,
+            )
+            .order_by(col(VerificationScan.version))
+        )
+        return list(self.session.exec(statement).all())
@@ -0,0 +1,162 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from app.auth.permissions import PermissionAction, PermissionChecker
+from app.auth.schemas import UserModulePermission
+from app.auth.utils import get_current_user
+from app.core.db import SessionDep
+from app.core.exceptions import NotFoundException
+from app.models.user import User
+from app.modules.assets.constants import AssetsModuleSlug
+from app.modules.assets.verification.schemas import (
+    CampaignChanges,
+    CampaignSnapshot,
+    ScanBatch,
+    ScanBatchResult,
+    VerificationCampaignCreate,
+    VerificationCampaignRead,
+)
+from app.modules.assets.verification.service import VerificationService
+
+router = APIRouter(prefix="/verification", tags=["Assets - Verification"])
+
+
+@router.post("/campaigns", response_model=VerificationCampaignRead)
+def create_campaign(
+    session: SessionDep,
+    data: VerificationCampaignCreate,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.CREATE,
+        )
+    ),
+):
+    service = VerificationService(session)
+    return service.create(data)
+
+
+@router.get("/campaigns", response_model=list[VerificationCampaignRead])
+def get_campaigns(
+    session: SessionDep,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: str | None = Query(None),
+    sort_order: str = Query("asc"),
+    search: str | None = Query(None),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    service = VerificationService(session)
+    return service.get_all(offset, limit, sort_by, sort_order, search)
+
+
+@router.get("/campaigns/count")
+def count_campaigns(
+    session: SessionDep,
+    search: str | None = Query(None),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    service = VerificationService(session)
+    return {"total": service.count(search)}
+
+
+@router.get("/campaigns/{id}", response_model=VerificationCampaignRead)
+def get_campaign(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    service = VerificationService(session)
+    campaign = service.get_by_id(id)
+    if not campaign:
+        raise NotFoundException(detail="Campaign not found")
+    return campaign
+
+
+@router.post("/campaigns/{id}/close", response_model=VerificationCampaignRead)
+def close_campaign(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    service = VerificationService(session)
+    return service.close(id)
+
+
+@router.get("/campaigns/{id}/snapshot", response_model=CampaignSnapshot)
+def get_campaign_snapshot(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """
+    Activos del alcance de la campaña (código, descripción, ubicación y si ya
+    fueron verificados) para trabajar sin conexión, con el token de sync.
+    """
+    service = VerificationService(session)
+    return service.get_snapshot(id)
+
+
+@router.get("/campaigns/{id}/changes", response_model=CampaignChanges)
+def get_campaign_changes(
+    session: SessionDep,
+    id: UUID,
+    since: int = Query(0, ge=0, description="Último token recibido por el cliente"),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.READ,
+        )
+    ),
+):
+    """Lecturas registradas desde el token `since` (delta sync)."""
+    service = VerificationService(session)
+    return service.get_changes(id, since)
+
+
+@router.post("/campaigns/{id}/scans", response_model=ScanBatchResult)
+def upload_scans(
+    session: SessionDep,
+    id: UUID,
+    batch: ScanBatch,
+    current_user: User = Depends(get_current_user),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=AssetsModuleSlug.GENERAL,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    """
+    Sube un lote de lecturas (`new_code` u `old_code`). Se aplica en bloque e
+    idempotentemente; la respuesta incluye el delta desde `since` y el nuevo
+    token, más los códigos desconocidos, ambiguos o fuera de alcance.
+    """
+    service = VerificationService(session)
+    return service.apply_scans(id, batch, current_user.username)
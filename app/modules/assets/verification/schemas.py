@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.core.config import settings
+
+
+class VerificationCampaignCreate(BaseModel):
+    name: str = Field(max_length=200)
+    area_id: UUID | None = None
+    org_unit_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def check_scope(self) -> Self:
+        if self.area_id is None and self.org_unit_id is None:
+            raise ValueError("Set area_id and/or org_unit_id")
+        return self
+
+
+class VerificationCampaignRead(BaseModel):
+    id: UUID
+    name: str
+    status: str
+    area_id: UUID | None = None
+    org_unit_id: UUID | None = None
+    version: int
+    created_at: datetime | None = None
+    closed_at: datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SnapshotAsset(BaseModel):
+    id: UUID
+    new_code: str | None = None
+    old_code: str | None = None
+    description: str
+    location_detail: str | None = None
+    verified: bool
+
+
+class CampaignSnapshot(BaseModel):
+    # Token to send as `since` on the next sync
+    token: int
+    assets: list[SnapshotAsset]
+
+
+class ScanIn(BaseModel):
+    code: str = Field(min_length=1, max_length=100)
+    scanned_at: datetime
+
+
+class ScanBatch(BaseModel):
+    since: int = Field(0, ge=0, description="Último token recibido por el cliente")
+    device_id: str | None = Field(None, max_length=100)
+    scans: list[ScanIn] = Field(max_length=settings.VERIFICATION_MAX_BATCH)
+
+
+class ScanChange(BaseModel):
+    asset_id: UUID
+    code: str
+    scanned_at: datetime
+    scanned_by: str | None = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CampaignChanges(BaseModel):
+    token: int
+    scans: list[ScanChange]
+
+
+class ScanBatchResult(CampaignChanges):
+    applied: int
+    duplicates: int
+    unknown_codes: list[str]
+    ambiguous_codes: list[str]
+    out_of_scope_codes: list[str]
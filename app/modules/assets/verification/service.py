@@ -0,0 +1,215 @@
+"""
+Campañas de verificación física con sincronización incremental.
+
+Los equipos de inventario descargan un snapshot compacto de los activos del
+alcance, escanean sin conexión y suben lotes de lecturas. Cada lote se aplica
+en bloque e idempotentemente (un activo se registra una sola vez por campaña)
+y la respuesta trae las lecturas de los demás equipos desde el último token
+del cliente.
+"""
+
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import RowMapping
+from sqlmodel import Session
+
+from app.core.audit import get_audit_user_id, record_bulk_changes, system_job
+from app.core.audit.history import register_summary_members
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.summary.counters import apply_deltas, shift_deltas
+from app.modules.assets.verification.models import (
+    VerificationCampaign,
+    VerificationCampaignStatus,
+)
+from app.modules.assets.verification.repository import (
+    VerificationCampaignRepository,
+)
+from app.modules.assets.verification.schemas import (
+    CampaignChanges,
+    CampaignSnapshot,
+    ScanBatch,
+    ScanBatchResult,
+    VerificationCampaignCreate,
+)
+from app.util.datetime import get_current_time, to_local_time
+
+VERIFICATION_JOB_NAME = "asset_verification"
+# What a scan batch sets on the assets it flips
+VERIFIED_VALUES = {"is_physically_verified": True}
+
+
+def _verified_assets(session: Session, changes: dict[str, Any]) -> set[str] | None:
+    """
+    Assets of a verification summary: those scanned in its batch (token).
+    Scanned assets that were already verified are included; the values are
+    the same for them.
+    """
+    campaign_id, version = changes.get("campaign_id"), changes.get("version")
+    if not campaign_id or version is None:
+        return None
+    repository = VerificationCampaignRepository(session)
+    scans = repository.get_changes(UUID(campaign_id), version - 1, version)
+    return {str(scan.asset_id) for scan in scans}
+
+
+register_summary_members(VERIFICATION_JOB_NAME, _verified_assets)
+
+
+def resolve_codes(
+    codes: Sequence[str], matches: Sequence[RowMapping]
+) -> tuple[dict[str, RowMapping], list[str], list[str]]:
+    """
+    Maps each scanned code to one asset: ``new_code`` first, then
+    ``old_code``. Returns the matches plus the unknown and ambiguous codes.
+    """
+    by_code: dict[str, dict[str, list[RowMapping]]] = {"new_code": {}, "old_code": {}}
+    for row in matches:
+        for field, index in by_code.items():
+            if row[field]:
+                index.setdefault(row[field], []).append(row)
+    resolved: dict[str, RowMapping] = {}
+    unknown: list[str] = []
+    ambiguous: list[str] = []
+    for code in codes:
+        candidates = by_code["new_code"].get(code) or by_code["old_code"].get(code)
+        if not candidates:
+            unknown.append(code)
+        elif len(candidates) > 1:
+            ambiguous.append(code)
+        else:
+            resolved[code] = candidates[0]
+    return resolved, unknown, ambiguous
+
+
+class VerificationService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.repository = VerificationCampaignRepository(session)
+
+    def create(self, data: VerificationCampaignCreate) -> VerificationCampaign:
+        return self.repository.create(VerificationCampaign(**data.model_dump()))
+
+    def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        search: str | None = None,
+    ) -> Sequence[VerificationCampaign]:
+        return self.repository.get_all(offset, limit, sort_by, sort_order, search)
+
+    def count(self, search: str | None = None) -> int:
+        return self.repository.count(search)
+
+    def get_by_id(self, id: UUID) -> VerificationCampaign | None:
+        return self.repository.get_by_id(id)
+
+    def _get_campaign(self, id: UUID) -> VerificationCampaign:
+        campaign = self.repository.get_by_id(id)
+        if not campaign:
+            raise NotFoundException(detail="Campaign not found")
+        return campaign
+
+    def close(self, id: UUID) -> VerificationCampaign:
+        campaign = self._get_campaign(id)
+        return self.repository.update(  # type: ignore[return-value]
+            campaign.id,
+            {
+                "status": VerificationCampaignStatus.CLOSED,
+                "closed_at": get_current_time(),
+            },
+        )
+
+    def get_snapshot(self, id: UUID) -> CampaignSnapshot:
+        campaign = self._get_campaign(id)
+        # Token first: scans committed meanwhile come again in the next delta
+        token = campaign.version
+        rows = self.repository.get_snapshot(campaign)
+        return CampaignSnapshot.model_validate(
+            {"token": token, "assets": [dict(row) for row in rows]}
+        )
+
+    def get_changes(self, id: UUID, since: int) -> CampaignChanges:
+        campaign = self._get_campaign(id)
+        token = campaign.version
+        scans = self.repository.get_changes(campaign.id, since, token)
+        return CampaignChanges(token=token, scans=scans)
+
+    def apply_scans(
+        self, id: UUID, batch: ScanBatch, scanned_by: str | None = None
+    ) -> ScanBatchResult:
+        """
+        Records a batch of scans and flags the matched assets as verified,
+        in one transaction. Re-sending a batch is harmless.
+        """
+        campaign = self._get_campaign(id)
+        if campaign.status != VerificationCampaignStatus.OPEN:
+            raise BadRequestException(detail="Campaign is closed")
+
+        codes = list(dict.fromkeys(scan.code.strip() for scan in batch.scans))
+        matches = self.repository.match_codes(campaign, codes)
+        resolved, unknown, ambiguous = resolve_codes(codes, matches)
+        out_of_scope = [code for code, row in resolved.items() if not row["in_scope"]]
+
+        # Earliest scan per asset within the batch
+        first_scans: dict[UUID, dict] = {}
+        for scan in sorted(batch.scans, key=lambda scan: scan.scanned_at):
+            row = resolved.get(scan.code.strip())
+            if row is None or not row["in_scope"] or row["id"] in first_scans:
+                continue
+            first_scans[row["id"]] = {
+                "campaign_id": campaign.id,
+                "asset_id": row["id"],
+                "code": scan.code.strip(),
+                "scanned_at": to_local_time(scan.scanned_at),
+                "scanned_by": scanned_by,
+                "device_id": batch.device_id,
+            }
+
+        token = campaign.version
+        inserted: list[UUID] = []
+        with system_job(VERIFICATION_JOB_NAME):
+            try:
+                if first_scans:
+                    token = self.repository.next_version(campaign.id)
+                    inserted = self.repository.insert_scans(
+                        [{**row, "version": token} for row in first_scans.values()]
+                    )
+                flipped = self.repository.mark_verified(
+                    inserted, {"updated_by_id": get_audit_user_id()}
+                )
+                if flipped:
+                    # Core UPDATE: keep the dashboard counters in step
+                    apply_deltas(
+                        self.session.connection(),
+                        shift_deltas(
+                            "is_physically_verified", {False: len(flipped)}, True
+                        ),
+                    )
+                    record_bulk_changes(
+                        self.session,
+                        FixedAsset.__name__,
+                        {"UPDATE": len(flipped)},
+                        flipped,
+                        VERIFIED_VALUES,
+                        campaign_id=campaign.id,
+                        version=token,
+                    )
+                # Serialized before commit, while the scans are still loaded
+                result = ScanBatchResult(
+                    token=token,
+                    scans=self.repository.get_changes(campaign.id, batch.since, token),
+                    applied=len(inserted),
+                    duplicates=len(first_scans) - len(inserted),
+                    unknown_codes=unknown,
+                    ambiguous_codes=ambiguous,
+                    out_of_scope_codes=out_of_scope,
+                )
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                raise
+        return result
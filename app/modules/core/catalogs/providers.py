@@ -8,6 +8,9 @@ from app.modules.core.org_units.models import OrgUnit
 
 
 class GerenciasProvider(CatalogProvider):
+    depends_on = ("core_org_unit",)
+    cache_ttl = 3600
+
     def get_items(self, session: Session, **kwargs) -> list[CatalogItemSchema]:
         # Filtramos por parent_id IS NULL e is_active = True
         query = (
@@ -24,6 +27,9 @@ class GerenciasProvider(CatalogProvider):
 
 
 class DepartamentosProvider(CatalogProvider):
+    depends_on = ("core_org_unit",)
+    cache_ttl = 3600
+
     def get_items(self, session: Session, **kwargs) -> list[CatalogItemSchema]:
         gerencia_id_str = kwargs.get("gerencia_id")
         if not gerencia_id_str:
@@ -8,3 +8,5 @@ class CoreModuleSlug:
     ORG_UNIT = "core_org_unit"
     POSITIONS = "core_positions"
     USERS = "core_users"
+    AUDIT = "core_audit"
+    SYNC = "core_sync"
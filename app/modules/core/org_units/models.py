@@ -1,7 +1,19 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, cast
 from uuid import UUID
 
-from sqlmodel import Field, Relationship
+from sqlalchemy import (
+    Connection,
+    Table,
+    delete,
+    event,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+)
+from sqlalchemy.orm.attributes import get_history
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.models.base_model import BaseModel
 from app.models.mixins import AuditMixin
@@ -33,3 +45,96 @@ class OrgUnit(BaseModel, AuditMixin, table=True):
     parent: Optional["OrgUnit"] = Relationship(
         back_populates="children", sa_relationship_kwargs={"remote_side": "OrgUnit.id"}
     )
+
+
+class OrgUnitClosure(SQLModel, table=True):
+    """
+    Closure table of the org-unit hierarchy: one row per (ancestor, descendant)
+    pair, including each unit with itself at depth 0. Subtree and ancestor
+    lookups become a single indexed join instead of recursive round trips.
+    Maintained by the mapper listeners below; ``OrgUnitRepository.rebuild_closure``
+    recomputes it from ``parent_id``.
+    """
+
+    __tablename__ = "core_org_unit_closure"
+    __table_args__ = (
+        Index("ix_core_org_unit_closure_descendant", "descendant_id", "depth"),
+    )
+
+    ancestor_id: UUID = Field(foreign_key="core_org_unit.id", primary_key=True)
+    descendant_id: UUID = Field(foreign_key="core_org_unit.id", primary_key=True)
+    depth: int = Field(default=0)
+
+
+closure = cast(Table, OrgUnitClosure.__table__)  # type: ignore[attr-defined]
+
+
+def link_org_unit(connection: Connection, id: UUID, parent_id: UUID | None) -> None:
+    """Adds the closure rows of a new leaf unit."""
+    connection.execute(
+        insert(closure).values(ancestor_id=id, descendant_id=id, depth=0)
+    )
+    if parent_id is not None:
+        connection.execute(
+            insert(closure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(
+                    closure.c.ancestor_id,
+                    literal(id, type_=closure.c.descendant_id.type),
+                    closure.c.depth + 1,
+                ).where(closure.c.descendant_id == parent_id),
+            )
+        )
+
+
+def move_org_unit(connection: Connection, id: UUID, parent_id: UUID | None) -> None:
+    """Re-attaches the subtree rooted at ``id`` under ``parent_id``."""
+    subtree = select(closure.c.descendant_id).where(closure.c.ancestor_id == id)
+    # Drop the links between the subtree and its former ancestors
+    connection.execute(
+        delete(closure).where(
+            closure.c.descendant_id.in_(subtree),
+            closure.c.ancestor_id.not_in(subtree),
+        )
+    )
+    if parent_id is None:
+        return
+    above = closure.alias("above")
+    below = closure.alias("below")
+    connection.execute(
+        insert(closure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                above.c.ancestor_id,
+                below.c.descendant_id,
+                above.c.depth + below.c.depth + 1,
+            )
+            # Every ancestor of the new parent x every node of the subtree
+            .select_from(above.join(below, true()))
+            .where(above.c.descendant_id == parent_id, below.c.ancestor_id == id),
+        )
+    )
+
+
+def unlink_org_unit(connection: Connection, id: UUID) -> None:
+    connection.execute(
+        delete(closure).where(
+            or_(closure.c.ancestor_id == id, closure.c.descendant_id == id)
+        )
+    )
+
+
+@event.listens_for(OrgUnit, "after_insert")
+def _closure_after_insert(mapper, connection: Connection, target: OrgUnit) -> None:
+    link_org_unit(connection, target.id, target.parent_id)
+
+
+@event.listens_for(OrgUnit, "after_update")
+def _closure_after_update(mapper, connection: Connection, target: OrgUnit) -> None:
+    if get_history(target, "parent_id").has_changes():
+        move_org_unit(connection, target.id, target.parent_id)
+
+
+@event.listens_for(OrgUnit, "before_delete")
+def _closure_before_delete(mapper, connection: Connection, target: OrgUnit) -> None:
+    unlink_org_unit(connection, target.id)
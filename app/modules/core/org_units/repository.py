@@ -1,7 +1,17 @@
-from sqlmodel import Session
+from typing import Sequence
+from uuid import UUID
+
+import structlog
+from sqlalchemy import and_, delete, insert, literal, or_
+from sqlmodel import Session, col, func, select
 
 from app.core.repository import BaseRepository
-from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.org_units.models import OrgUnit, OrgUnitClosure
+
+logger = structlog.get_logger()
+
+# Hard stop for the recursive rebuild, on top of its cycle check
+MAX_HIERARCHY_DEPTH = 64
 
 
 class OrgUnitRepository(BaseRepository[OrgUnit]):
@@ -9,3 +19,93 @@ class OrgUnitRepository(BaseRepository[OrgUnit]):
 
     def __init__(self, session: Session):
         super().__init__(session, OrgUnit)
+
+    @staticmethod
+    def subtree_ids(root_id: UUID, include_self: bool = True):
+        """
+        Subquery with the ids of every unit under ``root_id`` at any depth,
+        meant for ``column.in_(...)`` filters on other repositories.
+        """
+        statement = select(OrgUnitClosure.descendant_id).where(
+            OrgUnitClosure.ancestor_id == root_id
+        )
+        if not include_self:
+            statement = statement.where(col(OrgUnitClosure.depth) > 0)
+        return statement
+
+    def get_descendants(
+        self,
+        id: UUID,
+        max_depth: int | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> Sequence[OrgUnit]:
+        statement = (
+            select(OrgUnit)
+            .join(OrgUnitClosure, col(OrgUnitClosure.descendant_id) == OrgUnit.id)
+            .where(OrgUnitClosure.ancestor_id == id, col(OrgUnitClosure.depth) > 0)
+        )
+        if max_depth is not None:
+            statement = statement.where(col(OrgUnitClosure.depth) <= max_depth)
+        statement = (
+            statement.order_by(col(OrgUnitClosure.depth), col(OrgUnit.name))
+            .offset(offset)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    def get_ancestors(self, id: UUID) -> Sequence[OrgUnit]:
+        """Ancestors of a unit, from the root down to its direct parent."""
+        statement = (
+            select(OrgUnit)
+            .join(OrgUnitClosure, col(OrgUnitClosure.ancestor_id) == OrgUnit.id)
+            .where(OrgUnitClosure.descendant_id == id, col(OrgUnitClosure.depth) > 0)
+            .order_by(col(OrgUnitClosure.depth).desc())
+        )
+        return self.session.exec(statement).all()
+
+    def is_in_subtree(self, root_id: UUID, id: UUID) -> bool:
+        statement = select(OrgUnitClosure.depth).where(
+            OrgUnitClosure.ancestor_id == root_id,
+            OrgUnitClosure.descendant_id == id,
+        )
+        return self.session.exec(statement).first() is not None
+
+    def rebuild_closure(self) -> int:
+        """
+        Recomputes the whole closure table from ``parent_id`` with a single
+        recursive query. Used after bulk loads that bypass the ORM.
+
+        A walk that comes back to its own ancestor has found a cycle in
+        ``parent_id``: it stops there, the loop-back pair is left out of the
+        closure and the units involved are logged.
+        """
+        tree = select(
+            col(OrgUnit.id).label("ancestor_id"),
+            col(OrgUnit.id).label("descendant_id"),
+            literal(0).label("depth"),
+        ).cte("tree", recursive=True)
+        tree = tree.union_all(
+            select(tree.c.ancestor_id, col(OrgUnit.id), tree.c.depth + 1).where(
+                col(OrgUnit.parent_id) == tree.c.descendant_id,
+                or_(tree.c.depth == 0, tree.c.descendant_id != tree.c.ancestor_id),
+                tree.c.depth < MAX_HIERARCHY_DEPTH,
+            )
+        )
+        looped = and_(tree.c.ancestor_id == tree.c.descendant_id, tree.c.depth > 0)
+        self.session.exec(delete(OrgUnitClosure))
+        self.session.exec(
+            insert(OrgUnitClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth).where(
+                    ~looped
+                ),
+            )
+        )
+        cycles = self.session.exec(select(tree.c.ancestor_id).where(looped)).all()
+        if cycles:
+            logger.warning(
+                "org_unit_hierarchy_cycles", org_unit_ids=sorted(map(str, cycles))
+            )
+        statement = select(func.count()).select_from(OrgUnitClosure)
+        return int(self.session.exec(statement).one())
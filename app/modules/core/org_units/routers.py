@@ -1,14 +1,20 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.auth.permissions import PermissionAction, PermissionChecker
 from app.auth.schemas import UserModulePermission
 from app.core.db import SessionDep
 from app.core.exceptions import NotFoundException
+from app.core.http_cache import etag_matches, not_modified, set_etag
 from app.modules.core.constants import CoreModuleSlug
 from app.modules.core.org_units.models import OrgUnit
-from app.modules.core.org_units.schemas import OrgUnitCreate, OrgUnitRead, OrgUnitUpdate
+from app.modules.core.org_units.schemas import (
+    OrgUnitCreate,
+    OrgUnitRead,
+    OrgUnitTreeNode,
+    OrgUnitUpdate,
+)
 from app.modules.core.org_units.service import OrgUnitService
 
 router = APIRouter(prefix="/org-units", tags=["Core Staff - Org Units"])
@@ -61,6 +67,35 @@ def count_org_units(
     return {"total": service.count(search)}
 
 
+@router.get("/tree", response_model=list[OrgUnitTreeNode])
+def get_org_unit_tree(
+    session: SessionDep,
+    request: Request,
+    root_id: UUID | None = Query(None, description="Subárbol a partir de esta unidad"),
+    max_depth: int | None = Query(None, ge=0, description="0 = solo la raíz"),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.STAFF, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """
+    Árbol organizacional anidado de las unidades activas en una sola petición.
+    Se arma con una sola consulta y se sirve desde caché hasta que cambie
+    alguna unidad. Soporta If-None-Match (304).
+    """
+    service = OrgUnitService(session)
+    etag = service.get_tree_etag(root_id, max_depth)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response = Response(
+        content=service.get_tree_json(root_id, max_depth),
+        media_type="application/json",
+    )
+    set_etag(response, etag)
+    return response
+
+
 @router.get("/acronym/{acronym}", response_model=list[OrgUnitRead])
 def get_org_units_by_acronym(
     session: SessionDep,
@@ -97,6 +132,46 @@ def count_org_units_by_acronym(
     return {"total": service.count_by_acronym(acronym, search)}
 
 
+@router.get("/{id}/descendants", response_model=list[OrgUnitRead])
+def get_org_unit_descendants(
+    session: SessionDep,
+    id: UUID,
+    max_depth: int | None = Query(None, ge=1),
+    offset: int = 0,
+    limit: int = 100,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.STAFF, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """
+    Todas las unidades bajo `id` a cualquier profundidad (o hasta `max_depth`),
+    ordenadas por nivel.
+    """
+    service = OrgUnitService(session)
+    if not service.get_by_id(id):
+        raise NotFoundException(detail="Org Unit not found")
+    return service.get_descendants(id, max_depth, offset, limit)
+
+
+@router.get("/{id}/ancestors", response_model=list[OrgUnitRead])
+def get_org_unit_ancestors(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.STAFF, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """Cadena de unidades superiores, desde la raíz hasta el padre directo."""
+    service = OrgUnitService(session)
+    if not service.get_by_id(id):
+        raise NotFoundException(detail="Org Unit not found")
+    return service.get_ancestors(id)
+
+
 @router.get("/{id}", response_model=OrgUnitRead)
 def get_org_unit(
     session: SessionDep,
@@ -27,3 +27,12 @@ class OrgUnitUpdate(BaseModel):
 
 class OrgUnitRead(OrgUnitBase):
     id: UUID
+
+
+class OrgUnitTreeNode(BaseModel):
+    id: UUID
+    external_id: int
+    name: str
+    acronym: str | None = None
+    type: str
+    children: list["OrgUnitTreeNode"] = []
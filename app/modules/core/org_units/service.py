@@ -3,8 +3,11 @@ from uuid import UUID
 
 from sqlmodel import Session
 
+from app.core.exceptions import BadRequestException
+from app.core.http_cache import compute_etag
 from app.modules.core.org_units.models import OrgUnit
 from app.modules.core.org_units.repository import OrgUnitRepository
+from app.modules.core.org_units.tree import get_org_tree_version, org_tree_cache
 
 
 class OrgUnitService:
@@ -28,6 +31,11 @@ class OrgUnitService:
         return self.repository.get_by_id(id)
 
     def update(self, id: UUID, data: dict) -> OrgUnit | None:
+        parent_id = data.get("parent_id")
+        if parent_id is not None and self.repository.is_in_subtree(id, parent_id):
+            raise BadRequestException(
+                detail="An org unit cannot be moved under itself or its descendants"
+            )
         return self.repository.update(id, data)
 
     def delete(self, id: UUID) -> bool:
@@ -74,6 +82,39 @@ class OrgUnitService:
         filters = self._get_management_filters(acronym)
         return self.repository.count(search, filters)
 
+    # --- Hierarchy (closure table) ---
+
+    def get_descendants(
+        self,
+        id: UUID,
+        max_depth: int | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> Sequence[OrgUnit]:
+        return self.repository.get_descendants(id, max_depth, offset, limit)
+
+    def get_ancestors(self, id: UUID) -> Sequence[OrgUnit]:
+        return self.repository.get_ancestors(id)
+
+    def get_tree_etag(
+        self, root_id: UUID | None = None, max_depth: int | None = None
+    ) -> str:
+        version = get_org_tree_version(self.repository.session)
+        return compute_etag("org-tree", version, root_id, max_depth)
+
+    def get_tree_json(
+        self, root_id: UUID | None = None, max_depth: int | None = None
+    ) -> bytes:
+        """Active org tree as serialized JSON, from the in-memory cache."""
+        session = self.repository.session
+        version = get_org_tree_version(session)
+        return org_tree_cache.get_payload(session, version, root_id, max_depth)
+
+    def rebuild_hierarchy(self) -> int:
+        rows = self.repository.rebuild_closure()
+        self.repository.session.commit()
+        return rows
+
     # --- Private Filter Methods (Ensures Consistency) ---
 
     def _get_acronym_filters(self, acronym: str) -> list:
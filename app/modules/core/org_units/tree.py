@@ -0,0 +1,174 @@
+"""
+Árbol organizacional completo: una sola consulta de las unidades activas,
+armado en O(n) y servido desde una caché en memoria.
+
+La caché se invalida por la versión de la tabla `core_org_unit`
+(`cache_versions`, ver `app/core/http_cache.py`), que se incrementa en la
+misma transacción que cualquier escritura de `OrgUnit`; así todos los workers
+detectan el cambio sin coordinación adicional.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, select
+from sqlmodel import Session, col
+
+from app.core.exceptions import NotFoundException
+from app.core.http_cache import get_table_versions, track_table_versions
+from app.modules.core.org_units.models import OrgUnit
+
+ORG_TREE_TABLE = OrgUnit.__tablename__
+track_table_versions([ORG_TREE_TABLE])
+
+TREE_FIELDS = ("id", "external_id", "name", "acronym", "type")
+
+type TreeKey = tuple[UUID | None, int | None]
+# TREE_FIELDS followed by parent_id
+type TreeRow = Row[tuple[UUID, int, str, str | None, str, UUID | None]]
+
+
+class OrgTreeIndex:
+    """Adjacency index of the active units, built once per table version."""
+
+    def __init__(self, rows: Sequence[TreeRow]) -> None:
+        self.nodes: dict[UUID, dict[str, Any]] = {}
+        self.children: dict[UUID | None, list[UUID]] = {}
+        parents: dict[UUID, UUID | None] = {}
+        for row in rows:
+            self.nodes[row.id] = {field: getattr(row, field) for field in TREE_FIELDS}
+            parents[row.id] = row.parent_id
+        for id, parent_id in parents.items():
+            # Units under an inactive parent surface as roots instead of vanishing
+            if parent_id not in self.nodes:
+                parents[id] = None
+            self.children.setdefault(parents[id], []).append(id)
+        self._break_cycles(parents)
+
+    def _break_cycles(self, parents: dict[UUID, UUID | None]) -> None:
+        """
+        Units left unreachable from the roots hang from a ``parent_id`` cycle
+        (bad external data). One unit of each cycle surfaces as a root, so the
+        cycle and everything under it is still listed.
+        """
+        reached: set[UUID] = set()
+        pending = list(self.children.get(None, []))
+        for id in parents:
+            while pending:
+                node = pending.pop()
+                reached.add(node)
+                pending.extend(self.children.get(node, []))
+            if id in reached:
+                continue
+            # Walk up until a unit repeats: that unit is on the cycle
+            seen: set[UUID] = set()
+            current: UUID | None = id
+            while current is not None and current not in seen:
+                seen.add(current)
+                current = parents[current]
+            if current is None:
+                continue
+            self.children[parents[current]].remove(current)
+            self.children.setdefault(None, []).append(current)
+            parents[current] = None
+            pending.append(current)
+
+    def build(
+        self, root_id: UUID | None = None, max_depth: int | None = None
+    ) -> list[dict[str, Any]]:
+        if root_id is not None and root_id not in self.nodes:
+            raise NotFoundException(detail="Org Unit not found or inactive")
+        top = [root_id] if root_id is not None else self.children.get(None, [])
+        visited: set[UUID] = set(top)
+        return [self._node(id, 0, max_depth, visited) for id in top]
+
+    def _node(
+        self, id: UUID, depth: int, max_depth: int | None, visited: set[UUID]
+    ) -> dict[str, Any]:
+        node = dict(self.nodes[id])
+        children: list[dict[str, Any]] = []
+        if max_depth is None or depth < max_depth:
+            for child in self.children.get(id, []):
+                # Each unit is emitted once, even if the index still loops
+                if child not in visited:
+                    visited.add(child)
+                    children.append(self._node(child, depth + 1, max_depth, visited))
+        node["children"] = children
+        return node
+
+
+class OrgTreeCache:
+    """
+    Serialized trees per (root, depth) for the current table version. A new
+    version drops everything; the number of variants kept is bounded.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self._index: OrgTreeIndex | None = None
+        self._payloads: OrderedDict[TreeKey, bytes] = OrderedDict()
+
+    def get_payload(
+        self,
+        session: Session,
+        version: int,
+        root_id: UUID | None = None,
+        max_depth: int | None = None,
+    ) -> bytes:
+        key: TreeKey = (root_id, max_depth)
+        with self._lock:
+            if self._version == version and key in self._payloads:
+                self._payloads.move_to_end(key)
+                return self._payloads[key]
+            index = self._index if self._version == version else None
+
+        if index is None:
+            index = OrgTreeIndex(self._load_rows(session))
+        payload = json.dumps(
+            index.build(root_id, max_depth), default=str, separators=(",", ":")
+        ).encode()
+
+        with self._lock:
+            if self._version != version:
+                self._version = version
+                self._index = index
+                self._payloads.clear()
+            self._payloads[key] = payload
+            if len(self._payloads) > self.max_entries:
+                self._payloads.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version = None
+            self._index = None
+            self._payloads.clear()
+
+    @staticmethod
+    def _load_rows(session: Session) -> Sequence[TreeRow]:
+        statement = (
+            select(
+                col(OrgUnit.id),
+                col(OrgUnit.external_id),
+                col(OrgUnit.name),
+                col(OrgUnit.acronym),
+                col(OrgUnit.type),
+                col(OrgUnit.parent_id),
+            )
+            .where(col(OrgUnit.is_active).is_(True))
+            .order_by(col(OrgUnit.name))
+        )
+        return session.execute(statement).all()
+
+
+org_tree_cache = OrgTreeCache()
+
+
+def get_org_tree_version(session: Session) -> int:
+    return get_table_versions(session, [ORG_TREE_TABLE])[ORG_TREE_TABLE]
@@ -12,7 +12,9 @@ if TYPE_CHECKING:
 class StaffPosition(BaseModel, AuditMixin, table=True):
     __tablename__ = "core_staff_position"
 
-    external_id: int = Field(index=True, description="Original system item number")
+    external_id: int = Field(
+        index=True, unique=True, description="Original system item number"
+    )
     item_number: int | None = Field(
         default=None, description="Public institution item number"
     )
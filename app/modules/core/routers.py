@@ -1,6 +1,7 @@
 """
 Módulo de enrutamiento unificado para el dominio Core.
-Agrega los submódulos de unidades organizacionales, cargos y personal.
+Agrega los submódulos de unidades organizacionales, cargos, personal y la
+sincronización SIGER.
 """
 
 from fastapi import APIRouter
@@ -10,6 +11,7 @@ import app.modules.core.catalogs  # noqa: F401
 from app.modules.core.org_units import routers as org_units_router
 from app.modules.core.positions import routers as positions_router
 from app.modules.core.staff import routers as staff_personnel_router
+from app.modules.core.sync import routers as sync_router
 from app.modules.core.users import routers as users_router
 
 router = APIRouter(prefix="/core")
@@ -19,3 +21,4 @@ router.include_router(org_units_router.router)
 router.include_router(positions_router.router)
 router.include_router(staff_personnel_router.router)
 router.include_router(users_router.router)
+router.include_router(sync_router.router)
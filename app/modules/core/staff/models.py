@@ -5,16 +5,21 @@ from typing import TYPE_CHECKING
 from sqlmodel import Field, Index, Relationship
 
 from app.models.base_model import BaseModel
-from app.models.mixins import AuditMixin
+from app.models.mixins import AuditMixin, SoftDeleteMixin, live_rows_index
 
 if TYPE_CHECKING:
     from app.modules.core.org_units.models import OrgUnit
     from app.modules.core.positions.models import StaffPosition
 
 
-class Staff(BaseModel, AuditMixin, table=True):
+class Staff(BaseModel, AuditMixin, SoftDeleteMixin, table=True):
     __tablename__ = "core_staff"
-    __table_args__ = (Index("ix_core_staff_pos_id", "position_id"),)
+    __table_args__ = (
+        Index("ix_core_staff_pos_id", "position_id"),
+        live_rows_index(
+            "ix_core_staff_live_org_unit_id_full_name", "org_unit_id", "full_name"
+        ),
+    )
 
     external_id: int = Field(index=True, unique=True, description="Orig. system ID")
     first_name: str = Field(max_length=100)
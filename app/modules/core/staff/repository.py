@@ -1,55 +1,46 @@
-import uuid
-from typing import Any, Optional, Sequence
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Session
 
-from sqlalchemy.orm import selectinload
-from sqlmodel import Session, select
-
-from app.core.repository import BaseRepository
+from app.core.repository import BaseRepository, LoadingProfiles
 from app.modules.core.org_units.models import OrgUnit
 from app.modules.core.staff.models import Staff
 
 
 class StaffRepository(BaseRepository[Staff]):
     searchable_fields = ["full_name", "document_number", "email", "cellphone"]
-
-    def __init__(self, session: Session):
-        super().__init__(session, Staff)
-
-    def get_all(
-        self,
-        offset: int = 0,
-        limit: int = 100,
-        sort_by: Optional[str] = None,
-        sort_order: str = "asc",
-        search: Optional[str] = None,
-        extra_filters: Optional[list[Any]] = None,
-    ) -> Sequence[Staff]:
-        statement = select(self.model).options(
+    # Public StaffRead columns (external_id, phone, status... stay hidden)
+    selectable_fields = [
+        "id",
+        "first_name",
+        "last_name_1",
+        "last_name_2",
+        "full_name",
+        "birth_date",
+        "document_number",
+        "document_location",
+        "email",
+        "cellphone",
+        "address",
+        "is_active",
+        "position_id",
+        "org_unit_id",
+    ]
+
+    @classmethod
+    def loading_profiles(cls) -> LoadingProfiles:
+        relations = (
             selectinload(Staff.position),  # type: ignore[arg-type]
             selectinload(Staff.org_unit).selectinload(OrgUnit.parent),  # type: ignore[arg-type]
         )
-        statement = self._apply_search(statement, search)
-
-        if extra_filters:
-            statement = statement.where(*extra_filters)
+        return {
+            "list": relations,
+            "detail": relations,
+            # Streamed with yield_per: many-to-one joins instead of per-batch IN
+            "export": (
+                joinedload(Staff.position),  # type: ignore[arg-type]
+                joinedload(Staff.org_unit).joinedload(OrgUnit.parent),  # type: ignore[arg-type]
+            ),
+        }
 
-        if sort_by and hasattr(self.model, sort_by):
-            column = getattr(self.model, sort_by)
-            if sort_order.lower() == "desc":
-                statement = statement.order_by(column.desc())
-            else:
-                statement = statement.order_by(column.asc())
-
-        statement = statement.offset(offset).limit(limit)
-        return self.session.exec(statement).all()  # type: ignore[no-any-return]
-
-    def get_by_id(self, id: uuid.UUID | int) -> Optional[Staff]:
-        statement = (
-            select(Staff)
-            .where(Staff.id == id)
-            .options(
-                selectinload(Staff.position),  # type: ignore[arg-type]
-                selectinload(Staff.org_unit).selectinload(OrgUnit.parent),  # type: ignore[arg-type]
-            )
-        )
-        return self.session.exec(statement).first()
+    def __init__(self, session: Session):
+        super().__init__(session, Staff)
@@ -6,10 +6,14 @@ from app.auth.permissions import PermissionAction, PermissionChecker
 from app.auth.schemas import UserModulePermission
 from app.core.db import SessionDep
 from app.core.exceptions import NotFoundException
+from app.core.export import ExportFormat, export_response, schema_columns
+from app.core.fieldsets import fieldset_response
+from app.core.serialization import json_response
 from app.modules.core.constants import CoreModuleSlug
 from app.modules.core.staff.models import Staff
 from app.modules.core.staff.schemas import (
     StaffCreate,
+    StaffExportRow,
     StaffRead,
     StaffReadDetailed,
     StaffUpdate,
@@ -44,6 +48,12 @@ def get_staff_list(
     search: str | None = Query(None),
     is_active: bool | None = Query(None),
     org_unit_id: UUID | None = Query(None),
+    org_unit_subtree_id: UUID | None = Query(
+        None, description="Unidad raíz: incluye todas sus dependencias"
+    ),
+    fields: str | None = Query(
+        None, description="Columnas separadas por coma (sparse fieldset)"
+    ),
     _: UserModulePermission = Depends(
         PermissionChecker(
             module_slug=CoreModuleSlug.STAFF, required_permission=PermissionAction.READ
@@ -51,7 +61,21 @@ def get_staff_list(
     ),
 ):
     service = StaffService(session)
-    return service.get_all(
+    selected = service.parse_fields(fields)
+    if selected:
+        rows = service.get_all_fields(
+            selected,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            search=search,
+            is_active=is_active,
+            org_unit_id=org_unit_id,
+            org_unit_subtree_id=org_unit_subtree_id,
+        )
+        return fieldset_response(StaffRead, selected, rows)
+    staff = service.get_all(
         offset=offset,
         limit=limit,
         sort_by=sort_by,
@@ -59,7 +83,10 @@ def get_staff_list(
         search=search,
         is_active=is_active,
         org_unit_id=org_unit_id,
+        org_unit_subtree_id=org_unit_subtree_id,
     )
+    # Nested org unit ancestry: validated from the ORM objects
+    return json_response(list[StaffReadDetailed], staff)
 
 
 @router.get("/count")
@@ -68,6 +95,9 @@ def count_staff(
     search: str | None = Query(None),
     is_active: bool | None = Query(None),
     org_unit_id: UUID | None = Query(None),
+    org_unit_subtree_id: UUID | None = Query(
+        None, description="Unidad raíz: incluye todas sus dependencias"
+    ),
     _: UserModulePermission = Depends(
         PermissionChecker(
             module_slug=CoreModuleSlug.STAFF, required_permission=PermissionAction.READ
@@ -80,10 +110,47 @@ def count_staff(
             search=search,
             is_active=is_active,
             org_unit_id=org_unit_id,
+            org_unit_subtree_id=org_unit_subtree_id,
         )
     }
 
 
+@router.get("/export")
+def export_staff(
+    session: SessionDep,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    sort_by: str | None = Query(None),
+    sort_order: str = Query("asc"),
+    search: str | None = Query(None),
+    is_active: bool | None = Query(None),
+    org_unit_id: UUID | None = Query(None),
+    org_unit_subtree_id: UUID | None = Query(
+        None, description="Unidad raíz: incluye todas sus dependencias"
+    ),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.STAFF, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    """
+    Exporta todo el personal que cumple la búsqueda y los filtros del listado,
+    en streaming (CSV, NDJSON o XLSX) sin paginación.
+    """
+    service = StaffService(session)
+    batches = service.export_batches(
+        sort_by=sort_by,
+        sort_order=sort_order,
+        search=search,
+        is_active=is_active,
+        org_unit_id=org_unit_id,
+        org_unit_subtree_id=org_unit_subtree_id,
+    )
+    return export_response(
+        batches, schema_columns(StaffExportRow), export_format, "staff"
+    )
+
+
 @router.get("/{id}", response_model=StaffReadDetailed)
 def get_staff(
     session: SessionDep,
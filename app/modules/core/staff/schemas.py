@@ -81,7 +81,9 @@ class StaffRead(StaffBase):
     staff_type: str = Field(exclude=True)
 
 
-class StaffReadDetailed(StaffRead):
+class StaffExportRow(StaffRead):
+    """Fila plana (solo nombres relacionados) para exportaciones."""
+
     # Usamos alias internos para la lógica pero exponemos lo que pidió el usuario
     position_detail: StaffPositionRead | None = Field(
         None, alias="position", exclude=True
@@ -113,6 +115,8 @@ class StaffReadDetailed(StaffRead):
     def position_name(self) -> str | None:
         return self.position_detail.name if self.position_detail else None
 
+
+class StaffReadDetailed(StaffExportRow):
     @computed_field  # type: ignore[prop-decorator]
     @property
     def position(self) -> StaffPositionSimple | None:
@@ -1,10 +1,16 @@
-from typing import Sequence
+from typing import Iterator, Sequence
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlalchemy import ColumnElement, RowMapping
+from sqlmodel import Session, col
 
+from app.core.config import settings
+from app.core.export import Batch, serialize_batches
+from app.core.fieldsets import parse_fields
+from app.modules.core.org_units.repository import OrgUnitRepository
 from app.modules.core.staff.models import Staff
 from app.modules.core.staff.repository import StaffRepository
+from app.modules.core.staff.schemas import StaffExportRow
 
 
 class StaffService:
@@ -15,12 +21,19 @@ class StaffService:
         self,
         is_active: bool | None = None,
         org_unit_id: UUID | None = None,
-    ) -> list:
-        filters = []
+        org_unit_subtree_id: UUID | None = None,
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
         if is_active is not None:
-            filters.append(Staff.is_active == is_active)
+            filters.append(col(Staff.is_active) == is_active)
         if org_unit_id:
-            filters.append(Staff.org_unit_id == org_unit_id)
+            filters.append(col(Staff.org_unit_id) == org_unit_id)
+        if org_unit_subtree_id:
+            filters.append(
+                col(Staff.org_unit_id).in_(
+                    OrgUnitRepository.subtree_ids(org_unit_subtree_id)
+                )
+            )
         return filters
 
     def create(self, data: Staff) -> Staff:
@@ -35,14 +48,61 @@ class StaffService:
         search: str | None = None,
         is_active: bool | None = None,
         org_unit_id: UUID | None = None,
+        org_unit_subtree_id: UUID | None = None,
     ) -> Sequence[Staff]:
-        filters = self._build_filters(is_active, org_unit_id)
+        filters = self._build_filters(is_active, org_unit_id, org_unit_subtree_id)
         return self.repository.get_all(
-            offset, limit, sort_by, sort_order, search, extra_filters=filters
+            offset,
+            limit,
+            sort_by,
+            sort_order,
+            search,
+            extra_filters=filters,
+            profile="list",
         )
 
+    def parse_fields(self, fields: str | None) -> tuple[str, ...] | None:
+        return parse_fields(fields, self.repository.selectable_fields)
+
+    def get_all_fields(
+        self,
+        fields: tuple[str, ...],
+        offset: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        search: str | None = None,
+        is_active: bool | None = None,
+        org_unit_id: UUID | None = None,
+        org_unit_subtree_id: UUID | None = None,
+    ) -> Sequence[RowMapping]:
+        filters = self._build_filters(is_active, org_unit_id, org_unit_subtree_id)
+        return self.repository.get_all_fields(
+            fields, offset, limit, sort_by, sort_order, search, extra_filters=filters
+        )
+
+    def export_batches(
+        self,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        search: str | None = None,
+        is_active: bool | None = None,
+        org_unit_id: UUID | None = None,
+        org_unit_subtree_id: UUID | None = None,
+    ) -> Iterator[Batch]:
+        filters = self._build_filters(is_active, org_unit_id, org_unit_subtree_id)
+        batches = self.repository.stream_all(
+            sort_by,
+            sort_order,
+            search,
+            extra_filters=filters,
+            profile="export",
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+        return serialize_batches(batches, StaffExportRow)
+
     def get_by_id(self, id: UUID) -> Staff | None:
-        return self.repository.get_by_id(id)
+        return self.repository.get_by_id(id, profile="detail")
 
     def update(self, id: UUID, data: dict) -> Staff | None:
         return self.repository.update(id, data)
@@ -55,6 +115,7 @@ class StaffService:
         search: str | None = None,
         is_active: bool | None = None,
         org_unit_id: UUID | None = None,
+        org_unit_subtree_id: UUID | None = None,
     ) -> int:
-        filters = self._build_filters(is_active, org_unit_id)
+        filters = self._build_filters(is_active, org_unit_id, org_unit_subtree_id)
         return self.repository.count(search, extra_filters=filters)
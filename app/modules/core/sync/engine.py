@@ -0,0 +1,380 @@
+"""
+Motor de sincronización SIGER → Core basado en operaciones por conjuntos.
+
+En lugar de un SELECT por fila, cada tabla local se resuelve con un mapa
+`external_id → UUID` cargado una sola vez, las filas se escriben en lotes con
+`INSERT … ON CONFLICT (external_id) DO UPDATE` y los padres de las unidades se
+enlazan con un único `UPDATE … FROM`.
+
+Modo delta (por defecto): cada fila de origen se compara por hash de contenido
+contra `core_sync_row_hash` y solo se escriben las altas y los cambios; las
+filas que desaparecen del origen se desactivan. Donde el origen expone una
+columna de modificación se guarda un high-water mark y solo se leen las filas
+posteriores. El costo del sync nocturno escala con el volumen de cambios.
+"""
+
+import hashlib
+import json
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from datetime import date, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import Row, Table, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, col, select
+
+from app.core.audit import record_bulk_changes, system_job
+from app.core.config import settings
+from app.core.db import dialect_insert
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.org_units.repository import OrgUnitRepository
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+from app.modules.core.sync import source
+from app.modules.core.sync.models import SyncRowHash, SyncWatermark
+from app.modules.core.sync.reader import stream_batches
+from app.util.datetime import get_current_time
+
+logger = structlog.get_logger()
+
+# Columns never overwritten when an existing row is upserted
+IMMUTABLE_COLUMNS = {"id", "external_id", "created_at", "created_by_id"}
+
+CHANGE_TYPES = ("inserted", "updated", "deactivated", "unchanged", "skipped")
+
+# Audit: one summary event per written batch instead of per-row entries
+SYNC_JOB_NAME = "siger_sync"
+
+type CheckpointCallback = Callable[[str, int, dict[str, int]], None]
+
+
+def position_values(row: Row) -> dict[str, Any]:
+    return {
+        "external_id": row.id,
+        "item_number": row.nro_item,
+        "name": row.nombre,
+        "level": row.nivel,
+        "position_type": row.tipo_puesto,
+        "is_active": row.is_active,
+    }
+
+
+def org_unit_values(row: Row) -> dict[str, Any]:
+    return {
+        "external_id": row.id,
+        "external_parent_id": row.parent_id,
+        "name": row.nombre,
+        "acronym": row.sigla,
+        "general_unit": row.unidad_general,
+        "type": row.tipo,
+        "is_active": row.is_active,
+    }
+
+
+def staff_values(
+    row: Row, position_id: uuid.UUID, org_unit_id: uuid.UUID
+) -> dict[str, Any]:
+    return {
+        "external_id": row.id,
+        "first_name": row.nombres,
+        "last_name_1": row.primer_apellido or "",
+        "last_name_2": row.segundo_apellido,
+        "full_name": row.nombre_completo,
+        "birth_date": row.fecha_nacimiento,
+        "document_number": row.nro_documento,
+        "document_location": row.lugar_emision,
+        "email": row.email_interno,
+        "cellphone": row.celular,
+        "phone": row.telefono,
+        "address": row.direccion,
+        "status": row.estado,
+        "staff_type": row.tipo,
+        "is_active": row.is_active,
+        "position_id": position_id,
+        "org_unit_id": org_unit_id,
+    }
+
+
+def content_hash(values: dict[str, Any]) -> str:
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def chunked[T](items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class SyncEntity:
+    """How one source table maps onto a local model."""
+
+    def __init__(
+        self,
+        name: str,
+        model: type[SQLModel],
+        table: Table,
+        watermark_column: str | None = None,
+    ):
+        self.name = name
+        self.model = model
+        self.table = table
+        # SIGER tables expose no modification column today
+        self.watermark_column = watermark_column
+
+
+POSITIONS = SyncEntity("positions", StaffPosition, source.cargo)
+ORG_UNITS = SyncEntity("org_units", OrgUnit, source.unidad_organizacional)
+STAFF = SyncEntity("staff", Staff, source.funcionario)
+
+
+class SigerSyncEngine:
+    def __init__(
+        self,
+        source_engine: Engine,
+        session: Session,
+        chunk_size: int | None = None,
+        full: bool = False,
+        checkpoints: dict[str, dict[str, Any]] | None = None,
+        on_checkpoint: CheckpointCallback | None = None,
+    ):
+        self.source_engine = source_engine
+        self.session = session
+        self.chunk_size = chunk_size or settings.SYNC_CHUNK_SIZE
+        # Full mode ignores stored hashes and watermarks and rewrites every row
+        self.full = full
+        # Resume points per entity: {"after_id": ..., "counts": {...}}
+        self.checkpoints = checkpoints or {}
+        # Called after each committed batch with (entity, last external id, counts)
+        self.on_checkpoint = on_checkpoint
+
+    def run(self) -> dict[str, dict[str, int]]:
+        with system_job(SYNC_JOB_NAME):
+            stats = {
+                POSITIONS.name: self.sync_positions(),
+                ORG_UNITS.name: self.sync_org_units(),
+                STAFF.name: self.sync_staff(),
+            }
+        logger.info("siger_sync_completed", full=self.full, **stats)
+        return stats
+
+    def run_step(self, name: str) -> dict[str, int]:
+        with system_job(SYNC_JOB_NAME):
+            return getattr(self, f"sync_{name}")()  # type: ignore[no-any-return]
+
+    def sync_positions(self) -> dict[str, int]:
+        return self._sync(POSITIONS, position_values)
+
+    def sync_org_units(self) -> dict[str, int]:
+        stats = self._sync(ORG_UNITS, org_unit_values)
+        if stats["inserted"] or stats["updated"] or stats["deactivated"]:
+            stats["parents_linked"] = self.link_org_unit_parents()
+        return stats
+
+    def link_org_unit_parents(self) -> int:
+        """
+        Resolves ``parent_id`` from ``external_parent_id`` for every unit in a
+        single UPDATE … FROM, then rebuilds the hierarchy closure.
+        """
+        units = OrgUnit.__table__  # type: ignore[attr-defined]
+        parent = units.alias("parent")
+        statement = (
+            update(units)
+            .where(
+                units.c.external_parent_id == parent.c.external_id,
+                units.c.parent_id.is_distinct_from(parent.c.id),
+            )
+            .values(parent_id=parent.c.id)
+        )
+        linked = self.session.exec(statement).rowcount
+        OrgUnitRepository(self.session).rebuild_closure()
+        self.session.commit()
+        return int(linked)
+
+    def sync_staff(self) -> dict[str, int]:
+        position_ids = self._id_map(StaffPosition)
+        org_unit_ids = self._id_map(OrgUnit)
+
+        def resolve(row: Row) -> dict[str, Any] | None:
+            position_id = position_ids.get(row.cargo_id)
+            # Priority: departamento_id, fallback: gerencia_id
+            org_unit_id = org_unit_ids.get(row.departamento_id or row.gerencia_id)
+            if not position_id or not org_unit_id:
+                logger.warning("siger_sync_staff_skipped", external_id=row.id)
+                return None
+            return staff_values(row, position_id, org_unit_id)
+
+        return self._sync(STAFF, resolve)
+
+    def _sync(
+        self,
+        entity: SyncEntity,
+        to_values: Callable[[Row], dict[str, Any] | None],
+    ) -> dict[str, int]:
+        resume = self.checkpoints.get(entity.name) or {}
+        stats = {**dict.fromkeys(CHANGE_TYPES, 0), **resume.get("counts", {})}
+        local = self._local_state(entity.model)
+        hashes = {} if self.full else self._hash_map(entity.name)
+        watermark = None if self.full else self._get_watermark(entity)
+
+        high_water = watermark
+        for batch in self._stream(entity, watermark, resume.get("after_id")):
+            rows, new_hashes = [], {}
+            batch_counts = {"CREATE": 0, "UPDATE": 0}
+            for row in batch:
+                if entity.watermark_column:
+                    mark = getattr(row, entity.watermark_column)
+                    if mark is not None and (high_water is None or mark > high_water):
+                        high_water = mark
+                values = to_values(row)
+                if values is None:
+                    stats["skipped"] += 1
+                    continue
+                digest = content_hash(values)
+                if row.id in local and hashes.get(row.id) == digest:
+                    stats["unchanged"] += 1
+                    continue
+                stats["updated" if row.id in local else "inserted"] += 1
+                batch_counts["UPDATE" if row.id in local else "CREATE"] += 1
+                rows.append(values)
+                new_hashes[row.id] = digest
+            # Written while the reader thread fetches the next batch
+            self._upsert(entity.model, rows)
+            self._store_hashes(entity.name, new_hashes)
+            if rows:
+                record_bulk_changes(
+                    self.session, entity.model.__name__, batch_counts, new_hashes
+                )
+            if self.on_checkpoint:
+                # Batches are committed in source-id order: a failed run
+                # resumes after the last committed one
+                self.session.commit()
+                self.on_checkpoint(entity.name, batch[-1].id, dict(stats))
+
+        vanished = self._vanished(entity, local)
+        self._deactivate(entity, vanished)
+        stats["deactivated"] = len(vanished)
+
+        if high_water is not None and high_water != watermark:
+            self._set_watermark(entity, high_water)
+        self.session.commit()
+        return stats
+
+    def _stream(
+        self, entity: SyncEntity, watermark: Any, after_id: int | None = None
+    ) -> Iterator[Sequence[Row]]:
+        statement = entity.table.select().order_by(entity.table.c.id)
+        if entity.watermark_column and watermark is not None:
+            statement = statement.where(
+                entity.table.c[entity.watermark_column] > watermark
+            )
+        if after_id is not None:
+            statement = statement.where(entity.table.c.id > after_id)
+        return stream_batches(self.source_engine, statement, self.chunk_size)
+
+    def _vanished(
+        self, entity: SyncEntity, local: dict[int, tuple[uuid.UUID, bool]]
+    ) -> list[int]:
+        """Active local rows whose external id no longer exists at the source."""
+        keys = {
+            row.id
+            for batch in stream_batches(
+                self.source_engine, select(entity.table.c.id), self.chunk_size
+            )
+            for row in batch
+        }
+        return [
+            external_id
+            for external_id, (_, is_active) in local.items()
+            if is_active and external_id not in keys
+        ]
+
+    def _deactivate(self, entity: SyncEntity, external_ids: list[int]) -> None:
+        model: Any = entity.model
+        now = get_current_time()
+        for chunk in chunked(external_ids, self.chunk_size):
+            self.session.exec(
+                update(model)
+                .where(col(model.external_id).in_(chunk))
+                .values(is_active=False, updated_at=now)
+            )
+            record_bulk_changes(
+                self.session, model.__name__, {"DEACTIVATE": len(chunk)}, chunk
+            )
+            # Forget their hashes: a row coming back must be rewritten
+            self.session.exec(
+                SyncRowHash.__table__.delete().where(  # type: ignore[attr-defined]
+                    col(SyncRowHash.entity) == entity.name,
+                    col(SyncRowHash.external_id).in_(chunk),
+                )
+            )
+
+    def _local_state(self, model: Any) -> dict[int, tuple[uuid.UUID, bool]]:
+        statement = select(col(model.external_id), col(model.id), col(model.is_active))
+        return {
+            external_id: (id, is_active)
+            for external_id, id, is_active in self.session.exec(statement).all()
+        }
+
+    def _id_map(self, model: Any) -> dict[int, uuid.UUID]:
+        statement = select(col(model.external_id), col(model.id))
+        return dict(self.session.exec(statement).all())
+
+    def _hash_map(self, entity: str) -> dict[int, str]:
+        statement = select(SyncRowHash.external_id, SyncRowHash.content_hash).where(
+            SyncRowHash.entity == entity
+        )
+        return dict(self.session.exec(statement).all())
+
+    def _store_hashes(self, entity: str, hashes: dict[int, str]) -> None:
+        rows = [
+            {"entity": entity, "external_id": external_id, "content_hash": digest}
+            for external_id, digest in hashes.items()
+        ]
+        for chunk in chunked(rows, self.chunk_size):
+            statement = dialect_insert(self.session, SyncRowHash).values(chunk)
+            statement = statement.on_conflict_do_update(
+                index_elements=["entity", "external_id"],
+                set_={"content_hash": statement.excluded.content_hash},
+            )
+            self.session.exec(statement)
+
+    def _get_watermark(self, entity: SyncEntity) -> Any:
+        if not entity.watermark_column:
+            return None
+        mark = self.session.get(SyncWatermark, entity.name)
+        if not mark:
+            return None
+        python_type = entity.table.c[entity.watermark_column].type.python_type
+        if issubclass(python_type, (date, datetime)):
+            return python_type.fromisoformat(mark.value)
+        return python_type(mark.value)
+
+    def _set_watermark(self, entity: SyncEntity, value: Any) -> None:
+        now = get_current_time()
+        stored = value.isoformat() if isinstance(value, date) else str(value)
+        statement = dialect_insert(self.session, SyncWatermark).values(
+            entity=entity.name, value=stored, updated_at=now
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["entity"], set_={"value": stored, "updated_at": now}
+        )
+        self.session.exec(statement)
+
+    def _upsert(self, model: type[SQLModel], rows: Sequence[dict[str, Any]]) -> None:
+        """Chunked INSERT … ON CONFLICT (external_id) DO UPDATE."""
+        now = get_current_time()
+        for chunk in chunked(rows, self.chunk_size):
+            values = [{"id": uuid.uuid7(), "created_at": now, **r} for r in chunk]  # type: ignore[attr-defined]
+            statement = dialect_insert(self.session, model).values(values)
+            updates = {
+                name: statement.excluded[name]
+                for name in values[0]
+                if name not in IMMUTABLE_COLUMNS
+            }
+            updates["updated_at"] = now
+            statement = statement.on_conflict_do_update(
+                index_elements=["external_id"], set_=updates
+            )
+            self.session.exec(statement)
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, Column
+from sqlmodel import DateTime, Field, SQLModel
+
+from app.models.base_model import BaseModel
+from app.util.datetime import get_current_time
+
+
+class SyncRowHash(SQLModel, table=True):
+    """
+    Content hash of the last synced version of each source row. Rows whose
+    hash is unchanged are skipped entirely by the delta sync.
+    """
+
+    __tablename__ = "core_sync_row_hash"
+
+    entity: str = Field(primary_key=True, max_length=50)
+    external_id: int = Field(primary_key=True)
+    content_hash: str = Field(max_length=64)
+
+
+class SyncWatermark(SQLModel, table=True):
+    """
+    High-water mark per entity, for sources exposing a modification column:
+    only rows past it are read on the next run.
+    """
+
+    __tablename__ = "core_sync_watermark"
+
+    entity: str = Field(primary_key=True, max_length=50)
+    value: str = Field(max_length=50)
+    updated_at: datetime = Field(
+        default_factory=get_current_time,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+    )
+
+
+class SyncRunStatus:
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class SyncRun(BaseModel, table=True):
+    """
+    One execution of the SIGER sync. ``steps`` keeps, per entity, its status,
+    counts, timing and the last committed source id, so a failed run can be
+    resumed where it stopped.
+    """
+
+    __tablename__ = "core_sync_run"
+
+    status: str = Field(default=SyncRunStatus.RUNNING, max_length=20, index=True)
+    full: bool = Field(default=False)
+    steps: dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    error: str | None = Field(default=None)
+    attempts: int = Field(default=1)
+    triggered_by: str | None = Field(default=None, max_length=100)
+    started_at: datetime = Field(
+        default_factory=get_current_time,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+        index=True,
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=False),  # type: ignore[call-overload]
+    )
@@ -0,0 +1,67 @@
+"""
+Lectura en streaming de la base de origen.
+
+Las filas se leen con un cursor del lado del servidor (`stream_results`) en
+lotes de tamaño fijo, como tuplas livianas. Un hilo lector llena una cola
+acotada mientras el hilo principal escribe el lote anterior: la memoria pico
+es de unos pocos lotes y las escrituras se solapan con las lecturas.
+"""
+
+import queue
+import threading
+from collections.abc import Iterator, Sequence
+
+from sqlalchemy import Executable, Row
+from sqlalchemy.engine import Engine
+
+# Batches read ahead of the writer; bounds peak memory
+PREFETCH_BATCHES = 2
+
+_DONE = object()
+
+
+def stream_batches(
+    engine: Engine,
+    statement: Executable,
+    batch_size: int,
+    prefetch: int = PREFETCH_BATCHES,
+) -> Iterator[Sequence[Row]]:
+    batches: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        # Gives up once the consumer has gone away
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read() -> None:
+        try:
+            with engine.connect() as connection:
+                result = connection.execution_options(
+                    stream_results=True, yield_per=batch_size
+                ).execute(statement)
+                for batch in result.partitions(batch_size):
+                    if not put(batch):
+                        return
+            put(_DONE)
+        except BaseException as exc:  # re-raised in the consumer
+            put(exc)
+
+    reader = threading.Thread(target=read, name="siger-reader", daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = batches.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        reader.join()
@@ -0,0 +1,91 @@
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Depends
+
+from app.auth.permissions import PermissionAction, PermissionChecker
+from app.auth.schemas import UserModulePermission
+from app.auth.utils import get_current_user
+from app.core.db import SessionDep
+from app.core.exceptions import NotFoundException
+from app.models.user import User
+from app.modules.core.constants import CoreModuleSlug
+from app.modules.core.sync.schemas import SyncRunCreate, SyncRunRead
+from app.modules.core.sync.service import (
+    SyncRunService,
+    execute_sync_run,
+    get_source_engine,
+)
+
+router = APIRouter(prefix="/sync", tags=["Core Staff - SIGER Sync"])
+
+
+@router.post("/runs", response_model=SyncRunRead, status_code=202)
+def start_sync_run(
+    session: SessionDep,
+    data: SyncRunCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.SYNC,
+            required_permission=PermissionAction.CREATE,
+        )
+    ),
+):
+    """
+    Lanza una sincronización SIGER en segundo plano. El avance y las métricas
+    por entidad se consultan en `GET /sync/runs/{id}`.
+    """
+    source_engine = get_source_engine()
+    run = SyncRunService(session).start(data.full, current_user.username)
+    background_tasks.add_task(execute_sync_run, run.id, source_engine)
+    return run
+
+
+@router.post("/runs/{id}/resume", response_model=SyncRunRead, status_code=202)
+def resume_sync_run(
+    session: SessionDep,
+    id: UUID,
+    background_tasks: BackgroundTasks,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.SYNC,
+            required_permission=PermissionAction.UPDATE,
+        )
+    ),
+):
+    """Reanuda una corrida fallida desde su último checkpoint."""
+    source_engine = get_source_engine()
+    run = SyncRunService(session).resume(id)
+    background_tasks.add_task(execute_sync_run, run.id, source_engine)
+    return run
+
+
+@router.get("/runs", response_model=list[SyncRunRead])
+def get_sync_runs(
+    session: SessionDep,
+    offset: int = 0,
+    limit: int = 20,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.SYNC, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    return SyncRunService(session).get_all(offset, limit)
+
+
+@router.get("/runs/{id}", response_model=SyncRunRead)
+def get_sync_run(
+    session: SessionDep,
+    id: UUID,
+    _: UserModulePermission = Depends(
+        PermissionChecker(
+            module_slug=CoreModuleSlug.SYNC, required_permission=PermissionAction.READ
+        )
+    ),
+):
+    run = SyncRunService(session).get_by_id(id)
+    if not run:
+        raise NotFoundException(detail="Sync run not found")
+    return run
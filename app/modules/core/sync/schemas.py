@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SyncRunCreate(BaseModel):
+    full: bool = False
+
+
+class SyncRunRead(BaseModel):
+    id: uuid.UUID
+    status: str
+    full: bool
+    steps: dict[str, Any]
+    error: str | None = None
+    attempts: int
+    triggered_by: str | None = None
+    started_at: datetime
+    finished_at: datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,262 @@
+import contextvars
+import copy
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, col, create_engine, select
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.core.sync.engine import SigerSyncEngine
+from app.modules.core.sync.models import SyncRun, SyncRunStatus
+from app.util.datetime import get_current_time
+
+logger = structlog.get_logger()
+
+# Each step runs after the steps it depends on; independent steps in parallel
+SYNC_DAG: dict[str, tuple[str, ...]] = {
+    "positions": (),
+    "org_units": (),
+    "staff": ("positions", "org_units"),
+}
+
+
+class StepStatus:
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    SKIPPED = "SKIPPED"
+
+
+@lru_cache(maxsize=1)
+def get_source_engine() -> Engine:
+    if not settings.SYNC_DATABASE_URL:
+        raise BadRequestException(detail="SYNC_DATABASE_URL is not configured")
+    return create_engine(settings.SYNC_DATABASE_URL, echo=False)
+
+
+class SyncOrchestrator:
+    """
+    Runs the sync steps of one ``SyncRun`` following ``SYNC_DAG``. Every step
+    works in its own session and commits batch by batch; progress is written
+    to the run after each batch, so a failed run resumes from its last
+    checkpoint and completed steps are not repeated.
+    """
+
+    def __init__(
+        self,
+        run_id: UUID,
+        source_engine: Engine,
+        target_engine: Engine,
+        max_workers: int | None = None,
+    ):
+        self.run_id = run_id
+        self.source_engine = source_engine
+        self.target_engine = target_engine
+        self.max_workers = max_workers or settings.SYNC_MAX_WORKERS
+        # SQLite (tests / local) shares one connection: steps run one at a time
+        if target_engine.dialect.name == "sqlite":
+            self.max_workers = 1
+        self._lock = threading.Lock()
+        self.steps: dict[str, dict[str, Any]] = {}
+        self.full = False
+
+    def execute(self) -> SyncRun:
+        with Session(self.target_engine) as session:
+            run = session.get(SyncRun, self.run_id)
+            if not run:
+                raise NotFoundException(detail="Sync run not found")
+            self.full = run.full
+            self.steps = copy.deepcopy(run.steps or {})
+        for name in SYNC_DAG:
+            step = self.steps.setdefault(name, {"status": StepStatus.PENDING})
+            if step["status"] != StepStatus.COMPLETED:
+                step["status"] = StepStatus.PENDING
+
+        started = time.monotonic()
+        self._run_dag()
+        failed = [
+            name
+            for name, step in self.steps.items()
+            if step["status"] != StepStatus.COMPLETED
+        ]
+        status = SyncRunStatus.FAILED if failed else SyncRunStatus.COMPLETED
+        error = "; ".join(
+            f"{name}: {self.steps[name]['error']}"
+            for name in failed
+            if self.steps[name].get("error")
+        )
+        self._persist(
+            status=status, error=error or None, finished_at=get_current_time()
+        )
+        logger.info(
+            "sync_run_finished",
+            run_id=str(self.run_id),
+            status=status,
+            duration_ms=int((time.monotonic() - started) * 1000),
+        )
+        with Session(self.target_engine) as session:
+            return session.get(SyncRun, self.run_id)  # type: ignore[return-value]
+
+    def _run_dag(self) -> None:
+        running: dict[Future, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="siger-sync"
+        ) as executor:
+            while True:
+                for name in self._ready_steps():
+                    self._set_step(name, status=StepStatus.RUNNING)
+                    # copy_context keeps the caller's audit user in the workers
+                    context = contextvars.copy_context()
+                    future = executor.submit(context.run, self._run_step, name)
+                    running[future] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+
+    def _ready_steps(self) -> list[str]:
+        blocked = {StepStatus.FAILED, StepStatus.SKIPPED}
+        # Dependents of a failed step are skipped, transitively
+        changed = True
+        while changed:
+            changed = False
+            for name, depends_on in SYNC_DAG.items():
+                if self.steps[name]["status"] == StepStatus.PENDING and any(
+                    self.steps[dep]["status"] in blocked for dep in depends_on
+                ):
+                    self._set_step(name, status=StepStatus.SKIPPED)
+                    changed = True
+        return [
+            name
+            for name, depends_on in SYNC_DAG.items()
+            if self.steps[name]["status"] == StepStatus.PENDING
+            and all(
+                self.steps[dep]["status"] == StepStatus.COMPLETED for dep in depends_on
+            )
+        ]
+
+    def _run_step(self, name: str) -> None:
+        started = time.monotonic()
+        self._set_step(name, started_at=get_current_time().isoformat(), error=None)
+        try:
+            with Session(self.target_engine) as session:
+                engine = SigerSyncEngine(
+                    self.source_engine,
+                    session,
+                    full=self.full,
+                    checkpoints={name: self.steps[name].get("checkpoint") or {}},
+                    on_checkpoint=self._on_checkpoint,
+                )
+                counts = engine.run_step(name)
+        except Exception as exc:
+            logger.exception("sync_step_failed", run_id=str(self.run_id), step=name)
+            self._set_step(name, status=StepStatus.FAILED, error=str(exc))
+            return
+        self._set_step(
+            name,
+            status=StepStatus.COMPLETED,
+            counts=counts,
+            checkpoint=None,
+            duration_ms=int((time.monotonic() - started) * 1000),
+            finished_at=get_current_time().isoformat(),
+        )
+
+    def _on_checkpoint(self, name: str, after_id: int, counts: dict[str, int]) -> None:
+        self._set_step(
+            name, counts=counts, checkpoint={"after_id": after_id, "counts": counts}
+        )
+
+    def _set_step(self, name: str, **values: Any) -> None:
+        with self._lock:
+            self.steps[name].update(values)
+            self._persist()
+
+    def _persist(self, **values: Any) -> None:
+        # Core UPDATE: progress writes are not audited as entity changes
+        statement = (
+            update(SyncRun)
+            .where(col(SyncRun.id) == self.run_id)
+            .values(steps=copy.deepcopy(self.steps), **values)
+        )
+        with Session(self.target_engine) as session:
+            session.exec(statement)
+            session.commit()
+
+
+class SyncRunService:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def start(self, full: bool = False, triggered_by: str | None = None) -> SyncRun:
+        self._ensure_idle()
+        run = SyncRun(full=full, triggered_by=triggered_by)
+        self.session.add(run)
+        self.session.commit()
+        self.session.refresh(run)
+        return run
+
+    def resume(self, id: UUID) -> SyncRun:
+        """
+        Marks a failed (or interrupted) run to be executed again: completed
+        steps are kept and the rest continue from their last checkpoint.
+        """
+        run = self.get_by_id(id)
+        if not run:
+            raise NotFoundException(detail="Sync run not found")
+        if run.status == SyncRunStatus.COMPLETED:
+            raise BadRequestException(detail="Sync run already completed")
+        self._ensure_idle(exclude=id)
+        run.status = SyncRunStatus.RUNNING
+        run.error = None
+        run.finished_at = None
+        run.attempts += 1
+        self.session.add(run)
+        self.session.commit()
+        self.session.refresh(run)
+        return run
+
+    def get_by_id(self, id: UUID) -> SyncRun | None:
+        return self.session.get(SyncRun, id)
+
+    def get_all(self, offset: int = 0, limit: int = 20) -> Sequence[SyncRun]:
+        statement = (
+            select(SyncRun)
+            .order_by(col(SyncRun.started_at).desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    def _ensure_idle(self, exclude: UUID | None = None) -> None:
+        statement = select(SyncRun.id).where(SyncRun.status == SyncRunStatus.RUNNING)
+        if exclude:
+            statement = statement.where(SyncRun.id != exclude)
+        if self.session.exec(statement).first():
+            raise BadRequestException(detail="A sync run is already in progress")
+
+
+def execute_sync_run(
+    run_id: UUID,
+    source_engine: Engine | None = None,
+    target_engine: Engine | None = None,
+) -> SyncRun:
+    """Entry point shared by the CLI and the admin endpoint."""
+    from app.core import db
+
+    orchestrator = SyncOrchestrator(
+        run_id,
+        source_engine or get_source_engine(),
+        target_engine or db.engine,
+    )
+    return orchestrator.execute()
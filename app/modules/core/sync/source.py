@@ -0,0 +1,57 @@
+"""
+Tablas de origen de SIGER (base externa `an_core`).
+
+Se declaran como tablas de SQLAlchemy Core sobre un `MetaData` propio: no
+forman parte de `SQLModel.metadata` (no se crean ni migran localmente) y se
+leen como tuplas livianas en lugar de objetos ORM.
+"""
+
+from sqlalchemy import Boolean, Column, Date, Integer, MetaData, String, Table
+
+siger_metadata = MetaData()
+
+funcionario = Table(
+    "funcionario",
+    siger_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("nombres", String, nullable=False),
+    Column("primer_apellido", String),
+    Column("segundo_apellido", String),
+    Column("nombre_completo", String, nullable=False),
+    Column("fecha_nacimiento", Date),
+    Column("nro_documento", String, nullable=False),
+    Column("lugar_emision", String),
+    Column("email_interno", String),
+    Column("celular", String),
+    Column("telefono", String),
+    Column("direccion", String),
+    Column("estado", String, nullable=False),
+    Column("tipo", String, nullable=False),
+    Column("cargo_id", Integer),
+    Column("gerencia_id", Integer),
+    Column("departamento_id", Integer),
+    Column("is_active", Boolean, nullable=False),
+)
+
+unidad_organizacional = Table(
+    "unidad_organizacional",
+    siger_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("nombre", String, nullable=False),
+    Column("unidad_general", String, nullable=False),
+    Column("sigla", String, nullable=False),
+    Column("parent_id", Integer),
+    Column("tipo", String, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+)
+
+cargo = Table(
+    "cargo",
+    siger_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("nro_item", Integer),
+    Column("nivel", String, nullable=False),
+    Column("nombre", String, nullable=False),
+    Column("tipo_puesto", String, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+)
@@ -10,3 +10,10 @@ _tz_offset = timezone(timedelta(hours=settings.TIME_ZONE))
 def get_current_time() -> datetime:
     """Return the current local time as a naive datetime (no tzinfo)."""
     return datetime.now(_tz_offset).replace(tzinfo=None)
+
+
+def to_local_time(value: datetime) -> datetime:
+    """Converts an aware datetime to naive local time; naive values pass through."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(_tz_offset).replace(tzinfo=None)
@@ -10,6 +10,8 @@ from sqlmodel import Session, select
 # Ensure we can import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.audit import record_bulk_changes, system_job
+from app.core.audit.history import REPLAYED_ACTIONS, EntityHistoryService
 from app.models.audit import AuditLog
 from app.util.datetime import get_current_time
 
@@ -58,14 +60,33 @@ def archive_audit_logs(
 
         print(f"Saved archive to {filepath}")
 
-        # 4. Delete from DB
+        # 4. Checkpoint entity history so "state as of T" keeps working
+        # once the CREATE/UPDATE events below are gone
+        touched: dict[str, set[str]] = {}
+        for log in logs_to_archive:
+            if log.action in REPLAYED_ACTIONS and log.entity_id:
+                touched.setdefault(log.entity_type, set()).add(log.entity_id)
+
+        history = EntityHistoryService(session)
+        for entity_type, entity_ids in touched.items():
+            history.checkpoint(entity_type, cutoff_date, entity_ids)
+
+        # 5. Delete from DB
         # SQLModel doesn't support bulk delete directly easily without engine.execute
         # We'll stick to simple delete for now or session.delete
 
         for log in logs_to_archive:
             session.delete(log)
 
-        session.commit()
+        # Leave a single summary event behind (count + id digest)
+        with system_job("archive_audit"):
+            record_bulk_changes(
+                session,
+                AuditLog.__name__,
+                {"ARCHIVE": len(logs_to_archive)},
+                [log.id for log in logs_to_archive],
+            )
+            session.commit()
         print("Deleted archived logs from database.")
 
 
@@ -0,0 +1,161 @@
+"""
+Compara el camino clásico de serialización de listados (objetos ORM +
+`jsonable_encoder` + `json.dumps`) con el camino rápido (`json_response`, y
+filas planas para activos) sobre una base SQLite en memoria.
+
+    python scripts/benchmark_serialization.py --rows 5000 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from collections.abc import Callable
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+# Ensure we can import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.main  # noqa: F401  (registers every table in the metadata)
+from app.core.serialization import json_response
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.assets.schemas import FixedAssetReadDetailed
+from app.modules.assets.assets.service import FixedAssetService
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+from app.modules.core.staff.schemas import StaffReadDetailed
+from app.modules.core.staff.service import StaffService
+
+
+def seed(session: Session, rows: int) -> None:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="Equipos de computación")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="Gerencia", type="MANAGEMENT")
+    session.add_all([institution, area, group, status, position, unit])
+    for i in range(rows):
+        staff = Staff(
+            id=uuid.uuid4(),
+            external_id=1000 + i,
+            first_name="Ana",
+            last_name_1="Test",
+            full_name=f"Ana Test {i}",
+            document_number=f"DOC-{i}",
+            position_id=position.id,
+            org_unit_id=unit.id,
+        )
+        asset = FixedAsset(
+            id=uuid.uuid4(),
+            old_code=f"OLD-{i}",
+            new_code=f"NEW-{i:06d}",
+            description=f"Activo de prueba {i}",
+            serial_number=f"SN-{i}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+            assigned_staff_id=staff.id,
+        )
+        session.add_all([staff, asset])
+    session.commit()
+    session.expunge_all()
+
+
+def measure(run: Callable[[], bytes], repeat: int) -> tuple[float, int]:
+    """Best wall time in milliseconds and response size of ``run``."""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(run())
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, size
+
+
+def classic(schema, items) -> bytes:
+    # What FastAPI does for a response_model: validate, encode, json.dumps
+    data = [schema.model_validate(item, from_attributes=True) for item in items]
+    return json.dumps(jsonable_encoder(data)).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.rows)
+        assets = FixedAssetService(session)
+        staff = StaffService(session)
+        limit = args.rows
+
+        def fresh(load):
+            # Each run starts from an empty identity map, like a new request
+            def run():
+                session.expunge_all()
+                return load()
+
+            return run
+
+        cases = [
+            (
+                "assets / ORM + jsonable_encoder",
+                fresh(
+                    lambda: classic(FixedAssetReadDetailed, assets.get_all(limit=limit))
+                ),
+            ),
+            (
+                "assets / rows + json_response",
+                fresh(
+                    lambda: (
+                        json_response(
+                            list[FixedAssetReadDetailed],
+                            assets.get_all_rows(limit=limit),
+                        ).body
+                    )
+                ),
+            ),
+            (
+                "staff / ORM + jsonable_encoder",
+                fresh(lambda: classic(StaffReadDetailed, staff.get_all(limit=limit))),
+            ),
+            (
+                "staff / ORM + json_response",
+                fresh(
+                    lambda: (
+                        json_response(
+                            list[StaffReadDetailed], staff.get_all(limit=limit)
+                        ).body
+                    )
+                ),
+            ),
+        ]
+
+        print(f"{'case':<34} {'best ms':>10} {'rows/s':>10} {'bytes':>10}")
+        for name, run in cases:
+            elapsed, size = measure(run, args.repeat)
+            rate = args.rows / (elapsed / 1000) if elapsed else 0
+            print(f"{name:<34} {elapsed:>10.1f} {rate:>10.0f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from sqlmodel import Session, select
 # Add project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.audit import system_job
 from app.core.db import engine
 from app.models.module import Module, ModuleGroup
 from app.models.role import Role, RoleModule
@@ -195,7 +196,7 @@ def sync_role_modules(session: Session):
 
 
 def run_seeders():
-    with Session(engine) as session:
+    with system_job("seed_create_modules"), Session(engine) as session:
         # We no longer clear data. We sync it safely.
         sync_module_groups(session)
         sync_roles(session)
@@ -1,6 +1,7 @@
 from sqlmodel import Session, select
 
 from app.auth.utils import get_password_hash
+from app.core.audit import system_job
 from app.core.db import engine
 from app.models.user import User
 from app.util.datetime import get_current_time
@@ -31,7 +32,7 @@ def create_users(session: Session):
 
 
 def run_seeders():
-    with Session(engine) as session:
+    with system_job("seed_users"), Session(engine) as session:
         create_users(session)
 
 
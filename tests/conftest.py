@@ -45,6 +45,15 @@ def session_fixture():
 
     register_audit_hooks(test_engine)
 
+    # Catalog and org-tree caches are process-wide: start every test cold
+    from app.core.catalogs.cache import catalog_cache
+    from app.core.table_changes import register_table_change_hooks
+    from app.modules.core.org_units.tree import org_tree_cache
+
+    register_table_change_hooks()
+    catalog_cache.clear()
+    org_tree_cache.clear()
+
     with Session(test_engine) as session:
         yield session
 
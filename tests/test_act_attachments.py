@@ -0,0 +1,140 @@
+import hashlib
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.storage import get_storage
+from app.modules.assets.acts.models import Act
+from app.modules.assets.acts.service import ActService
+
+PDF = b"%PDF-1.4\n" + b"0123456789" * 1000 + b"\n%%EOF\n"
+
+
+@pytest.fixture(autouse=True)
+def local_storage(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "local")
+    monkeypatch.setattr(settings, "STORAGE_LOCAL_ROOT", str(tmp_path))
+    get_storage.cache_clear()
+    yield
+    get_storage.cache_clear()
+
+
+def make_act(session: Session, number: str) -> Act:
+    act = Act(id=uuid.uuid4(), act_number=number)
+    session.add(act)
+    session.commit()
+    return act
+
+
+def upload(client: TestClient, headers: dict, act: Act, content: bytes = PDF):
+    return client.put(
+        f"/api/assets/acts/{act.id}/pdf",
+        headers=headers,
+        files={"file": ("acta.pdf", content, "application/pdf")},
+    )
+
+
+def test_upload_stores_by_hash(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    act = make_act(session, "ACT-1")
+    response = upload(client, superuser_token_headers, act)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pdf_sha256"] == hashlib.sha256(PDF).hexdigest()
+    assert data["pdf_size"] == len(PDF)
+    assert data["pdf_filename"] == "acta.pdf"
+    assert get_storage().exists(data["pdf_sha256"])
+
+
+def test_identical_pdfs_are_stored_once(
+    client: TestClient, session: Session, superuser_token_headers: dict, tmp_path
+):
+    first = make_act(session, "ACT-1")
+    second = make_act(session, "ACT-2")
+    upload(client, superuser_token_headers, first)
+    upload(client, superuser_token_headers, second)
+    key = hashlib.sha256(PDF).hexdigest()
+    assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [key]
+
+    # The blob survives while another act still references it
+    client.delete(f"/api/assets/acts/{first.id}/pdf", headers=superuser_token_headers)
+    assert get_storage().exists(key)
+    client.delete(f"/api/assets/acts/{second.id}/pdf", headers=superuser_token_headers)
+    assert not get_storage().exists(key)
+
+
+def test_rejects_non_pdf(
+    client: TestClient, session: Session, superuser_token_headers: dict, tmp_path
+):
+    act = make_act(session, "ACT-1")
+    response = upload(client, superuser_token_headers, act, b"MZ not a pdf")
+    assert response.status_code == 400
+    # The partial upload is discarded
+    assert not [p for p in tmp_path.rglob("*") if p.is_file()]
+
+
+def test_rejects_oversized_file(
+    client: TestClient, session: Session, superuser_token_headers: dict, monkeypatch
+):
+    monkeypatch.setattr(settings, "ACT_PDF_MAX_SIZE", 1024)
+    act = make_act(session, "ACT-1")
+    response = upload(client, superuser_token_headers, act)
+    assert response.status_code == 400
+
+
+def test_download_full_and_range(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    act = make_act(session, "ACT-1")
+    upload(client, superuser_token_headers, act)
+    url = f"/api/assets/acts/{act.id}/pdf"
+
+    response = client.get(url, headers=superuser_token_headers)
+    assert response.status_code == 200
+    assert response.content == PDF
+    assert response.headers["content-type"] == "application/pdf"
+    etag = response.headers["etag"]
+    assert etag == f'"{hashlib.sha256(PDF).hexdigest()}"'
+
+    partial = client.get(url, headers={**superuser_token_headers, "Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.content == PDF[:10]
+
+    cached = client.get(url, headers={**superuser_token_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_download_without_pdf(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    act = make_act(session, "ACT-1")
+    response = client.get(
+        f"/api/assets/acts/{act.id}/pdf", headers=superuser_token_headers
+    )
+    assert response.status_code == 404
+
+
+def test_attach_republishes_content_released_meanwhile(session: Session):
+    first = make_act(session, "ACT-1")
+    second = make_act(session, "ACT-2")
+    service = ActService(session)
+    key = hashlib.sha256(PDF).hexdigest()
+    with service.storage.writer() as writer:
+        writer.write(PDF)
+        service.attach_pdf(first.id, writer, "acta.pdf")
+
+    with service.storage.writer() as writer:
+        writer.write(PDF)
+        # Deduplicated against the copy of ACT-1...
+        assert not writer.commit().created
+        # ...which is released before ACT-2 references it
+        service.detach_pdf(first.id)
+        assert not service.storage.exists(key)
+        act = service.attach_pdf(second.id, writer, "acta.pdf")
+
+    assert act is not None and act.pdf_sha256 == key
+    assert service.storage.exists(key)
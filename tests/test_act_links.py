@@ -0,0 +1,168 @@
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.modules.assets.acts.models import Act, AssetActLink
+from app.modules.assets.acts.schemas import ActReadDetailed
+from app.modules.assets.acts.service import ActService
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+
+
+@contextmanager
+def count_statements(session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.strip())
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def make_assets(session: Session, count: int) -> list[FixedAsset]:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT")
+    assets = [
+        FixedAsset(
+            id=uuid.uuid4(),
+            new_code=f"NEW-{i}",
+            description=f"Activo {i}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+        )
+        for i in range(count)
+    ]
+    session.add_all([institution, area, group, status, unit, *assets])
+    session.commit()
+    return assets
+
+
+def make_act(session: Session, number: str, assets: list[FixedAsset]) -> Act:
+    act = Act(id=uuid.uuid4(), act_number=number)
+    session.add(act)
+    session.add_all(AssetActLink(act_id=act.id, asset_id=a.id) for a in assets)
+    session.commit()
+    return act
+
+
+def linked_ids(session: Session, act: Act) -> set[uuid.UUID]:
+    statement = select(AssetActLink.asset_id).where(AssetActLink.act_id == act.id)
+    return set(session.exec(statement).all())
+
+
+def test_list_batch_loads_linked_assets(session: Session):
+    assets = make_assets(session, 6)
+    for i in range(3):
+        make_act(session, f"ACT-{i}", assets[i * 2 : i * 2 + 2])
+    session.expunge_all()
+
+    with count_statements(session) as statements:
+        acts = ActService(session).get_all(sort_by="act_number")
+        data = [ActReadDetailed.model_validate(act) for act in acts]
+
+    # Acts page + one IN query for every act's assets
+    assert len(statements) == 2
+    assert [len(act.fixed_assets) for act in data] == [2, 2, 2]
+    assert data[0].fixed_assets[0].new_code in {"NEW-0", "NEW-1"}
+
+
+def test_detail_includes_assets(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    assets = make_assets(session, 2)
+    act = make_act(session, "ACT-1", assets)
+
+    response = client.get(f"/api/assets/acts/{act.id}", headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    codes = {asset["new_code"] for asset in response.json()["fixed_assets"]}
+    assert codes == {"NEW-0", "NEW-1"}
+
+
+def test_set_assets_diffs_current_links(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    assets = make_assets(session, 4)
+    act = make_act(session, "ACT-1", assets[:2])
+    requested = [assets[1].id, assets[2].id, assets[3].id]
+
+    with count_statements(session) as statements:
+        response = client.put(
+            f"/api/assets/acts/{act.id}/assets",
+            json={"asset_ids": [str(id) for id in requested]},
+            headers=superuser_token_headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "act_id": str(act.id),
+        "linked": 2,
+        "unlinked": 1,
+        "total": 3,
+    }
+    link_writes = [
+        statement.split()[0].upper()
+        for statement in statements
+        if "assets_asset_act_link" in statement
+        and not statement.upper().startswith("SELECT")
+    ]
+    assert sorted(link_writes) == ["DELETE", "INSERT"]
+    assert linked_ids(session, act) == set(requested)
+
+
+def test_link_and_unlink(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    assets = make_assets(session, 3)
+    act = make_act(session, "ACT-1", assets[:1])
+    url = f"/api/assets/acts/{act.id}/assets"
+
+    response = client.post(
+        f"{url}/link",
+        json={"asset_ids": [str(a.id) for a in assets]},
+        headers=superuser_token_headers,
+    )
+    assert response.json()["linked"] == 2
+    assert response.json()["total"] == 3
+
+    response = client.post(
+        f"{url}/unlink",
+        json={"asset_ids": [str(assets[0].id), str(uuid.uuid4())]},
+        headers=superuser_token_headers,
+    )
+    assert response.json()["unlinked"] == 1
+    assert linked_ids(session, act) == {assets[1].id, assets[2].id}
+
+
+def test_link_unknown_asset_applies_nothing(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    assets = make_assets(session, 1)
+    act = make_act(session, "ACT-1", [])
+
+    response = client.post(
+        f"/api/assets/acts/{act.id}/assets/link",
+        json={"asset_ids": [str(assets[0].id), str(uuid.uuid4())]},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 400
+    assert linked_ids(session, act) == set()
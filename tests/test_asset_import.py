@@ -0,0 +1,229 @@
+import csv
+import io
+import uuid
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, select
+
+from app.core.audit.history import EntityHistoryService
+from app.core.audit.hooks import SYSTEM_JOB_ACTION
+from app.core.config import settings
+from app.core.export import ExportFormat, export_response
+from app.models.audit import AuditLog
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.imports.parser import read_rows
+from app.modules.assets.imports.service import ReferenceResolver
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+from app.util.datetime import get_current_time
+
+HEADER = "new_code;description;group;status;area;org_unit;is_saf\n"
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Several COPY batches and merge blocks even for a handful of rows
+    monkeypatch.setattr(settings, "ASSET_IMPORT_CHUNK_SIZE", 2)
+
+
+def make_catalogs(session: Session) -> FixedAsset:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(
+        id=uuid.uuid4(),
+        external_id=1,
+        name="Gerencia Nacional",
+        acronym="GN",
+        type="MANAGEMENT",
+    )
+    existing = FixedAsset(
+        id=uuid.uuid4(),
+        new_code="NEW-1",
+        description="Descripción anterior",
+        serial_number="SN-1",
+        group_id=group.id,
+        status_id=status.id,
+        area_id=area.id,
+        org_unit_id=unit.id,
+    )
+    session.add_all([institution, area, group, status, unit, existing])
+    session.commit()
+    return existing
+
+
+def upload(client: TestClient, headers: dict, content: str, name="activos.csv"):
+    return client.post(
+        "/api/assets/imports/",
+        files={"file": (name, content.encode(), "text/csv")},
+        headers=headers,
+    )
+
+
+SHEET = HEADER + (
+    "NEW-1;Monitor 24;pc;Bueno;Almacén;GN;\n"
+    "NEW-2;Teclado;PC;BUENO;Almacén;Gerencia Nacional;si\n"
+    "\n"
+    "NEW-3;Mouse;IMPRESORA;BUENO;Almacén;GN;\n"
+    "NEW-4;;PC;BUENO;Almacén;GN;\n"
+    "NEW-5;CPU;PC;BUENO;Almacén;GN;quizás\n"
+    "NEW-6;Scanner;PC;BUENO;Almacén;GN;\n"
+    "NEW-6;Scanner 2;PC;BUENO;Almacén;GN;\n"
+)
+
+
+def test_stage_validates_without_touching_inventory(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    make_catalogs(session)
+
+    response = upload(client, superuser_token_headers, SHEET)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "VALIDATED"
+    assert data["total_rows"] == 7
+    assert data["valid_rows"] == 2
+    assert data["error_rows"] == 5
+    assert data["to_insert"] == 1
+    assert data["to_update"] == 1
+    assert len(session.exec(select(FixedAsset)).all()) == 1
+
+    report = client.get(
+        f"/api/assets/imports/{data['id']}/errors", headers=superuser_token_headers
+    )
+    assert report.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(report.content.decode("utf-8-sig"))))
+    errors = {int(row["row_number"]): row["errors"] for row in rows}
+    # Row numbers are the file's own lines (header = 1, blank line 4 skipped)
+    assert errors[5] == "unknown group 'IMPRESORA'"
+    assert errors[6] == "description is required"
+    assert errors[7] == "invalid is_saf 'quizás'"
+    assert errors[8] == errors[9] == "new_code repeated in the file"
+
+
+def test_commit_inserts_and_updates_in_blocks(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    existing = make_catalogs(session)
+    # Row-level CREATE of the fixture itself: not part of the import
+    setup_logs = session.exec(select(AuditLog.id)).all()
+    staged = upload(client, superuser_token_headers, SHEET).json()
+
+    response = client.post(
+        f"/api/assets/imports/{staged['id']}/commit", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "COMPLETED"
+    session.expire_all()
+    updated = session.get(FixedAsset, existing.id)
+    assert updated.description == "Monitor 24"
+    # Blank cells keep the current value
+    assert updated.serial_number == "SN-1"
+    created = session.exec(
+        select(FixedAsset).where(FixedAsset.new_code == "NEW-2")
+    ).one()
+    assert created.is_saf is True
+    assert created.is_decommissioned is False
+    assert len(session.exec(select(FixedAsset)).all()) == 2
+
+    logs = session.exec(
+        select(AuditLog).where(
+            AuditLog.entity_type == "FixedAsset", col(AuditLog.id).not_in(setup_logs)
+        )
+    ).all()
+    assert {log.action for log in logs} == {SYSTEM_JOB_ACTION}
+    assert logs[0].changes["job"] == "asset_import"
+    assert logs[0].changes["import_id"] == staged["id"]
+    # Per-row values are not kept: history flags the merge instead of hiding it
+    history = EntityHistoryService(session)
+    history.get_state_as_of("FixedAsset", str(existing.id), get_current_time())
+    assert not history.complete
+
+    again = client.post(
+        f"/api/assets/imports/{staged['id']}/commit", headers=superuser_token_headers
+    )
+    assert again.status_code == 400
+
+
+def test_unknown_columns_are_rejected(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    response = upload(client, superuser_token_headers, "codigo;description\nX;Y\n")
+
+    assert response.status_code == 400
+    assert "codigo" in response.json()["detail"]
+
+
+def test_xlsx_rows_keep_sheet_numbers():
+    batches = [
+        [{"description": "Monitor", "group": "PC", "is_saf": True}],
+        [{"description": None, "group": None, "is_saf": None}],
+        [{"description": "Mouse", "group": None, "is_saf": False}],
+    ]
+    columns = ["description", "group", "status", "area", "org_unit", "is_saf"]
+    response = export_response(iter(batches), columns, ExportFormat.XLSX, "x")
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    content = anyio.run(collect)
+    rows = list(read_rows(io.BytesIO(content), "activos.xlsx"))
+
+    assert rows[0] == (
+        2,
+        {
+            "description": "Monitor",
+            "group": "PC",
+            "status": None,
+            "area": None,
+            "org_unit": None,
+            "is_saf": "true",
+        },
+    )
+    assert [number for number, _ in rows] == [2, 4]
+    assert rows[1][1]["is_saf"] == "false"
+
+
+def test_resolver_skips_inactive_units_and_deleted_staff(session: Session):
+    make_catalogs(session)
+    closed = OrgUnit(
+        id=uuid.uuid4(),
+        external_id=2,
+        name="Gerencia Cerrada",
+        acronym="GC",
+        type="MANAGEMENT",
+        is_active=False,
+    )
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    gone = Staff(
+        id=uuid.uuid4(),
+        external_id=100,
+        first_name="Ana",
+        last_name_1="Test",
+        full_name="Ana Test",
+        document_number="DOC-1",
+        position_id=position.id,
+        org_unit_id=closed.id,
+        deleted_at=get_current_time(),
+    )
+    session.add_all([closed, position, gone])
+    session.commit()
+
+    resolver = ReferenceResolver(session)
+
+    assert resolver.resolve("org_unit", "GN")[1] is None
+    assert resolver.resolve("org_unit", "GC") == (None, "unknown org_unit 'GC'")
+    assert resolver.resolve("assigned_staff", "DOC-1") == (
+        None,
+        "unknown assigned_staff 'DOC-1'",
+    )
@@ -0,0 +1,98 @@
+import uuid
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import CODE_FIELDS, FixedAsset
+from app.modules.assets.assets.repository import FixedAssetRepository
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+
+
+def make_assets(session: Session) -> dict[str, FixedAsset]:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT")
+    session.add_all([institution, area, group, status, unit])
+
+    def asset(**codes) -> FixedAsset:
+        return FixedAsset(
+            id=uuid.uuid4(),
+            description="Activo",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+            **codes,
+        )
+
+    assets = {
+        "monitor": asset(new_code="AN-2024-001", old_code="OLD 7", serial_number="SN1"),
+        "printer": asset(new_code="AN-2024-002", old_code="OLD 8"),
+        "legacy_a": asset(old_code="OLD-9"),
+        "legacy_b": asset(old_code="old9"),
+        "laptop": asset(serial_number="5cg-123"),
+    }
+    session.add_all(assets.values())
+    session.commit()
+    return assets
+
+
+def test_lookup_resolves_a_batch_of_codes(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    assets = make_assets(session)
+
+    response = client.post(
+        "/api/assets/assets/lookup",
+        json={"codes": ["an2024001 ", "old-8", "OLD9", "5CG 123", "nada"]},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    results = {result["code"]: result for result in response.json()}
+    assert list(results) == ["an2024001 ", "old-8", "OLD9", "5CG 123", "nada"]
+    assert results["an2024001 "]["matched_by"] == "new_code"
+    assert [a["id"] for a in results["an2024001 "]["assets"]] == [
+        str(assets["monitor"].id)
+    ]
+    assert results["old-8"]["matched_by"] == "old_code"
+    # Same normalized old code on two assets: ambiguous, both returned
+    assert {a["id"] for a in results["OLD9"]["assets"]} == {
+        str(assets["legacy_a"].id),
+        str(assets["legacy_b"].id),
+    }
+    assert results["5CG 123"]["matched_by"] == "serial_number"
+    assert results["nada"] == {"code": "nada", "matched_by": None, "assets": []}
+
+
+def test_lookup_probes_the_expression_index(session: Session):
+    make_assets(session)
+    executed: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, *args):
+        executed.append((statement, parameters))
+
+    # Plan of the very SQL lookup_codes emits, not a hand-written twin
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        FixedAssetRepository(session).lookup_codes(["SN1", "OLD9"])
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    ((statement, parameters),) = executed
+
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+
+    plan_text = str(plan.all())
+    for field in CODE_FIELDS:
+        assert f"ix_assets_fixed_asset_{field}_norm" in plan_text
@@ -0,0 +1,104 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.assets.summary.service import AssetSummaryService
+from app.modules.core.org_units.models import OrgUnit
+
+
+def make_catalogs(session: Session) -> dict:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    catalogs = {
+        "area": Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id),
+        "group": AssetGroup(id=uuid.uuid4(), name="PC"),
+        "good": AssetStatus(id=uuid.uuid4(), name="BUENO"),
+        "bad": AssetStatus(id=uuid.uuid4(), name="MALO"),
+        "unit": OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT"),
+        "other": OrgUnit(id=uuid.uuid4(), external_id=2, name="B", type="MANAGEMENT"),
+    }
+    session.add_all([institution, *catalogs.values()])
+    session.commit()
+    return catalogs
+
+
+def add_asset(session: Session, catalogs: dict, **values) -> FixedAsset:
+    asset = FixedAsset(
+        description="Activo",
+        group_id=catalogs["group"].id,
+        status_id=catalogs["good"].id,
+        area_id=catalogs["area"].id,
+        org_unit_id=catalogs["unit"].id,
+        **values,
+    )
+    session.add(asset)
+    session.commit()
+    return asset
+
+
+def summary(client: TestClient, headers: dict) -> dict:
+    response = client.get("/api/assets/summary/", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_counters_follow_orm_writes(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    catalogs = make_catalogs(session)
+    good, bad = str(catalogs["good"].id), str(catalogs["bad"].id)
+    first = add_asset(session, catalogs)
+    add_asset(session, catalogs, is_physically_verified=True)
+
+    data = summary(client, superuser_token_headers)
+    assert data["total"] == 2
+    assert data["by_status"] == {good: 2}
+    assert data["by_physically_verified"] == {"true": 1, "false": 1}
+
+    response = client.patch(
+        f"/api/assets/assets/{first.id}",
+        json={"status_id": bad, "is_decommissioned": True},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    data = summary(client, superuser_token_headers)
+    assert data["by_status"] == {good: 1, bad: 1}
+    assert data["by_decommissioned"] == {"true": 1, "false": 1}
+
+    response = client.delete(
+        f"/api/assets/assets/{first.id}", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    data = summary(client, superuser_token_headers)
+    assert data["total"] == 1
+    assert data["by_status"] == {good: 1}
+
+    # Incremental counters agree with a full recount
+    assert AssetSummaryService(session).rebuild().model_dump() == data
+
+
+def test_transfer_moves_org_unit_counters(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    catalogs = make_catalogs(session)
+    unit, other = str(catalogs["unit"].id), str(catalogs["other"].id)
+    for _ in range(3):
+        add_asset(session, catalogs)
+
+    response = client.post(
+        "/api/assets/assets/transfer",
+        json={
+            "act_number": "ACTA-010",
+            "filter": {"org_unit_id": unit},
+            "target": {"org_unit_id": other},
+        },
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert summary(client, superuser_token_headers)["by_org_unit"] == {other: 3}
@@ -0,0 +1,199 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, select
+
+from app.core.audit.history import EntityHistoryService
+from app.core.audit.hooks import SYSTEM_JOB_ACTION
+from app.core.config import settings
+from app.models.audit import AuditLog
+from app.modules.assets.acts.models import Act, AssetActLink
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+from app.util.datetime import get_current_time
+
+
+@pytest.fixture(autouse=True)
+def data_audit(monkeypatch):
+    monkeypatch.setattr(settings, "ENABLE_DATA_AUDIT", True)
+
+
+def make_office(session: Session) -> dict:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Oficina 1", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    source = OrgUnit(id=uuid.uuid4(), external_id=1, name="Origen", type="MANAGEMENT")
+    target = OrgUnit(id=uuid.uuid4(), external_id=2, name="Destino", type="MANAGEMENT")
+    staff = Staff(
+        id=uuid.uuid4(),
+        external_id=100,
+        first_name="Ana",
+        last_name_1="Test",
+        full_name="Ana Test",
+        document_number="DOC-1",
+        position_id=position.id,
+        org_unit_id=target.id,
+    )
+    assets = [
+        FixedAsset(
+            id=uuid.uuid4(),
+            new_code=f"NEW-{i}",
+            description=f"Activo {i}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=source.id if i < 3 else target.id,
+        )
+        for i in range(4)
+    ]
+    session.add_all([institution, area, group, status, position, source, target])
+    session.add_all([staff, *assets])
+    session.commit()
+    return {"source": source, "target": target, "staff": staff, "assets": assets}
+
+
+def test_transfer_by_filter_moves_the_whole_office(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    office = make_office(session)
+    source_ids = {asset.id for asset in office["assets"][:3]}
+    # Row-level CREATEs of the fixture itself: not part of the transfer
+    setup_logs = session.exec(select(AuditLog.id)).all()
+
+    response = client.post(
+        "/api/assets/assets/transfer",
+        json={
+            "act_number": "ACTA-001",
+            "filter": {"org_unit_id": str(office["source"].id)},
+            "target": {
+                "org_unit_id": str(office["target"].id),
+                "assigned_staff_id": str(office["staff"].id),
+            },
+        },
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["transferred"] == 3
+    session.expire_all()
+    for asset in session.exec(select(FixedAsset)).all():
+        assert asset.org_unit_id == office["target"].id
+        expected = office["staff"].id if asset.id in source_ids else None
+        assert asset.assigned_staff_id == expected
+    act = session.exec(select(Act).where(Act.act_number == "ACTA-001")).one()
+    links = session.exec(select(AssetActLink)).all()
+    assert {link.asset_id for link in links} == source_ids
+    assert {link.act_id for link in links} == {act.id}
+
+    logs = session.exec(
+        select(AuditLog).where(
+            AuditLog.entity_type == "FixedAsset", col(AuditLog.id).not_in(setup_logs)
+        )
+    ).all()
+    assert len(logs) == 1
+    assert logs[0].action == SYSTEM_JOB_ACTION
+    assert logs[0].changes["job"] == "asset_transfer"
+    assert logs[0].changes["counts"] == {"UPDATE": 3}
+    assert logs[0].changes["act_id"] == str(act.id)
+    assert logs[0].changes["values"]["org_unit_id"] == str(office["target"].id)
+
+
+def test_history_replays_the_transfer(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    office = make_office(session)
+    moved = office["assets"][0]
+    before = get_current_time()
+    client.post(
+        "/api/assets/assets/transfer",
+        json={
+            "act_number": "ACTA-003",
+            "asset_ids": [str(moved.id)],
+            "target": {"org_unit_id": str(office["target"].id)},
+        },
+        headers=superuser_token_headers,
+    )
+
+    history = EntityHistoryService(session)
+    state = history.get_state_as_of(
+        "FixedAsset", str(moved.id), get_current_time() + timedelta(seconds=1)
+    )
+    assert state is not None
+    assert state["org_unit_id"] == str(office["target"].id)
+    assert history.complete
+    state = history.get_state_as_of("FixedAsset", str(moved.id), before)
+    assert state is not None
+    assert state["org_unit_id"] == str(office["source"].id)
+
+
+def test_transfer_by_ids_reuses_act_and_existing_links(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    office = make_office(session)
+    act = Act(id=uuid.uuid4(), act_number="ACTA-002")
+    first = office["assets"][0]
+    session.add_all([act, AssetActLink(asset_id=first.id, act_id=act.id)])
+    session.commit()
+
+    response = client.post(
+        "/api/assets/assets/transfer",
+        json={
+            "act_number": "ACTA-002",
+            "asset_ids": [str(first.id), str(office["assets"][1].id)],
+            "target": {"custodian_staff_id": str(office["staff"].id)},
+        },
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["act_id"] == str(act.id)
+    assert len(session.exec(select(AssetActLink)).all()) == 2
+    session.expire_all()
+    # Fields left out of the target are untouched
+    assert session.get(FixedAsset, first.id).org_unit_id == office["source"].id
+
+
+def test_transfer_with_unknown_asset_rolls_back(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    office = make_office(session)
+
+    response = client.post(
+        "/api/assets/assets/transfer",
+        json={
+            "act_number": "ACTA-003",
+            "asset_ids": [str(office["assets"][0].id), str(uuid.uuid4())],
+            "target": {"org_unit_id": str(office["target"].id)},
+        },
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 400
+    session.expire_all()
+    assert session.get(FixedAsset, office["assets"][0].id).org_unit_id == (
+        office["source"].id
+    )
+    assert not session.exec(select(Act)).all()
+    assert not session.exec(select(AssetActLink)).all()
+
+
+def test_transfer_requires_a_selection(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    response = client.post(
+        "/api/assets/assets/transfer",
+        json={"act_number": "ACTA-004", "filter": {}, "target": {}},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 422
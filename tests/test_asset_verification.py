@@ -0,0 +1,178 @@
+import uuid
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.audit.history import EntityHistoryService
+from app.core.config import settings
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.util.datetime import get_current_time
+
+BASE = "/api/assets/verification/campaigns"
+
+
+def make_inventory(session: Session) -> dict:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    office = Area(id=uuid.uuid4(), name="Oficina", institution_id=institution.id)
+    storage = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT")
+    session.add_all([institution, office, storage, group, status, unit])
+
+    def asset(code: str, area: Area, **values) -> FixedAsset:
+        return FixedAsset(
+            id=uuid.uuid4(),
+            new_code=code,
+            description=f"Activo {code}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+            **values,
+        )
+
+    assets = {
+        "desk": asset("NEW-1", office, old_code="OLD-1"),
+        "pc": asset("NEW-2", office),
+        "chair": asset("NEW-3", office),
+        "retired": asset("NEW-4", office, is_decommissioned=True),
+        "stored": asset("NEW-5", storage),
+    }
+    session.add_all(assets.values())
+    session.commit()
+    return {"office": office, **assets}
+
+
+def open_campaign(client: TestClient, headers: dict, area: Area) -> dict:
+    response = client.post(
+        BASE, json={"name": "Gestión 2026", "area_id": str(area.id)}, headers=headers
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_snapshot_lists_assets_in_scope(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    inventory = make_inventory(session)
+    campaign = open_campaign(client, superuser_token_headers, inventory["office"])
+
+    response = client.get(
+        f"{BASE}/{campaign['id']}/snapshot", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["token"] == 0
+    assert [row["new_code"] for row in data["assets"]] == ["NEW-1", "NEW-2", "NEW-3"]
+    assert not any(row["verified"] for row in data["assets"])
+
+
+def test_scan_batches_are_applied_once_and_synced(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    inventory = make_inventory(session)
+    campaign = open_campaign(client, superuser_token_headers, inventory["office"])
+    batch = {
+        "since": 0,
+        "device_id": "scanner-1",
+        "scans": [
+            {"code": "OLD-1", "scanned_at": "2026-10-19T09:00:00-04:00"},
+            {"code": "NEW-2", "scanned_at": "2026-10-19T09:01:00-04:00"},
+            {"code": "NEW-2", "scanned_at": "2026-10-19T09:02:00-04:00"},
+            {"code": "NEW-5", "scanned_at": "2026-10-19T09:03:00-04:00"},
+            {"code": "NEW-9", "scanned_at": "2026-10-19T09:04:00-04:00"},
+        ],
+    }
+
+    response = client.post(
+        f"{BASE}/{campaign['id']}/scans", json=batch, headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["token"] == 1
+    assert data["applied"] == 2
+    assert data["duplicates"] == 0
+    assert data["unknown_codes"] == ["NEW-9"]
+    assert data["out_of_scope_codes"] == ["NEW-5"]
+    assert {scan["code"] for scan in data["scans"]} == {"OLD-1", "NEW-2"}
+    session.expire_all()
+    assert session.get(FixedAsset, inventory["desk"].id).is_physically_verified
+    assert not session.get(FixedAsset, inventory["stored"].id).is_physically_verified
+
+    # A retried upload (lost response) changes nothing
+    retry = client.post(
+        f"{BASE}/{campaign['id']}/scans", json=batch, headers=superuser_token_headers
+    ).json()
+    assert retry["applied"] == 0
+    assert retry["duplicates"] == 2
+
+    # Another scanner gets only what it has not seen yet
+    other = client.post(
+        f"{BASE}/{campaign['id']}/scans",
+        json={
+            "since": 0,
+            "scans": [{"code": "NEW-3", "scanned_at": "2026-10-19T10:00:00"}],
+        },
+        headers=superuser_token_headers,
+    ).json()
+    assert other["applied"] == 1
+    changes = client.get(
+        f"{BASE}/{campaign['id']}/changes",
+        params={"since": data["token"]},
+        headers=superuser_token_headers,
+    ).json()
+    assert changes["token"] == other["token"]
+    assert [scan["code"] for scan in changes["scans"]] == ["NEW-3"]
+
+
+def test_closed_campaign_rejects_scans(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    inventory = make_inventory(session)
+    campaign = open_campaign(client, superuser_token_headers, inventory["office"])
+    closed = client.post(
+        f"{BASE}/{campaign['id']}/close", headers=superuser_token_headers
+    )
+    assert closed.json()["status"] == "CLOSED"
+
+    response = client.post(
+        f"{BASE}/{campaign['id']}/scans",
+        json={"scans": [{"code": "NEW-1", "scanned_at": "2026-10-19T10:00:00"}]},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 400
+
+
+def test_history_replays_scan_batches(
+    client: TestClient, session: Session, superuser_token_headers: dict, monkeypatch
+):
+    monkeypatch.setattr(settings, "ENABLE_DATA_AUDIT", True)
+    inventory = make_inventory(session)
+    campaign = open_campaign(client, superuser_token_headers, inventory["office"])
+    client.post(
+        f"{BASE}/{campaign['id']}/scans",
+        json={
+            "since": 0,
+            "scans": [{"code": "NEW-2", "scanned_at": "2026-10-19T09:00:00"}],
+        },
+        headers=superuser_token_headers,
+    )
+
+    history = EntityHistoryService(session)
+    as_of = get_current_time() + timedelta(seconds=1)
+    states = history.get_states_as_of(
+        "FixedAsset", as_of, [str(inventory["pc"].id), str(inventory["desk"].id)]
+    )
+    assert states[str(inventory["pc"].id)]["is_physically_verified"] is True
+    assert states[str(inventory["desk"].id)]["is_physically_verified"] is False
+    assert history.complete
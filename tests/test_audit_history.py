@@ -0,0 +1,236 @@
+import uuid
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.audit.history import EntityHistoryService, materialize_snapshots
+from app.core.audit.hooks import SYSTEM_JOB_ACTION
+from app.core.config import settings
+from app.models.audit import AuditLog, AuditSnapshot
+from app.util.datetime import get_current_time
+
+BASE = get_current_time() - timedelta(days=10)
+
+
+def _asset_snapshot(asset_id: str, **overrides) -> dict:
+    data = {
+        "id": asset_id,
+        "old_code": "OLD-1",
+        "new_code": "NEW-1",
+        "description": "Escritorio",
+        "is_saf": True,
+        "is_physically_verified": False,
+        "is_decommissioned": False,
+        "group_id": str(uuid.uuid4()),
+        "status_id": str(uuid.uuid4()),
+        "area_id": str(uuid.uuid4()),
+        "org_unit_id": str(uuid.uuid4()),
+    }
+    data.update(overrides)
+    return data
+
+
+def _log(asset_id: str, action: str, minutes: int, changes=None) -> AuditLog:
+    return AuditLog(
+        action=action,
+        entity_type="FixedAsset",
+        entity_id=asset_id,
+        changes=changes,
+        timestamp=BASE + timedelta(minutes=minutes),
+    )
+
+
+def test_state_as_of_replays_diffs(session: Session):
+    asset_id = str(uuid.uuid4())
+    session.add_all(
+        [
+            _log(asset_id, "CREATE", 0, _asset_snapshot(asset_id)),
+            _log(
+                asset_id,
+                "UPDATE",
+                10,
+                {"is_physically_verified": {"old": False, "new": True}},
+            ),
+            # Legacy diff format (str() encoded values)
+            _log(asset_id, "UPDATE", 20, {"old_code": {"old": "OLD-1", "new": "None"}}),
+            _log(asset_id, "DELETE", 30, _asset_snapshot(asset_id)),
+        ]
+    )
+    session.commit()
+    history = EntityHistoryService(session)
+
+    assert history.get_state_as_of("FixedAsset", asset_id, BASE - timedelta(1)) is None
+
+    state = history.get_state_as_of("FixedAsset", asset_id, BASE + timedelta(minutes=5))
+    assert state is not None
+    assert state["is_physically_verified"] is False
+
+    state = history.get_state_as_of(
+        "FixedAsset", asset_id, BASE + timedelta(minutes=25)
+    )
+    assert state is not None
+    assert state["is_physically_verified"] is True
+    assert state["old_code"] is None
+
+    assert (
+        history.get_state_as_of("FixedAsset", asset_id, BASE + timedelta(minutes=35))
+        is None
+    )
+
+
+def test_snapshots_bound_replay(session: Session, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_SNAPSHOT_INTERVAL", 3)
+    asset_id = str(uuid.uuid4())
+    logs = [_log(asset_id, "CREATE", 0, _asset_snapshot(asset_id))]
+    logs += [
+        _log(
+            asset_id, "UPDATE", i, {"observations": {"old": str(i - 1), "new": str(i)}}
+        )
+        for i in range(1, 6)
+    ]
+    session.add_all(logs)
+    session.commit()
+    history = EntityHistoryService(session)
+    as_of = BASE + timedelta(minutes=10)
+
+    first = history.get_state_as_of("FixedAsset", asset_id, as_of)
+    snapshots = select(AuditSnapshot).where(AuditSnapshot.entity_id == asset_id)
+    # Reads never write: the checkpoint waits for materialize_snapshots
+    assert session.exec(snapshots).all() == []
+    assert materialize_snapshots(session.get_bind(), history.pending_snapshots) == 1
+    written = session.exec(snapshots).all()
+    assert len(written) == 1
+    assert written[0].audit_log_id == logs[-1].id
+
+    # Second read starts from the snapshot and gives the same answer
+    assert history.get_state_as_of("FixedAsset", asset_id, as_of) == first
+    assert first is not None and first["observations"] == "5"
+
+
+def test_checkpoint_survives_archived_events(session: Session):
+    asset_id = str(uuid.uuid4())
+    create = _log(asset_id, "CREATE", 0, _asset_snapshot(asset_id))
+    session.add(create)
+    session.commit()
+    history = EntityHistoryService(session)
+
+    assert history.checkpoint("FixedAsset", BASE + timedelta(minutes=1), [asset_id])
+    session.delete(create)
+    session.commit()
+
+    state = history.get_state_as_of("FixedAsset", asset_id, BASE + timedelta(days=1))
+    assert state is not None
+    assert state["description"] == "Escritorio"
+
+
+def test_assets_as_of_endpoint(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    kept, removed = str(uuid.uuid4()), str(uuid.uuid4())
+    session.add_all(
+        [
+            _log(kept, "CREATE", 0, _asset_snapshot(kept)),
+            _log(removed, "CREATE", 0, _asset_snapshot(removed, new_code="NEW-2")),
+            _log(kept, "UPDATE", 5, {"new_code": {"old": "NEW-1", "new": "NEW-9"}}),
+            _log(removed, "DELETE", 8, _asset_snapshot(removed)),
+        ]
+    )
+    session.commit()
+
+    response = client.get(
+        "/api/assets/assets/as-of",
+        params={"as_of": (BASE + timedelta(minutes=6)).isoformat()},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    data = {item["id"]: item for item in response.json()}
+    assert data[kept]["new_code"] == "NEW-9"
+    assert data[removed]["new_code"] == "NEW-2"
+
+    response = client.get(
+        "/api/assets/assets/as-of",
+        params={"as_of": (BASE + timedelta(minutes=10)).isoformat()},
+        headers=superuser_token_headers,
+    )
+    assert [item["id"] for item in response.json()] == [kept]
+
+
+def test_assets_as_of_pages_skip_soft_deleted(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    ids = sorted(str(uuid.uuid4()) for _ in range(4))
+    logs = [_log(id, "CREATE", 0, _asset_snapshot(id, deleted_at=None)) for id in ids]
+    # The two first ids are soft-deleted (one in the legacy str() diff format)
+    logs += [
+        _log(ids[0], "UPDATE", 5, {"deleted_at": {"old": None, "new": "2024-01-01"}}),
+        _log(ids[1], "UPDATE", 5, {"deleted_at": {"old": "None", "new": "2024"}}),
+        # ... and the third one deleted, then restored
+        _log(ids[2], "UPDATE", 5, {"deleted_at": {"old": None, "new": "2024"}}),
+        _log(ids[2], "UPDATE", 7, {"deleted_at": {"old": "2024", "new": None}}),
+    ]
+    session.add_all(logs)
+    session.commit()
+
+    response = client.get(
+        "/api/assets/assets/as-of",
+        params={"as_of": (BASE + timedelta(minutes=10)).isoformat(), "limit": 2},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == ids[2:]
+
+
+def test_entity_as_of_endpoint(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    asset_id = str(uuid.uuid4())
+    session.add(_log(asset_id, "CREATE", 0, _asset_snapshot(asset_id)))
+    session.commit()
+
+    response = client.get(
+        f"/api/audit/entities/FixedAsset/{asset_id}/as-of",
+        params={"as_of": (BASE - timedelta(minutes=1)).isoformat()},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["exists"] is False
+
+
+def test_unreplayable_summary_marks_the_state_incomplete(
+    client: TestClient, session: Session, superuser_token_headers: dict, monkeypatch
+):
+    monkeypatch.setattr(settings, "AUDIT_SNAPSHOT_INTERVAL", 1)
+    asset_id = str(uuid.uuid4())
+    session.add_all(
+        [
+            _log(asset_id, "CREATE", 0, _asset_snapshot(asset_id)),
+            # A bulk job that kept only the id digest
+            AuditLog(
+                action=SYSTEM_JOB_ACTION,
+                entity_type="FixedAsset",
+                changes={"job": "seed", "counts": {"UPDATE": 1}},
+                timestamp=BASE + timedelta(minutes=10),
+            ),
+        ]
+    )
+    session.commit()
+    url = f"/api/audit/entities/FixedAsset/{asset_id}/as-of"
+
+    response = client.get(
+        url,
+        params={"as_of": (BASE + timedelta(minutes=5)).isoformat()},
+        headers=superuser_token_headers,
+    )
+    assert response.json()["complete"] is True
+    response = client.get(
+        url,
+        params={"as_of": (BASE + timedelta(minutes=15)).isoformat()},
+        headers=superuser_token_headers,
+    )
+    assert response.json()["exists"] is True
+    assert response.json()["complete"] is False
+    # No checkpoint past the missed summary
+    snapshots = session.exec(select(AuditSnapshot)).all()
+    assert all(s.snapshot_at < BASE + timedelta(minutes=10) for s in snapshots)
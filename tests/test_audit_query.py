@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.audit import AuditLog
+from app.util.datetime import get_current_time
+
+
+def _seed_history(session: Session) -> list[AuditLog]:
+    base = get_current_time() - timedelta(days=1)
+    logs = [
+        AuditLog(
+            action="UPDATE" if i else "CREATE",
+            entity_type="FixedAsset",
+            entity_id="asset-1",
+            changes={"observations": {"old": str(i - 1), "new": str(i)}},
+            timestamp=base + timedelta(minutes=i),
+        )
+        for i in range(5)
+    ]
+    logs.append(
+        AuditLog(
+            action="CREATE",
+            entity_type="FixedAsset",
+            entity_id="asset-2",
+            timestamp=base,
+        )
+    )
+    session.add_all(logs)
+    session.commit()
+    return logs
+
+
+def test_audit_logs_keyset_pagination(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    logs = _seed_history(session)
+    expected = [str(log.id) for log in reversed(logs[:5])]
+
+    seen: list[str] = []
+    cursor = None
+    for _ in range(5):
+        params = {"entity_type": "FixedAsset", "entity_id": "asset-1", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            "/api/audit/logs", params=params, headers=superuser_token_headers
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    # Newest first, no duplicates or gaps across pages
+    assert seen == expected
+
+
+def test_audit_logs_filters(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    _seed_history(session)
+    response = client.get(
+        "/api/audit/logs",
+        params={"entity_type": "FixedAsset", "action": "create"},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert {item["entity_id"] for item in items} == {"asset-1", "asset-2"}
+    assert all(item["action"] == "CREATE" for item in items)
+
+
+def test_entity_history(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    _seed_history(session)
+    response = client.get(
+        "/api/audit/entities/FixedAsset/asset-2/history",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert page["next_cursor"] is None
+
+
+def test_audit_logs_invalid_cursor(client: TestClient, superuser_token_headers: dict):
+    response = client.get(
+        "/api/audit/logs",
+        params={"cursor": "not-a-cursor"},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_audit_logs_unauthorized(client: TestClient):
+    response = client.get("/api/audit/logs")
+    assert response.status_code == 401
@@ -0,0 +1,67 @@
+import uuid
+
+from sqlmodel import Session, col, select
+
+from app.core.audit import system_job
+from app.core.audit.hooks import SYSTEM_JOB_ACTION, id_digest
+from app.core.config import settings
+from app.models.audit import AuditLog
+from app.modules.core.org_units.models import OrgUnit
+
+settings.ENABLE_DATA_AUDIT = True
+
+
+def make_units(session: Session, count: int) -> list[OrgUnit]:
+    units = [
+        OrgUnit(
+            id=uuid.uuid4(), external_id=900 + i, name=f"Unidad {i}", type="MANAGEMENT"
+        )
+        for i in range(count)
+    ]
+    session.add_all(units)
+    session.commit()
+    return units
+
+
+def unit_logs(session: Session) -> list[AuditLog]:
+    statement = select(AuditLog).where(AuditLog.entity_type == "OrgUnit")
+    return list(session.exec(statement.order_by(col(AuditLog.timestamp))).all())
+
+
+def test_system_job_writes_one_summary_per_batch(session: Session):
+    with system_job("bulk_test") as job:
+        units = make_units(session, 5)
+        # Assigned without reading: an expired attribute would reload the
+        # row, autoflushing the previous edit as a batch of its own
+        for i, unit in enumerate(units[:2]):
+            unit.name = f"Unidad {i} (editada)"
+        session.commit()
+
+    logs = unit_logs(session)
+    assert [log.action for log in logs] == [SYSTEM_JOB_ACTION] * 2
+    assert logs[0].changes["job"] == "bulk_test"
+    assert logs[0].changes["counts"] == {"CREATE": 5}
+    assert logs[0].changes["ids"] == id_digest(unit.id for unit in units)
+    assert logs[1].changes["counts"] == {"UPDATE": 2}
+    assert job.totals == {"OrgUnit": {"CREATE": 5, "UPDATE": 2}}
+
+
+def test_row_level_audit_outside_system_job(session: Session):
+    make_units(session, 2)
+
+    assert [log.action for log in unit_logs(session)] == ["CREATE", "CREATE"]
+
+
+def test_nested_system_job_reuses_outer():
+    with system_job("outer") as outer, system_job("inner") as inner:
+        assert inner is outer
+
+
+def test_id_digest_is_order_independent():
+    ids = [uuid.uuid4() for _ in range(3)]
+
+    digest = id_digest(ids)
+
+    assert digest == id_digest(reversed(ids))
+    assert digest["count"] == 3
+    assert digest["first"] == min(str(id) for id in ids)
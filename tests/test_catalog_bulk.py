@@ -0,0 +1,70 @@
+import time
+
+import pytest
+from sqlmodel import Session
+
+from app.core.catalogs.base import CatalogProvider
+from app.core.catalogs.cache import CatalogCache
+from app.core.catalogs.registry import CatalogRegistry
+from app.core.catalogs.schemas import CatalogItemSchema
+from app.core.exceptions import GatewayTimeoutException, NotFoundException
+
+
+class SleepingProvider(CatalogProvider):
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def get_items(self, session: Session, **kwargs) -> list[CatalogItemSchema]:
+        time.sleep(self.delay)
+        return [CatalogItemSchema(value=self.delay, label=str(kwargs))]
+
+
+def make_registry(*delays: float) -> CatalogRegistry:
+    registry = CatalogRegistry(cache=CatalogCache())
+    for i, delay in enumerate(delays):
+        registry.register(f"slow_{i}", SleepingProvider(delay))
+    return registry
+
+
+def test_concurrent_load_costs_slowest_provider(session: Session):
+    registry = make_registry(0.3, 0.3, 0.3)
+    pending = {"slow_0": {}, "slow_1": {"a": 1}, "slow_2": {}}
+
+    start = time.monotonic()
+    result = registry._load_concurrently(
+        session.get_bind(), pending, max_workers=3, timeout=5
+    )
+    elapsed = time.monotonic() - start
+
+    assert set(result) == set(pending)
+    assert result["slow_1"][0].label == "{'a': 1}"
+    assert elapsed < 0.8
+
+
+def test_concurrent_load_times_out(session: Session):
+    registry = make_registry(0.01, 2)
+
+    with pytest.raises(GatewayTimeoutException):
+        registry._load_concurrently(
+            session.get_bind(),
+            {"slow_0": {}, "slow_1": {}},
+            max_workers=2,
+            timeout=0.2,
+        )
+
+
+def test_bulk_preserves_request_order(session: Session):
+    registry = make_registry(0.02, 0.01)
+
+    result = registry.get_bulk_items(session, {"slow_1": {}, "slow_0": {}})
+
+    assert list(result) == ["slow_1", "slow_0"]
+
+
+def test_bulk_unknown_catalog_fails_before_loading(session: Session):
+    registry = make_registry(5)
+
+    start = time.monotonic()
+    with pytest.raises(NotFoundException):
+        registry.get_bulk_items(session, {"slow_0": {}, "missing": {}})
+    assert time.monotonic() - start < 1
@@ -0,0 +1,113 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.core.catalogs.base import CatalogProvider
+from app.core.catalogs.cache import CatalogCache
+from app.core.catalogs.registry import CatalogRegistry
+from app.core.catalogs.schemas import CatalogItemSchema
+from app.models.cache_version import CacheVersion
+from app.modules.core.org_units.models import OrgUnit
+
+
+class CountingProvider(CatalogProvider):
+    depends_on = ("core_org_unit",)
+    cache_ttl = 60
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_items(self, session: Session, **kwargs) -> list[CatalogItemSchema]:
+        self.calls += 1
+        return [CatalogItemSchema(value=kwargs.get("x"), label="item")]
+
+
+def test_registry_caches_per_normalized_params(session: Session):
+    registry = CatalogRegistry(cache=CatalogCache())
+    provider = CountingProvider()
+    registry.register("counting", provider)
+
+    registry.get_items("counting", session, {"x": "1", "y": "2"})
+    registry.get_items("counting", session, {"y": "2", "x": "1"})
+    assert provider.calls == 1
+
+    registry.get_items("counting", session, {"x": "2"})
+    assert provider.calls == 2
+
+
+def test_cached_items_follow_table_versions(session: Session):
+    registry = CatalogRegistry(cache=CatalogCache())
+    provider = CountingProvider()
+    registry.register("counting", provider)
+    registry.get_items("counting", session, {})
+
+    # A write committed by another worker: only the shared version moves,
+    # this process never sees the commit that would invalidate its cache
+    session.connection().execute(
+        insert(CacheVersion).values(key="core_org_unit", version=1)
+    )
+    session.commit()
+
+    registry.get_items("counting", session, {})
+    assert provider.calls == 2
+    registry.get_items("counting", session, {})
+    assert provider.calls == 2
+
+
+def test_cache_invalidation_by_table():
+    cache = CatalogCache()
+    items = [CatalogItemSchema(value=1, label="a")]
+    cache.set(("a", "{}"), items, 60, {"core_org_unit"})
+    cache.set(("b", "{}"), items, 60, {"core_staff"})
+
+    cache.invalidate_tables({"core_org_unit"})
+    assert cache.get(("a", "{}")) is None
+    assert cache.get(("b", "{}")) == items
+
+
+def test_cache_lru_bound_and_ttl():
+    cache = CatalogCache(max_entries=2)
+    items = [CatalogItemSchema(value=1, label="a")]
+    cache.set(("a", "{}"), items, 60, ())
+    cache.set(("b", "{}"), items, 60, ())
+    cache.get(("a", "{}"))  # "b" becomes least recently used
+    cache.set(("c", "{}"), items, 60, ())
+    assert len(cache) == 2
+    assert cache.get(("b", "{}")) is None
+
+    cache.set(("d", "{}"), items, 0, ())
+    assert cache.get(("d", "{}")) is None
+
+
+def test_stale_result_not_stored_across_invalidation():
+    cache = CatalogCache()
+    epoch = cache.epoch
+    cache.invalidate_tables({"core_org_unit"})
+    cache.set(("a", "{}"), [], 60, {"core_org_unit"}, epoch)
+    assert cache.get(("a", "{}")) is None
+
+
+def test_commit_invalidates_cached_catalog(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    gerencia = OrgUnit(
+        id=uuid.uuid4(),
+        external_id=501,
+        name="Gerencia Original",
+        type="MANAGEMENT",
+        is_active=True,
+    )
+    session.add(gerencia)
+    session.commit()
+
+    response = client.get("/api/catalogs/gerencias", headers=superuser_token_headers)
+    assert [item["label"] for item in response.json()] == ["Gerencia Original"]
+
+    gerencia.name = "Gerencia Renombrada"
+    session.add(gerencia)
+    session.commit()
+
+    response = client.get("/api/catalogs/gerencias", headers=superuser_token_headers)
+    assert [item["label"] for item in response.json()] == ["Gerencia Renombrada"]
@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+import uuid
+import zipfile
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.export import ExportFormat, export_response
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    # Several cursor batches even for a handful of rows
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+
+
+def make_inventory(session: Session, count: int) -> OrgUnit:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Exportación", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="Gerencia", type="MANAGEMENT")
+    session.add_all([institution, area, group, status, position, unit])
+    for i in range(count):
+        staff = Staff(
+            id=uuid.uuid4(),
+            external_id=100 + i,
+            first_name="Ana",
+            last_name_1="Test",
+            full_name=f"Ana Test {i}",
+            document_number=f"DOC-{i}",
+            position_id=position.id,
+            org_unit_id=unit.id,
+        )
+        asset = FixedAsset(
+            id=uuid.uuid4(),
+            new_code=f"NEW-{i}",
+            description=f'Activo {i}, "usado"',
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+            assigned_staff_id=staff.id,
+        )
+        session.add_all([staff, asset])
+    session.commit()
+    return unit
+
+
+def test_assets_csv_export_streams_every_row(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    make_inventory(session, 5)
+
+    response = client.get(
+        "/api/assets/assets/export",
+        params={"format": "csv", "sort_by": "new_code"},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "fixed_assets.csv" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert [row["new_code"] for row in rows] == [f"NEW-{i}" for i in range(5)]
+    assert rows[0]["description"] == 'Activo 0, "usado"'
+    assert rows[0]["institution_name"] == "Aduana Nacional"
+    assert rows[4]["assigned_staff_name"] == "Ana Test 4"
+
+
+def test_staff_ndjson_export_applies_filters(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    make_inventory(session, 3)
+
+    response = client.get(
+        "/api/core/staff/export",
+        params={"format": "ndjson", "search": "Test 1"},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["full_name"] for line in lines] == ["Ana Test 1"]
+    assert lines[0]["position_name"] == "Analista"
+    assert "external_id" not in lines[0]
+
+
+def test_xlsx_export_is_a_valid_package():
+    batches = [[{"code": "A-1", "qty": 2, "ok": True}], [{"code": "B<2>", "qty": None}]]
+
+    response = export_response(
+        iter(batches), ["code", "qty", "ok"], ExportFormat.XLSX, "t"
+    )
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    package = zipfile.ZipFile(io.BytesIO(anyio.run(collect)))
+    assert package.testzip() is None
+    sheet = package.read("xl/worksheets/sheet1.xml").decode()
+    assert sheet.count("<row>") == 3
+    assert "B&lt;2&gt;" in sheet
+    assert '<c t="b"><v>1</v></c>' in sheet
+
+
+def test_csv_export_neutralizes_formula_cells():
+    batches = [[{"code": '=HYPERLINK("x")', "qty": -3}, {"code": "@SUM(A1)", "qty": 1}]]
+
+    response = export_response(iter(batches), ["code", "qty"], ExportFormat.CSV, "t")
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    rows = list(csv.reader(io.StringIO(anyio.run(collect).decode("utf-8-sig"))))
+    assert rows[1:] == [['\'=HYPERLINK("x")', "-3"], ["'@SUM(A1)", "1"]]
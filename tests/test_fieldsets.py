@@ -0,0 +1,82 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.modules.assets.assets.repository import FixedAssetRepository
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+
+
+def make_staff(session: Session, count: int) -> None:
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="Gerencia", type="MANAGEMENT")
+    session.add_all([position, unit])
+    for i in range(count):
+        session.add(
+            Staff(
+                id=uuid.uuid4(),
+                external_id=100 + i,
+                first_name="Ana",
+                last_name_1="Test",
+                full_name=f"Ana Test {i}",
+                document_number=f"DOC-{i}",
+                address="Av. Siempre Viva 742",
+                position_id=position.id,
+                org_unit_id=unit.id,
+            )
+        )
+    session.commit()
+
+
+def test_staff_fields_returns_only_requested_columns(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    make_staff(session, 3)
+
+    response = client.get(
+        "/api/core/staff/",
+        params={"fields": "full_name,is_active", "sort_by": "full_name"},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    rows = response.json()
+    assert len(rows) == 3
+    assert list(rows[0]) == ["id", "full_name", "is_active"]
+    assert rows[2]["full_name"] == "Ana Test 2"
+
+
+def test_fields_outside_whitelist_are_rejected(
+    client: TestClient, superuser_token_headers: dict
+):
+    # external_id is hidden from StaffRead: it cannot be projected either
+    response = client.get(
+        "/api/core/staff/",
+        params={"fields": "full_name,external_id"},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 400
+    assert "external_id" in response.json()["detail"]
+
+
+def test_projection_selects_only_requested_columns(session: Session):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rows = FixedAssetRepository(session).get_all_fields(("id", "new_code"))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert rows == []
+    selected = statements[0].split("FROM")[0]
+    assert "new_code" in selected
+    assert "description" not in selected
@@ -0,0 +1,133 @@
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session
+
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.assets.repository import FixedAssetRepository
+from app.modules.assets.assets.service import FixedAssetService
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+
+
+@contextmanager
+def count_selects(session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def make_assets(session: Session, count: int) -> list[uuid.UUID]:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="Gerencia", type="MANAGEMENT")
+    session.add_all([institution, position, unit])
+    ids = []
+    for i in range(count):
+        # Distinct related rows per asset: lazy loading would grow with count
+        group = AssetGroup(id=uuid.uuid4(), name=f"Grupo {i}")
+        status = AssetStatus(id=uuid.uuid4(), name=f"Estado {i}")
+        area = Area(id=uuid.uuid4(), name=f"Area {i}", institution_id=institution.id)
+        staff = Staff(
+            id=uuid.uuid4(),
+            external_id=100 + i,
+            first_name="Ana",
+            last_name_1="Test",
+            full_name=f"Ana Test {i}",
+            document_number=f"DOC-{i}",
+            position_id=position.id,
+            org_unit_id=unit.id,
+        )
+        asset = FixedAsset(
+            id=uuid.uuid4(),
+            new_code=f"NEW-{i}",
+            description=f"Activo {i}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+            assigned_staff_id=staff.id,
+        )
+        session.add_all([group, status, area, staff, asset])
+        ids.append(asset.id)
+    session.commit()
+    # Detached from here on: every test reads through a fresh query
+    session.expunge_all()
+    return ids
+
+
+def test_list_profile_loads_page_in_one_query(session: Session):
+    make_assets(session, 5)
+
+    with count_selects(session) as statements:
+        assets = FixedAssetService(session).get_all(sort_by="new_code")
+        names = [
+            (a.group.name, a.area.institution.name, a.assigned_staff.full_name)
+            for a in assets
+        ]
+
+    assert len(statements) == 1
+    assert names[4] == ("Grupo 4", "Aduana Nacional", "Ana Test 4")
+    assert all(a.custodian_staff is None for a in assets)
+
+
+def test_export_profile_raises_on_unplanned_loads(session: Session):
+    make_assets(session, 1)
+
+    asset = FixedAssetRepository(session).get_all(profile="export")[0]
+
+    assert asset.org_unit.name == "Gerencia"
+    with pytest.raises(InvalidRequestError):
+        _ = asset.acts
+
+
+def test_unknown_profile_is_rejected(session: Session):
+    with pytest.raises(ValueError):
+        FixedAssetRepository(session).get_all(profile="grid")
+
+
+def test_asset_endpoints_return_related_names(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    ids = make_assets(session, 2)
+
+    response = client.get(
+        "/api/assets/assets/",
+        params={"sort_by": "new_code"},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    item = response.json()[1]
+    assert item["group_name"] == "Grupo 1"
+    assert item["status_name"] == "Estado 1"
+    assert item["area_name"] == "Area 1"
+    assert item["institution_name"] == "Aduana Nacional"
+    assert item["org_unit_name"] == "Gerencia"
+    assert item["assigned_staff_name"] == "Ana Test 1"
+    assert item["custodian_staff_name"] is None
+    assert "group" not in item
+
+    response = client.get(
+        f"/api/assets/assets/{ids[0]}", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["group_name"] == "Grupo 0"
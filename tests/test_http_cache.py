@@ -0,0 +1,84 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.http_cache import get_table_versions
+from app.models.role import Role
+from app.modules.core.org_units.models import OrgUnit
+
+
+def _create_gerencia(session: Session, external_id: int, name: str) -> OrgUnit:
+    gerencia = OrgUnit(
+        id=uuid.uuid4(),
+        external_id=external_id,
+        name=name,
+        type="MANAGEMENT",
+        is_active=True,
+    )
+    session.add(gerencia)
+    session.commit()
+    return gerencia
+
+
+def test_write_bumps_table_version(session: Session):
+    before = get_table_versions(session, ["core_org_unit"])["core_org_unit"]
+    _create_gerencia(session, 601, "Gerencia Versionada")
+    after = get_table_versions(session, ["core_org_unit"])["core_org_unit"]
+    assert after == before + 1
+
+
+def test_catalog_conditional_get(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    gerencia = _create_gerencia(session, 602, "Gerencia ETag")
+
+    response = client.get("/api/catalogs/gerencias", headers=superuser_token_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    headers = {**superuser_token_headers, "If-None-Match": etag}
+    response = client.get("/api/catalogs/gerencias", headers=headers)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    # Params are part of the representation
+    response = client.get(
+        f"/api/catalogs/departamentos?gerencia_id={gerencia.id}", headers=headers
+    )
+    assert response.status_code == 200
+
+    gerencia.name = "Gerencia ETag Renombrada"
+    session.add(gerencia)
+    session.commit()
+
+    response = client.get("/api/catalogs/gerencias", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["label"] == "Gerencia ETag Renombrada"
+
+
+def test_menu_conditional_get(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    role = Role(name="Menu Role", slug="menu-role", is_active=True)
+    session.add(role)
+    session.commit()
+
+    response = client.get(
+        "/api/auth/me/menu/menu-role", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    headers = {**superuser_token_headers, "If-None-Match": f'W/{etag}, "other"'}
+    response = client.get("/api/auth/me/menu/menu-role", headers=headers)
+    assert response.status_code == 304
+
+    role.icon = "pi pi-star"
+    session.add(role)
+    session.commit()
+
+    response = client.get("/api/auth/me/menu/menu-role", headers=headers)
+    assert response.status_code == 200
@@ -0,0 +1,137 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.core.exceptions import ConflictException
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.assets.repository import FixedAssetRepository
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+
+
+def make_asset(session: Session) -> FixedAsset:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT")
+    asset = FixedAsset(
+        id=uuid.uuid4(),
+        new_code="NEW-1",
+        description="Escritorio",
+        group_id=group.id,
+        status_id=status.id,
+        area_id=area.id,
+        org_unit_id=unit.id,
+    )
+    session.add_all([institution, area, group, status, unit, asset])
+    session.commit()
+    return asset
+
+
+def test_if_match_rejects_stale_edits(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    asset = make_asset(session)
+    url = f"/api/assets/assets/{asset.id}"
+
+    etag = client.get(url, headers=superuser_token_headers).headers["etag"]
+    assert etag == '"1"'
+
+    # First clerk saves with the version they read
+    response = client.patch(
+        url,
+        json={"observations": "Primero"},
+        headers={**superuser_token_headers, "If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"2"'
+    assert response.json()["version_id"] == 2
+
+    # Second clerk read the same version: conflict, nothing written
+    response = client.patch(
+        url,
+        json={"observations": "Segundo"},
+        headers={**superuser_token_headers, "If-Match": etag},
+    )
+    assert response.status_code == 409
+    assert response.headers["etag"] == '"2"'
+    data = client.get(url, headers=superuser_token_headers).json()
+    assert data["observations"] == "Primero"
+
+
+def test_patch_without_if_match_still_applies(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    asset = make_asset(session)
+
+    response = client.patch(
+        f"/api/assets/assets/{asset.id}",
+        json={"observations": "Sin versión"},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["version_id"] == 2
+
+
+def test_invalid_if_match(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    asset = make_asset(session)
+
+    response = client.patch(
+        f"/api/assets/assets/{asset.id}",
+        json={"observations": "x"},
+        headers={**superuser_token_headers, "If-Match": '"abc"'},
+    )
+
+    assert response.status_code == 400
+
+
+def test_change_between_read_and_write_conflicts(session: Session):
+    asset = make_asset(session)
+    repository = FixedAssetRepository(session)
+    assert repository.get_by_id(asset.id) is asset
+
+    # Another writer commits after our read (the loaded object keeps version 1)
+    session.exec(
+        update(FixedAsset)  # type: ignore[call-overload]
+        .where(FixedAsset.id == asset.id)
+        .values(version_id=2)
+        .execution_options(synchronize_session=False)
+    )
+
+    with pytest.raises(ConflictException):
+        repository.update(asset.id, {"observations": "Pisado"})
+
+
+def test_bulk_updates_bump_the_version(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    asset = make_asset(session)
+    unit = OrgUnit(id=uuid.uuid4(), external_id=2, name="B", type="MANAGEMENT")
+    session.add(unit)
+    session.commit()
+
+    response = client.post(
+        "/api/assets/assets/transfer",
+        json={
+            "act_number": "ACTA-1",
+            "asset_ids": [str(asset.id)],
+            "target": {"org_unit_id": str(unit.id)},
+        },
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/api/assets/assets/{asset.id}", headers=superuser_token_headers
+    )
+    assert response.headers["etag"] == '"2"'
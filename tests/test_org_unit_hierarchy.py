@@ -0,0 +1,143 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlmodel import Session, select
+from structlog.testing import capture_logs
+
+from app.modules.core.org_units.models import OrgUnit, OrgUnitClosure
+from app.modules.core.org_units.service import OrgUnitService
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+from app.modules.core.staff.service import StaffService
+
+
+def make_unit(
+    session: Session, external_id: int, parent: OrgUnit | None = None
+) -> OrgUnit:
+    unit = OrgUnit(
+        id=uuid.uuid4(),
+        external_id=external_id,
+        name=f"Unidad {external_id}",
+        type="DEPARTMENT" if parent else "MANAGEMENT",
+        parent_id=parent.id if parent else None,
+    )
+    session.add(unit)
+    session.commit()
+    return unit
+
+
+def build_tree(session: Session) -> dict[str, OrgUnit]:
+    # root -> a -> a1 -> a1x ; root -> b
+    root = make_unit(session, 1)
+    a = make_unit(session, 2, root)
+    a1 = make_unit(session, 3, a)
+    a1x = make_unit(session, 4, a1)
+    b = make_unit(session, 5, root)
+    return {"root": root, "a": a, "a1": a1, "a1x": a1x, "b": b}
+
+
+def closure_rows(session: Session) -> set[tuple[uuid.UUID, uuid.UUID, int]]:
+    rows = session.exec(select(OrgUnitClosure)).all()
+    return {(r.ancestor_id, r.descendant_id, r.depth) for r in rows}
+
+
+def test_closure_maintained_on_insert(session: Session):
+    units = build_tree(session)
+    service = OrgUnitService(session)
+
+    descendants = service.get_descendants(units["root"].id)
+    # Ordered by depth: direct children first
+    assert {u.id for u in descendants[:2]} == {units["a"].id, units["b"].id}
+    assert {u.id for u in descendants} == {units[k].id for k in ("a", "a1", "a1x", "b")}
+    assert {u.id for u in service.get_descendants(units["root"].id, max_depth=1)} == {
+        units["a"].id,
+        units["b"].id,
+    }
+    assert [u.id for u in service.get_ancestors(units["a1x"].id)] == [
+        units["root"].id,
+        units["a"].id,
+        units["a1"].id,
+    ]
+
+
+def test_closure_follows_subtree_move(session: Session):
+    units = build_tree(session)
+    service = OrgUnitService(session)
+
+    service.update(units["a1"].id, {"parent_id": units["b"].id})
+
+    assert [u.id for u in service.get_ancestors(units["a1x"].id)] == [
+        units["root"].id,
+        units["b"].id,
+        units["a1"].id,
+    ]
+    assert service.get_descendants(units["a"].id) == []
+
+    # Incremental maintenance matches a full rebuild
+    incremental = closure_rows(session)
+    service.rebuild_hierarchy()
+    assert closure_rows(session) == incremental
+
+
+def test_rebuild_stops_at_parent_cycles(session: Session):
+    units = build_tree(session)
+    a, a1 = units["a"], units["a1"]
+    # Bulk loads bypass the ORM checks: a -> a1 -> a
+    session.exec(update(OrgUnit).where(OrgUnit.id == a.id).values(parent_id=a1.id))
+
+    with capture_logs() as logs:
+        OrgUnitService(session).rebuild_hierarchy()
+
+    rows = closure_rows(session)
+    assert {(a.id, a1.id, 1), (a1.id, a.id, 1)} <= rows
+    assert not [row for row in rows if row[0] == row[1] and row[2] > 0]
+    assert (units["root"].id, a.id, 1) not in rows
+    assert logs[0]["event"] == "org_unit_hierarchy_cycles"
+    assert set(logs[0]["org_unit_ids"]) == {str(a.id), str(a1.id)}
+
+
+def test_move_under_own_subtree_rejected(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    units = build_tree(session)
+
+    response = client.patch(
+        f"/api/core/org-units/{units['a'].id}",
+        json={"parent_id": str(units["a1x"].id)},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 400
+
+
+def test_staff_subtree_filter(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    units = build_tree(session)
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    session.add(position)
+    for i, key in enumerate(("a1x", "b", "root")):
+        session.add(
+            Staff(
+                id=uuid.uuid4(),
+                external_id=100 + i,
+                first_name=key,
+                last_name_1="Test",
+                full_name=f"{key} Test",
+                document_number=f"DOC-{i}",
+                position_id=position.id,
+                org_unit_id=units[key].id,
+            )
+        )
+    session.commit()
+
+    staff = StaffService(session).get_all(org_unit_subtree_id=units["a"].id)
+    assert [s.first_name for s in staff] == ["a1x"]
+
+    response = client.get(
+        "/api/core/staff/count",
+        params={"org_unit_subtree_id": str(units["root"].id)},
+        headers=superuser_token_headers,
+    )
+    assert response.json() == {"total": 3}
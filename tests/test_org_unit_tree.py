@@ -0,0 +1,120 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.org_units.tree import OrgTreeIndex
+
+TREE_URL = "/api/core/org-units/tree"
+
+
+def make_unit(
+    session: Session,
+    external_id: int,
+    name: str,
+    parent: OrgUnit | None = None,
+    is_active: bool = True,
+) -> OrgUnit:
+    unit = OrgUnit(
+        id=uuid.uuid4(),
+        external_id=external_id,
+        name=name,
+        type="DEPARTMENT" if parent else "MANAGEMENT",
+        parent_id=parent.id if parent else None,
+        is_active=is_active,
+    )
+    session.add(unit)
+    session.commit()
+    return unit
+
+
+def names(nodes: list[dict]) -> list:
+    return [(node["name"], names(node["children"])) for node in nodes]
+
+
+def test_tree_nested_with_depth_and_root(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    gerencia = make_unit(session, 1, "Gerencia A")
+    depto = make_unit(session, 2, "Depto A1", gerencia)
+    make_unit(session, 3, "Area A1x", depto)
+    make_unit(session, 4, "Gerencia B")
+    make_unit(session, 5, "Depto Inactivo", gerencia, is_active=False)
+
+    response = client.get(TREE_URL, headers=superuser_token_headers)
+    assert response.status_code == 200
+    assert names(response.json()) == [
+        ("Gerencia A", [("Depto A1", [("Area A1x", [])])]),
+        ("Gerencia B", []),
+    ]
+
+    response = client.get(
+        TREE_URL, params={"max_depth": 1}, headers=superuser_token_headers
+    )
+    assert names(response.json())[0] == ("Gerencia A", [("Depto A1", [])])
+
+    response = client.get(
+        TREE_URL, params={"root_id": str(depto.id)}, headers=superuser_token_headers
+    )
+    assert names(response.json()) == [("Depto A1", [("Area A1x", [])])]
+
+
+def test_tree_cache_invalidated_on_write(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    gerencia = make_unit(session, 1, "Gerencia Original")
+
+    first = client.get(TREE_URL, headers=superuser_token_headers)
+    etag = first.headers["etag"]
+    cached = client.get(
+        TREE_URL, headers={**superuser_token_headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    gerencia.name = "Gerencia Renombrada"
+    session.add(gerencia)
+    session.commit()
+
+    response = client.get(
+        TREE_URL, headers={**superuser_token_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert names(response.json()) == [("Gerencia Renombrada", [])]
+
+
+def test_tree_unknown_root(client: TestClient, superuser_token_headers: dict):
+    response = client.get(
+        TREE_URL, params={"root_id": str(uuid.uuid4())}, headers=superuser_token_headers
+    )
+    assert response.status_code == 404
+
+
+def test_orphan_of_inactive_parent_becomes_root():
+    parent_id, child_id = uuid.uuid4(), uuid.uuid4()
+
+    class Row:
+        def __init__(self, id, parent_id):
+            self.id, self.parent_id = id, parent_id
+            self.external_id, self.name, self.acronym, self.type = 1, "x", None, "D"
+
+    index = OrgTreeIndex([Row(child_id, parent_id)])
+
+    assert [node["id"] for node in index.build()] == [child_id]
+
+
+def test_units_in_a_parent_cycle_are_still_listed():
+    a, b, c, root = uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    class Row:
+        def __init__(self, id, parent_id, name):
+            self.id, self.parent_id, self.name = id, parent_id, name
+            self.external_id, self.acronym, self.type = 1, None, "D"
+
+    # a -> b -> a, with c hanging from b; root is a regular unit
+    index = OrgTreeIndex(
+        [Row(root, None, "R"), Row(a, b, "A"), Row(b, a, "B"), Row(c, b, "C")]
+    )
+
+    assert names(index.build()) == [("R", []), ("A", [("B", [("C", [])])])]
+    assert names(index.build(root_id=b)) == [("B", [("C", [])])]
@@ -0,0 +1,97 @@
+import uuid
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.serialization import json_response, nest_row, type_adapter
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.assets.schemas import FixedAssetReadDetailed
+from app.modules.assets.assets.service import FixedAssetService
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+
+
+def make_assets(session: Session) -> None:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT")
+    position = StaffPosition(id=uuid.uuid4(), external_id=1, name="Analista")
+    staff = Staff(
+        id=uuid.uuid4(),
+        external_id=1,
+        first_name="Ana",
+        last_name_1="Test",
+        full_name="Ana Test",
+        document_number="DOC-1",
+        position_id=position.id,
+        org_unit_id=unit.id,
+    )
+    session.add_all([institution, area, group, status, unit, position, staff])
+    session.add_all(
+        FixedAsset(
+            id=uuid.uuid4(),
+            new_code=f"NEW-{i}",
+            description=f"Activo {i}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+            # Every other asset has no staff: outer joins yield null relations
+            assigned_staff_id=staff.id if i % 2 else None,
+        )
+        for i in range(4)
+    )
+    session.commit()
+    session.expunge_all()
+
+
+def test_nest_row():
+    row = {
+        "id": 1,
+        "area__id": 2,
+        "area__name": "A",
+        "area__institution__id": None,
+        "area__institution__name": None,
+    }
+    assert nest_row(row) == {
+        "id": 1,
+        "area": {"id": 2, "name": "A", "institution": None},
+    }
+
+
+def test_type_adapter_is_cached():
+    schema = list[FixedAssetReadDetailed]
+    assert type_adapter(schema) is type_adapter(list[FixedAssetReadDetailed])
+
+
+def test_row_path_matches_orm_path(session: Session):
+    make_assets(session)
+    service = FixedAssetService(session)
+    response_type = list[FixedAssetReadDetailed]
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rows = service.get_all_rows(sort_by="new_code")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assets = service.get_all(sort_by="new_code")
+
+    assert len(statements) == 1
+    assert json_response(response_type, rows).body == (
+        json_response(response_type, assets).body
+    )
+    assert rows[0]["assigned_staff"] is None
+    assert rows[1]["assigned_staff"]["full_name"] == "Ana Test"
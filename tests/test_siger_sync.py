@@ -0,0 +1,267 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, Table, delete, insert, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from app.core.config import settings
+from app.models.audit import AuditLog
+from app.modules.core.org_units.models import OrgUnit
+from app.modules.core.org_units.service import OrgUnitService
+from app.modules.core.positions.models import StaffPosition
+from app.modules.core.staff.models import Staff
+from app.modules.core.sync import engine as engine_module
+from app.modules.core.sync import routers as sync_routers
+from app.modules.core.sync import source
+from app.modules.core.sync.engine import SigerSyncEngine, SyncEntity, position_values
+from app.modules.core.sync.models import SyncRun, SyncRunStatus, SyncWatermark
+from app.modules.core.sync.reader import stream_batches
+from app.modules.core.sync.service import SyncRunService, execute_sync_run
+
+
+@pytest.fixture(name="siger")
+def siger_fixture():
+    siger = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    source.siger_metadata.create_all(siger)
+    cargo = {"nivel": "1", "tipo_puesto": "PERMANENTE", "is_active": True}
+    unit = {"unidad_general": "UG", "is_active": True}
+    with siger.begin() as conn:
+        conn.execute(
+            insert(source.cargo),
+            [
+                {**cargo, "id": 10, "nombre": "Gerente"},
+                {**cargo, "id": 11, "nombre": "Analista"},
+            ],
+        )
+        conn.execute(
+            insert(source.unidad_organizacional),
+            [
+                {**unit, "id": 1, "nombre": "Gerencia", "sigla": "GG",
+                 "tipo": "MANAGEMENT", "parent_id": None},
+                {**unit, "id": 2, "nombre": "Depto", "sigla": "DP",
+                 "tipo": "DEPARTMENT", "parent_id": 1},
+                {**unit, "id": 3, "nombre": "Area", "sigla": "AR",
+                 "tipo": "DEPARTMENT", "parent_id": 2},
+            ],
+        )  # fmt: skip
+        person = {
+            "nombres": "Ana",
+            "nombre_completo": "Ana Test",
+            "estado": "INCORPORADO",
+            "tipo": "SERVIDOR PÚBLICO",
+            "is_active": True,
+        }
+        conn.execute(
+            insert(source.funcionario),
+            [
+                {**person, "id": 100, "nro_documento": "1", "cargo_id": 10,
+                 "gerencia_id": 1, "departamento_id": 3},
+                {**person, "id": 101, "nro_documento": "2", "cargo_id": 11,
+                 "gerencia_id": 1, "departamento_id": None},
+                # Unknown cargo: skipped
+                {**person, "id": 102, "nro_documento": "3", "cargo_id": 99,
+                 "gerencia_id": 1, "departamento_id": None},
+            ],
+        )  # fmt: skip
+    return siger
+
+
+def test_sync_upserts_and_links_hierarchy(session: Session, siger: Engine):
+    stats = SigerSyncEngine(siger, session, chunk_size=2).run()
+
+    assert stats["positions"]["inserted"] == 2
+    assert stats["org_units"]["inserted"] == 3
+    assert stats["org_units"]["parents_linked"] == 2
+    assert stats["staff"]["inserted"] == 2
+    assert stats["staff"]["skipped"] == 1
+    units = {u.external_id: u for u in session.exec(select(OrgUnit)).all()}
+    assert units[3].parent_id == units[2].id
+    ancestors = OrgUnitService(session).get_ancestors(units[3].id)
+    assert [u.external_id for u in ancestors] == [1, 2]
+    staff = {s.external_id: s for s in session.exec(select(Staff)).all()}
+    assert staff[100].org_unit_id == units[3].id
+    assert staff[101].org_unit_id == units[1].id
+
+
+def test_delta_sync_touches_only_changes(session: Session, siger: Engine):
+    SigerSyncEngine(siger, session).run()
+    ids = {p.external_id: p.id for p in session.exec(select(StaffPosition)).all()}
+
+    stats = SigerSyncEngine(siger, session).run()
+    assert stats["positions"] == {
+        "inserted": 0,
+        "updated": 0,
+        "deactivated": 0,
+        "unchanged": 2,
+        "skipped": 0,
+    }
+    # No unit changed: parents and closure are left alone
+    assert "parents_linked" not in stats["org_units"]
+
+    with siger.begin() as conn:
+        conn.execute(
+            update(source.cargo).where(source.cargo.c.id == 10).values(nombre="Jefe")
+        )
+        conn.execute(delete(source.funcionario).where(source.funcionario.c.id == 101))
+    stats = SigerSyncEngine(siger, session).run()
+
+    assert stats["positions"]["updated"] == 1
+    assert stats["positions"]["unchanged"] == 1
+    assert stats["staff"]["deactivated"] == 1
+    session.expire_all()
+    positions = session.exec(select(StaffPosition)).all()
+    assert {p.external_id: p.id for p in positions} == ids
+    assert {p.name for p in positions} == {"Jefe", "Analista"}
+    staff = {s.external_id: s.is_active for s in session.exec(select(Staff)).all()}
+    assert staff == {100: True, 101: False}
+
+
+def test_full_sync_rewrites_everything(session: Session, siger: Engine):
+    SigerSyncEngine(siger, session).run()
+
+    stats = SigerSyncEngine(siger, session, full=True).run()
+
+    assert stats["positions"]["updated"] == 2
+    assert stats["staff"]["updated"] == 2
+
+
+def test_watermark_reads_only_newer_rows(session: Session, siger: Engine):
+    metadata = MetaData()
+    table = Table(
+        "cargo_modificado",
+        metadata,
+        *(
+            Column(c.name, c.type, primary_key=c.primary_key)
+            for c in source.cargo.columns
+        ),
+        Column("modificado", Integer),
+    )
+    metadata.create_all(siger)
+    entity = SyncEntity("positions_wm", StaffPosition, table, "modificado")
+    row = {"nivel": "1", "tipo_puesto": "P", "is_active": True}
+    with siger.begin() as conn:
+        conn.execute(
+            insert(table),
+            [
+                {**row, "id": 10, "nombre": "A", "modificado": 5},
+                {**row, "id": 11, "nombre": "B", "modificado": 9},
+            ],
+        )
+
+    sync = SigerSyncEngine(siger, session)
+    assert sync._sync(entity, position_values)["inserted"] == 2
+    assert session.get(SyncWatermark, "positions_wm").value == "9"
+
+    with siger.begin() as conn:
+        conn.execute(
+            update(table).where(table.c.id == 10).values(nombre="A2", modificado=12)
+        )
+    stats = sync._sync(entity, position_values)
+
+    # Row 11 is not even read: it is below the watermark
+    assert (stats["updated"], stats["unchanged"]) == (1, 0)
+
+
+def test_stream_batches_bounded(siger: Engine):
+    batches = list(stream_batches(siger, select(source.funcionario.c.id), 2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [row.id for batch in batches for row in batch] == [100, 101, 102]
+
+
+def test_stream_batches_propagates_errors(siger: Engine):
+    with pytest.raises(OperationalError):
+        list(stream_batches(siger, text("SELECT * FROM missing_table"), 2))
+
+
+def test_orchestrated_run_completes(session: Session, siger: Engine):
+    run = SyncRunService(session).start()
+
+    run = execute_sync_run(run.id, siger, session.get_bind())
+
+    assert run.status == SyncRunStatus.COMPLETED
+    assert {name: step["status"] for name, step in run.steps.items()} == {
+        "positions": "COMPLETED",
+        "org_units": "COMPLETED",
+        "staff": "COMPLETED",
+    }
+    assert run.steps["staff"]["counts"]["inserted"] == 2
+    assert run.finished_at is not None
+
+
+def test_failed_run_resumes_from_checkpoint(
+    session: Session, siger: Engine, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "SYNC_CHUNK_SIZE", 1)
+    original = engine_module.staff_values
+    failures = []
+
+    def flaky_staff_values(row, *args):
+        if row.id == 101 and not failures:
+            failures.append(row.id)
+            raise RuntimeError("connection lost")
+        return original(row, *args)
+
+    monkeypatch.setattr(engine_module, "staff_values", flaky_staff_values)
+    service = SyncRunService(session)
+    run = execute_sync_run(service.start().id, siger, session.get_bind())
+
+    assert run.status == SyncRunStatus.FAILED
+    assert run.steps["positions"]["status"] == "COMPLETED"
+    assert run.steps["staff"]["status"] == "FAILED"
+    # Staff 100 was committed before the failure
+    assert run.steps["staff"]["checkpoint"]["after_id"] == 100
+    positions_finished = run.steps["positions"]["finished_at"]
+
+    session.expire_all()
+    run = execute_sync_run(service.resume(run.id).id, siger, session.get_bind())
+
+    assert run.status == SyncRunStatus.COMPLETED
+    assert run.attempts == 2
+    # Completed steps are not repeated; counts carry over the checkpoint
+    assert run.steps["positions"]["finished_at"] == positions_finished
+    assert run.steps["staff"]["counts"]["inserted"] == 2
+    assert run.steps["staff"]["counts"]["skipped"] == 1
+
+
+def test_sync_run_endpoint(
+    client: TestClient,
+    session: Session,
+    siger: Engine,
+    superuser_token_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(sync_routers, "get_source_engine", lambda: siger)
+
+    response = client.post(
+        "/api/core/sync/runs", json={}, headers=superuser_token_headers
+    )
+    assert response.status_code == 202
+    run_id = response.json()["id"]
+
+    # The background task has run by the time TestClient returns
+    response = client.get(
+        f"/api/core/sync/runs/{run_id}", headers=superuser_token_headers
+    )
+    assert response.json()["status"] == "COMPLETED"
+    assert response.json()["triggered_by"]
+
+    session.add(SyncRun(status=SyncRunStatus.RUNNING))
+    session.commit()
+    response = client.post(
+        "/api/core/sync/runs", json={}, headers=superuser_token_headers
+    )
+    assert response.status_code == 400
+
+
+def test_sync_audits_batches_not_rows(session: Session, siger: Engine):
+    SigerSyncEngine(siger, session).run()
+
+    logs = session.exec(select(AuditLog).where(AuditLog.entity_type == "Staff")).all()
+    assert [log.action for log in logs] == ["SYSTEM_JOB"]
+    assert logs[0].changes["counts"] == {"CREATE": 2, "UPDATE": 0}
+    assert logs[0].changes["ids"]["count"] == 2
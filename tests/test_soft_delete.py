@@ -0,0 +1,107 @@
+import contextvars
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.audit import set_audit_context
+from app.modules.assets.acts.models import Act, AssetActLink
+from app.modules.assets.acts.service import ActService
+from app.modules.assets.areas.models import Area
+from app.modules.assets.assets.models import FixedAsset
+from app.modules.assets.assets.repository import FixedAssetRepository
+from app.modules.assets.groups.models import AssetGroup
+from app.modules.assets.institutions.models import Institution
+from app.modules.assets.statuses.models import AssetStatus
+from app.modules.core.org_units.models import OrgUnit
+
+
+def make_assets(session: Session, count: int) -> list[FixedAsset]:
+    institution = Institution(id=uuid.uuid4(), name="Aduana Nacional")
+    area = Area(id=uuid.uuid4(), name="Almacén", institution_id=institution.id)
+    group = AssetGroup(id=uuid.uuid4(), name="PC")
+    status = AssetStatus(id=uuid.uuid4(), name="BUENO")
+    unit = OrgUnit(id=uuid.uuid4(), external_id=1, name="A", type="MANAGEMENT")
+    assets = [
+        FixedAsset(
+            id=uuid.uuid4(),
+            new_code=f"NEW-{i}",
+            description=f"Activo {i}",
+            group_id=group.id,
+            status_id=status.id,
+            area_id=area.id,
+            org_unit_id=unit.id,
+        )
+        for i in range(count)
+    ]
+    session.add_all([institution, area, group, status, unit, *assets])
+    session.commit()
+    return assets
+
+
+def test_delete_marks_the_row(
+    client: TestClient, session: Session, superuser_token_headers: dict
+):
+    kept, deleted = make_assets(session, 2)
+
+    response = client.delete(
+        f"/api/assets/assets/{deleted.id}", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/api/assets/assets/{deleted.id}", headers=superuser_token_headers
+    )
+    assert response.status_code == 404
+    response = client.get("/api/assets/assets/", headers=superuser_token_headers)
+    assert [asset["id"] for asset in response.json()] == [str(kept.id)]
+    response = client.get("/api/assets/assets/count", headers=superuser_token_headers)
+    assert response.json()["total"] == 1
+
+    # The row is still there, marked
+    session.expire_all()
+    row = session.exec(select(FixedAsset).where(FixedAsset.id == deleted.id)).one()
+    assert row.deleted_at is not None
+
+
+def test_delete_records_the_user(session: Session):
+    (asset,) = make_assets(session, 1)
+    user_id = uuid.uuid4()
+
+    def delete() -> bool:
+        set_audit_context(user_id=user_id, ip_address=None)
+        return FixedAssetRepository(session).delete(asset.id)
+
+    # Own context: the audit user does not leak into other tests
+    assert contextvars.copy_context().run(delete)
+    assert asset.deleted_by_id == user_id
+    assert FixedAssetRepository(session).delete(asset.id) is False
+
+
+def test_act_assets_skip_deleted_assets(session: Session):
+    assets = make_assets(session, 2)
+    act = Act(id=uuid.uuid4(), act_number="ACT-1")
+    session.add(act)
+    session.add_all(AssetActLink(act_id=act.id, asset_id=a.id) for a in assets)
+    session.commit()
+    FixedAssetRepository(session).delete(assets[0].id)
+    # Ids first: expunged instances cannot refresh their expired attributes
+    act_id, kept_id = act.id, assets[1].id
+    session.expunge_all()
+
+    detail = ActService(session).get_detail(act_id)
+
+    assert detail is not None
+    assert [asset.id for asset in detail.fixed_assets] == [kept_id]
+
+
+def test_live_queries_use_the_partial_index(session: Session):
+    make_assets(session, 3)
+
+    plan = session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN SELECT id FROM assets_fixed_asset "
+        "WHERE deleted_at IS NULL AND org_unit_id = ?",
+        (uuid.uuid4().hex,),
+    )
+
+    assert "ix_assets_fixed_asset_live_org_unit_id" in str(plan.all())